@@ -1,4 +1,7 @@
 import heapq
+from abc import ABC, abstractmethod
+from array import array
+from tile_grid import CORRIDOR_TILE, as_tile_grid
 
 class Vertex:
     """A class to represent a vertex for the A* algorithm."""
@@ -22,7 +25,46 @@ class Vertex:
     def __lt__(self, other):
         return self.f < other.f
 
-class AStar:
+class Pathfinder(ABC):
+    """A base class for pathfinders that search the path to each goal separately."""
+
+    # GenerationStats object that counts the work of the searches, None if not counted
+    stats = None
+
+    def record_search(self, expanded, pushes, path=None):
+        """A method that counts the expanded nodes and heap pushes of one search,
+            if the stats are collected.
+
+        Args:
+            expanded: Number of nodes expanded by the search.
+            pushes: Number of nodes pushed into the priority queue.
+            path: Path found by the search, or None if no path was found.
+
+        Returns:
+            The path, so that a search can record its counts as it returns.
+        """
+
+        if self.stats is not None:
+            self.stats.count("searches")
+            self.stats.count("expanded_nodes", expanded)
+            self.stats.count("heap_pushes", pushes)
+
+        return path
+
+    @abstractmethod
+    def find_path(self, start_pos, goal_pos, tiles):
+        """A method that finds the optimal path from the start tile to the goal tile."""
+
+    def find_paths(self, start_pos, goal_positions, tiles):
+        """A method that finds the optimal paths from the start tile to each goal tile.
+
+        Returns:
+            A list of the paths in the same order as the goal positions.
+        """
+
+        return [self.find_path(start_pos, goal_pos, tiles) for goal_pos in goal_positions]
+
+class AStar(Pathfinder):
     """A class that implements the A* algorithm to find the optimal path to the goal vertex."""
 
     def calculate_heuristic(self, v1, v2):
@@ -44,15 +86,21 @@ class AStar:
         return final_path[::-1]
 
     def get_neighbors(self, vertex, tiles):
-        """A method that gets all valid neighboring vertices of the given vertex."""
+        """A method that gets all valid neighboring vertices of the given vertex.
 
+        Args:
+            vertex: Vertex whose neighbors are returned.
+            tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+        """
+
+        grid = as_tile_grid(tiles)
         neighbors = []
 
         for move_x, move_y in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
             new_x = move_x + vertex.position[0]
             new_y = move_y + vertex.position[1]
 
-            if 0 <= new_x < len(tiles) and 0 <= new_y < len(tiles[0]):
+            if grid.in_bounds(new_x, new_y):
                 neighbors.append((new_x, new_y))
 
         return neighbors
@@ -66,11 +114,21 @@ class AStar:
             return 10
         if tile_type == 2:
             return 50
+        if tile_type == CORRIDOR_TILE:
+            return 0
 
         return float("inf")
 
     def find_path(self, start_pos, goal_pos, tiles):
-        """A method that finds the optimal path from the start vertex to the goal vertex."""
+        """A method that finds the optimal path from the start vertex to the goal vertex.
+
+        Args:
+            start_pos: Coordinates of the start tile.
+            goal_pos: Coordinates of the goal tile.
+            tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+        """
+
+        tiles = as_tile_grid(tiles)
 
         start_vertex = Vertex(
             start_pos,
@@ -79,30 +137,30 @@ class AStar:
             self.calculate_heuristic(start_pos, goal_pos)
         )
 
-        open_set = set()
         closed_set = set()
 
         open_queue = []
         best_g_score = {start_pos: 0}
 
         heapq.heappush(open_queue, start_vertex)
-        open_set.add(start_pos)
+        pushes = 1
 
         while open_queue:
             # Pop the vertex with the lowest total cost
             current_vertex = heapq.heappop(open_queue)
 
             if current_vertex.position == goal_pos:
-                return self.reconstruct_path(current_vertex)
+                return self.record_search(
+                    len(closed_set), pushes, self.reconstruct_path(current_vertex)
+                )
 
             closed_set.add(current_vertex.position)
-            open_set.discard(current_vertex.position)
 
             # Loop through the neighbors of the vertex
             for neighbor_pos in self.get_neighbors(current_vertex, tiles):
                 if neighbor_pos not in closed_set:
 
-                    tile_type = tiles[neighbor_pos[0]][neighbor_pos[1]]
+                    tile_type = tiles.get(neighbor_pos[0], neighbor_pos[1])
                     new_g_score = (
                         current_vertex.g
                         + self.calculate_heuristic(current_vertex.position, neighbor_pos)
@@ -122,6 +180,254 @@ class AStar:
                         )
 
                         heapq.heappush(open_queue, new_vertex)
-                        open_set.add(neighbor_pos)
+                        pushes += 1
+
+        return self.record_search(len(closed_set), pushes)
+
+class FastAStar(Pathfinder):
+    """A class that implements the A* algorithm on integer tile indices.
+
+    Each tile is stored as the index tile_y * width + tile_x, the costs and parents are
+        stored in arrays with one entry per tile, and the priority queue holds
+        (f, counter, tile index) tuples instead of Vertex objects. The paths have the same
+        cost as the paths found by the AStar class, but equally cheap paths may differ."""
+
+    # Cost of moving onto each tile type, including the cost of the move itself
+    STEP_COSTS = (2, 11, 51, 1) + (float("inf"),) * 252
+
+    # Every move onto a tile that is not a corridor costs at least this much, so the
+    # Manhattan distance multiplied by it never overestimates the remaining cost
+    # and the found paths stay optimal
+    HEURISTIC_WEIGHT = 2
+
+    # Weight used when the grid has corridor tiles, as a move onto them costs only one
+    CORRIDOR_HEURISTIC_WEIGHT = 1
+
+    def get_heuristic_weight(self, grid):
+        """A method that returns the largest heuristic weight that keeps the paths optimal
+            on the given TileGrid."""
+
+        if grid.contains(CORRIDOR_TILE):
+            return self.CORRIDOR_HEURISTIC_WEIGHT
+
+        return self.HEURISTIC_WEIGHT
 
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    def find_path(self, start_pos, goal_pos, tiles):
+        """A method that finds the optimal path from the start tile to the goal tile.
+
+        Args:
+            start_pos: Coordinates of the start tile.
+            goal_pos: Coordinates of the goal tile.
+            tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+
+        Returns:
+            A list of the tile coordinates on the path, or None if no path is found.
+        """
+
+        grid = as_tile_grid(tiles)
+
+        if not grid.in_bounds(*start_pos) or not grid.in_bounds(*goal_pos):
+            return None
+
+        width, height = grid.width, grid.height
+        cells = grid.cells
+        step_costs = self.STEP_COSTS
+        weight = self.get_heuristic_weight(grid)
+        goal_x, goal_y = goal_pos
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        start = grid.index(*start_pos)
+        goal = grid.index(*goal_pos)
+
+        g_scores = array("d", [float("inf")]) * (width * height)
+        parents = array("l", [-1]) * (width * height)
+        closed = bytearray(width * height)
+
+        g_scores[start] = 0
+        counter = 0
+        open_queue = [(0, counter, start)]
+
+        while open_queue:
+            current = heappop(open_queue)[2]
+
+            if current == goal:
+                # Counting the expanded tiles is left out when the stats are not collected
+                if self.stats is not None:
+                    self.record_search(closed.count(1), counter + 1)
+                return self.reconstruct_path(current, parents, width)
+
+            # Skip outdated entries of tiles that were already expanded
+            if closed[current]:
+                continue
+            closed[current] = 1
+
+            current_g = g_scores[current]
+            current_x, current_y = current % width, current // width
+
+            # Neighbors up, down, left and right, with their coordinates
+            neighbors = []
+            if current_y > 0:
+                neighbors.append((current - width, current_x, current_y - 1))
+            if current_y < height - 1:
+                neighbors.append((current + width, current_x, current_y + 1))
+            if current_x > 0:
+                neighbors.append((current - 1, current_x - 1, current_y))
+            if current_x < width - 1:
+                neighbors.append((current + 1, current_x + 1, current_y))
+
+            for neighbor, new_x, new_y in neighbors:
+                if closed[neighbor]:
+                    continue
+
+                new_g_score = current_g + step_costs[cells[neighbor]]
+
+                if new_g_score < g_scores[neighbor]:
+                    g_scores[neighbor] = new_g_score
+                    parents[neighbor] = current
+
+                    counter += 1
+                    h_score = weight * (abs(new_x - goal_x) + abs(new_y - goal_y))
+                    heappush(open_queue, (new_g_score + h_score, counter, neighbor))
+
+        if self.stats is not None:
+            self.record_search(closed.count(1), counter + 1)
         return None
+
+    def reconstruct_path(self, goal, parents, width):
+        """A method that reconstructs the path from the goal tile to the start tile
+            by following the parent indices."""
+
+        final_path = []
+        current = goal
+
+        while current != -1:
+            final_path.append((current % width, current // width))
+            current = parents[current]
+
+        return final_path[::-1]
+
+class MultiTargetAStar(FastAStar):
+    """A class that finds the paths from one start tile to several goal tiles in one search.
+
+    The heuristic is the distance to the closest goal that has not been reached yet.
+        When a goal is reached, the priority queue is rebuilt with the distances to the
+        remaining goals, and the search continues from the already expanded tiles
+        instead of starting again from the start tile."""
+
+    def find_path(self, start_pos, goal_pos, tiles):
+        """A method that finds the optimal path from the start tile to the goal tile."""
+
+        return self.find_paths(start_pos, [goal_pos], tiles)[0]
+
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    def find_paths(self, start_pos, goal_positions, tiles):
+        """A method that finds the optimal paths from the start tile to each goal tile.
+
+        Args:
+            start_pos: Coordinates of the start tile.
+            goal_positions: Coordinates of the goal tiles.
+            tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+
+        Returns:
+            A list of the paths in the same order as the goal positions,
+                with None for the goals that cannot be reached.
+        """
+
+        grid = as_tile_grid(tiles)
+
+        if not grid.in_bounds(*start_pos):
+            return [None] * len(goal_positions)
+
+        width, height = grid.width, grid.height
+        cells = grid.cells
+        step_costs = self.STEP_COSTS
+        weight = self.get_heuristic_weight(grid)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        remaining_goals = {
+            grid.index(*goal_pos): goal_pos
+            for goal_pos in goal_positions if grid.in_bounds(*goal_pos)
+        }
+        goal_coordinates = list(remaining_goals.values())
+
+        def get_heuristic(tile_x, tile_y):
+            closest = float("inf")
+            for goal_x, goal_y in goal_coordinates:
+                distance = abs(tile_x - goal_x) + abs(tile_y - goal_y)
+                if distance < closest: # pylint: disable=consider-using-min-builtin
+                    closest = distance
+
+            return weight * closest
+
+        start = grid.index(*start_pos)
+
+        g_scores = array("d", [float("inf")]) * (width * height)
+        parents = array("l", [-1]) * (width * height)
+        closed = bytearray(width * height)
+
+        g_scores[start] = 0
+        counter = 0
+        open_queue = [(0, counter, start)]
+
+        while open_queue and remaining_goals:
+            current = heappop(open_queue)[2]
+
+            # Skip outdated entries of tiles that were already expanded
+            if closed[current]:
+                continue
+            closed[current] = 1
+
+            if current in remaining_goals:
+                del remaining_goals[current]
+
+                if not remaining_goals:
+                    break
+
+                # Rebuild the priority queue with the distances to the remaining goals
+                goal_coordinates = list(remaining_goals.values())
+                open_queue = [
+                    (g_scores[tile] + get_heuristic(tile % width, tile // width), entry, tile)
+                    for _, entry, tile in open_queue if not closed[tile]
+                ]
+                heapq.heapify(open_queue)
+
+            current_g = g_scores[current]
+            current_x, current_y = current % width, current // width
+
+            # Neighbors up, down, left and right, with their coordinates
+            neighbors = []
+            if current_y > 0:
+                neighbors.append((current - width, current_x, current_y - 1))
+            if current_y < height - 1:
+                neighbors.append((current + width, current_x, current_y + 1))
+            if current_x > 0:
+                neighbors.append((current - 1, current_x - 1, current_y))
+            if current_x < width - 1:
+                neighbors.append((current + 1, current_x + 1, current_y))
+
+            for neighbor, new_x, new_y in neighbors:
+                if closed[neighbor]:
+                    continue
+
+                new_g_score = current_g + step_costs[cells[neighbor]]
+
+                if new_g_score < g_scores[neighbor]:
+                    g_scores[neighbor] = new_g_score
+                    parents[neighbor] = current
+
+                    counter += 1
+                    f_score = new_g_score + get_heuristic(new_x, new_y)
+                    heappush(open_queue, (f_score, counter, neighbor))
+
+        if self.stats is not None:
+            self.record_search(closed.count(1), counter + 1)
+
+        paths = []
+        for goal_pos in goal_positions:
+            if grid.in_bounds(*goal_pos) and closed[grid.index(*goal_pos)]:
+                paths.append(self.reconstruct_path(grid.index(*goal_pos), parents, width))
+            else:
+                paths.append(None)
+
+        return paths
@@ -0,0 +1,173 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dungeon import DungeonGenerator
+from dungeon_file import save_dungeon
+from config import DUNGEON_WIDTH, DUNGEON_HEIGHT, TILE_SIZE
+
+# Minimum number of empty tiles around each room
+ROOM_MARGIN = 3
+
+# Generator of a worker process, created when the worker starts
+_WORKER_STATE = {}
+
+def get_dungeon_path(output_dir, seed):
+    """A function that returns the path of the file of the dungeon with the given seed."""
+
+    return os.path.join(output_dir, f"dungeon_{seed}.dungeon")
+
+def _init_worker(generator_options):
+    """A function that creates the dungeon generator of a worker process."""
+
+    _WORKER_STATE["generator"] = DungeonGenerator(**generator_options)
+
+def _generate_and_save(task):
+    """A function that generates the dungeon of one seed and writes it to a dungeon file.
+
+    The dungeon is written by the worker that generated it, so only the file size
+        and the number of rooms are sent back to the main process.
+    """
+
+    seed, min_size, max_size, max_rooms, output_dir = task
+
+    dungeon = _WORKER_STATE["generator"].generate(min_size, max_size, max_rooms, seed=seed)
+    file_size = save_dungeon(dungeon, get_dungeon_path(output_dir, seed))
+
+    return len(dungeon.rooms), file_size
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def generate_batch(seeds, min_size, max_size, max_rooms, output_dir, generator_options=None,
+                   workers=1):
+    """A function that generates a dungeon for each seed and writes them to files.
+
+    Args:
+        seeds: Seeds of the dungeons.
+        min_size: Minimum room size in tile units.
+        max_size: Maximum room size in tile units.
+        max_rooms: Number of rooms to try to place.
+        output_dir: Directory the dungeon files are written to, created if it does not exist.
+        generator_options: Dictionary of keyword arguments of the DungeonGenerator.
+        workers: Number of worker processes, the dungeons are generated in this process
+            if it is one.
+
+    Returns:
+        A list of (number of rooms, file size in bytes) tuples in the same order as the seeds.
+    """
+
+    generator_options = generator_options or {}
+    os.makedirs(output_dir, exist_ok=True)
+
+    tasks = [(seed, min_size, max_size, max_rooms, output_dir) for seed in seeds]
+
+    if workers <= 1:
+        _init_worker(generator_options)
+        return [_generate_and_save(task) for task in tasks]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(generator_options,)
+    ) as executor:
+        chunk_size = max(1, len(tasks) // (workers * 4))
+        return list(executor.map(_generate_and_save, tasks, chunksize=chunk_size))
+
+def parse_arguments(arguments):
+    """A function that parses the command line arguments of the batch generator."""
+
+    parser = argparse.ArgumentParser(
+        description="Generate dungeons for a range of seeds and write them to files."
+    )
+    parser.add_argument("count", type=int, help="number of dungeons to generate")
+    parser.add_argument("--start-seed", type=int, default=0,
+                        help="seed of the first dungeon, the next dungeons use the next seeds")
+    parser.add_argument("--output", default="dungeons", help="directory of the dungeon files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes")
+
+    parser.add_argument("--min-size", type=int, default=3, help="minimum room size in tiles")
+    parser.add_argument("--max-size", type=int, default=10, help="maximum room size in tiles")
+    parser.add_argument("--max-rooms", type=int, default=15,
+                        help="number of rooms to try to place")
+    parser.add_argument("--grid-width", type=int, default=DUNGEON_WIDTH // TILE_SIZE,
+                        help="dungeon width in tiles")
+    parser.add_argument("--grid-height", type=int, default=DUNGEON_HEIGHT // TILE_SIZE,
+                        help="dungeon height in tiles")
+
+    parser.add_argument("--placement", default="random", help="room placement mode")
+    parser.add_argument("--triangulator", default="bowyer_watson", help="triangulator")
+    parser.add_argument("--mst-algorithm", default="prim", help="Minimum Spanning Tree algorithm")
+    parser.add_argument("--pathfinder", default="a_star", help="corridor pathfinder")
+    parser.add_argument("--extra-edge-chance", type=int, default=15,
+                        help="chance in percent of adding each extra edge")
+
+    options = parser.parse_args(arguments)
+    check_arguments(options, parser)
+
+    return options, parser
+
+def check_arguments(options, parser):
+    """A function that exits with an error message if the parsed arguments are invalid."""
+
+    if options.count < 1:
+        parser.error("the number of dungeons must be at least 1")
+
+    if options.start_seed < 0 or options.start_seed + options.count > 2**64:
+        parser.error("the seeds must satisfy 0 <= seed < 2**64 to be stored in dungeon files")
+
+    if not 1 <= options.min_size <= options.max_size:
+        parser.error("the room sizes must satisfy 1 <= min size <= max size")
+
+    # A room of the maximum size has to fit on the grid with the margin around it
+    min_grid_size = options.max_size + 2 * ROOM_MARGIN
+    if options.grid_width < min_grid_size or options.grid_height < min_grid_size:
+        parser.error(
+            f"the grid width and height must be at least max size + {2 * ROOM_MARGIN}"
+        )
+
+def main(arguments=None):
+    """A function that generates the dungeons from the command line and prints
+        the throughput."""
+
+    options, parser = parse_arguments(arguments)
+
+    generator_options = {
+        "grid_width": options.grid_width,
+        "grid_height": options.grid_height,
+        "margin": ROOM_MARGIN,
+        "placement": options.placement,
+        "triangulator": options.triangulator,
+        "mst_algorithm": options.mst_algorithm,
+        "pathfinder": options.pathfinder,
+        "extra_edge_chance": options.extra_edge_chance
+    }
+
+    # Check the options once here instead of failing in every worker
+    try:
+        DungeonGenerator(**generator_options)
+    except ValueError as error:
+        parser.error(str(error))
+
+    seeds = range(options.start_seed, options.start_seed + options.count)
+
+    start_time = time.perf_counter()
+    results = generate_batch(
+        seeds, options.min_size, options.max_size, options.max_rooms, options.output,
+        generator_options, options.workers
+    )
+    elapsed_time = time.perf_counter() - start_time
+
+    total_rooms = sum(room_count for room_count, _ in results)
+    total_bytes = sum(file_size for _, file_size in results)
+
+    print(
+        f"Generated {len(results)} dungeons with {total_rooms} rooms "
+        f"in {elapsed_time:.2f} s using {options.workers} workers"
+    )
+    print(
+        f"{len(results) / elapsed_time:.1f} dungeons/s, "
+        f"{total_bytes / 1024 / 1024:.1f} MiB written to {options.output}"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark comparing the pathfinders on the corridors of a 200-room dungeon.
+
+Run from the src directory with:
+
+    python -m benchmarks.a_star_benchmark
+
+Every pathfinder finds a path for every MST and extra edge of the same dungeon, with the
+paths that start from the same room searched together. The total cost of the paths is
+printed to check that all pathfinders find equally cheap paths, except for the
+hierarchical pathfinder, whose paths are only close to the cheapest. The number of extra
+edges is raised with the extra edge chance to give the rooms more corridors each, and
+the third table uses a larger grid with fewer rooms, where Jump Point Search can jump
+over the open space between the rooms.
+The reuse table carves the corridors with and without corridor reuse and counts the
+carved tiles. The last table times the fast A* with different numbers of worker processes.
+"""
+
+import time
+from a_star import FastAStar
+from corridors import PATHFINDERS, carve_corridors, find_corridor_paths
+from dungeon import DungeonGenerator
+from tile_grid import TileGrid
+
+STEP_COSTS = {0: 2, 1: 11, 2: 51}
+
+def get_path_cost(path, tiles):
+    """A function that returns the cost of a path."""
+
+    return sum(STEP_COSTS[tiles.get(tile_x, tile_y)] for tile_x, tile_y in path[1:])
+
+def time_pathfinder(pathfinder, dungeon):
+    """A function that finds the paths of every corridor of a dungeon.
+
+    Returns:
+        The total cost of the paths and the elapsed time in seconds.
+    """
+
+    edges = [dungeon.room_graph.edges[i] for i in dungeon.corridor_edges]
+
+    start_time = time.perf_counter()
+    paths = find_corridor_paths(edges, dungeon.tiles, pathfinder, dungeon.tile_size)
+    total_cost = sum(get_path_cost(path, dungeon.tiles) for path in paths)
+
+    return total_cost, time.perf_counter() - start_time
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def run_benchmark(grid_width=240, grid_height=160, max_rooms=200, extra_edge_chance=15, seed=0):
+    """A function that times every pathfinder on the same corridors and prints the results."""
+
+    generator = DungeonGenerator(
+        grid_width=grid_width, grid_height=grid_height, placement="free",
+        extra_edge_chance=extra_edge_chance
+    )
+    dungeon = generator.generate(3, 10, max_rooms, seed=seed)
+
+    print(
+        f"{len(dungeon.rooms)} rooms, {len(dungeon.corridor_edges)} corridors "
+        f"on a {grid_width}x{grid_height} grid"
+    )
+    print(f"{'pathfinder':>12} {'total cost':>11} {'seconds':>9} {'ms/path':>8}")
+
+    for name, pathfinder_class in PATHFINDERS.items():
+        total_cost, elapsed_time = time_pathfinder(pathfinder_class(), dungeon)
+
+        milliseconds = elapsed_time * 1000 / len(dungeon.corridor_edges)
+        print(f"{name:>12} {total_cost:>11} {elapsed_time:>9.3f} {milliseconds:>8.2f}")
+
+def run_reuse_benchmark(grid_width=240, grid_height=160, max_rooms=200, seed=0):
+    """A function that carves the same corridors with and without corridor reuse."""
+
+    generator = DungeonGenerator(
+        grid_width=grid_width, grid_height=grid_height, placement="free", extra_edge_chance=100
+    )
+    dungeon = generator.generate(3, 10, max_rooms, seed=seed)
+    edges = [dungeon.room_graph.edges[i] for i in dungeon.corridor_edges]
+
+    print(f"{'pathfinder':>12} {'reuse':>6} {'carved tiles':>13} {'seconds':>9}")
+
+    for name, pathfinder_class in PATHFINDERS.items():
+        for reuse in (False, True):
+            # Corridor reuse marks the carved tiles, so each run gets its own copy of the tiles
+            tiles = TileGrid(dungeon.tiles.width, dungeon.tiles.height)
+            tiles.cells[:] = dungeon.tiles.cells
+
+            start_time = time.perf_counter()
+            _, corridor_map = carve_corridors(
+                edges, tiles, pathfinder_class(), dungeon.tile_size, reuse=reuse
+            )
+            elapsed_time = time.perf_counter() - start_time
+
+            carved_tiles = sum(
+                1 for column in corridor_map for floor_variant in column
+                if floor_variant is not None
+            )
+            print(f"{name:>12} {str(reuse):>6} {carved_tiles:>13} {elapsed_time:>9.3f}")
+
+def run_parallel_benchmark(worker_counts=(1, 2, 4), grid_width=600, grid_height=400,
+                           max_rooms=1000, seed=0):
+    """A function that times the fast A* with different numbers of worker processes."""
+
+    generator = DungeonGenerator(grid_width=grid_width, grid_height=grid_height, placement="free")
+    dungeon = generator.generate(3, 10, max_rooms, seed=seed)
+    edges = [dungeon.room_graph.edges[i] for i in dungeon.corridor_edges]
+
+    print(
+        f"{len(dungeon.rooms)} rooms, {len(edges)} corridors "
+        f"on a {grid_width}x{grid_height} grid"
+    )
+    print(f"{'workers':>8} {'seconds':>9}")
+
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        find_corridor_paths(edges, dungeon.tiles, FastAStar(), dungeon.tile_size, workers)
+        elapsed_time = time.perf_counter() - start_time
+
+        print(f"{workers:>8} {elapsed_time:>9.3f}")
+
+if __name__ == "__main__":
+    run_benchmark()
+    run_benchmark(extra_edge_chance=100)
+    run_benchmark(grid_width=600, grid_height=400, max_rooms=60)
+    run_reuse_benchmark()
+    run_parallel_benchmark()
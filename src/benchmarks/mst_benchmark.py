@@ -0,0 +1,46 @@
+"""Benchmark comparing Prim's and Kruskal's algorithms on large triangulations.
+
+Run from the src directory with:
+
+    python -m benchmarks.mst_benchmark
+
+Prim's algorithm builds the neighbor sets and pushes both directions of each edge to a heap
+with lazy deletion, while Kruskal's algorithm sorts the unique edges once and joins the
+trees with a union-find. Both times include building the graph from the triangles.
+"""
+
+import math
+import random
+import sys
+import time
+from sweep_hull import SweepHull
+from mst import MST_ALGORITHMS
+
+SIZES = [1000, 10000, 100000]
+
+def run_benchmark(sizes, seed=0):
+    """A function that times both algorithms for each number of points and prints the results."""
+
+    print(f"{'algorithm':>9} {'points':>8} {'edges':>8} {'total weight':>14} {'seconds':>9}")
+
+    for size in sizes:
+        rng = random.Random(seed)
+        vertices = [(rng.uniform(0, 10000), rng.uniform(0, 10000)) for _ in range(size)]
+        triangles = SweepHull().triangulate(vertices)
+
+        for name, algorithm in MST_ALGORITHMS.items():
+            start_time = time.perf_counter()
+            mst = algorithm()
+            mst.get_vertices(triangles)
+            mst_edges = mst.create_mst(random.Random(seed))
+            elapsed_time = time.perf_counter() - start_time
+
+            total_weight = sum(math.dist(edge.v1, edge.v2) for edge in mst_edges)
+
+            print(
+                f"{name:>9} {size:>8} {len(mst_edges):>8} {total_weight:>14.1f} "
+                f"{elapsed_time:>9.3f}"
+            )
+
+if __name__ == "__main__":
+    run_benchmark([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,47 @@
+"""Benchmark comparing the random and free room placement modes on dense grids.
+
+Run from the src directory with:
+
+    python -m benchmarks.placement_benchmark
+
+The fill rate is the share of the grid tiles covered by the placed rooms.
+"""
+
+import random
+import time
+from rooms import PLACEMENT_MODES
+
+# Grid width, grid height and number of rooms to try to place
+SIZES = [
+    (45, 30, 50),
+    (100, 100, 1000),
+    (300, 300, 10000)
+]
+
+def run_benchmark(min_size=3, max_size=10, margin=3, seed=0):
+    """A function that times both placement modes for each size and prints the results."""
+
+    print(
+        f"{'mode':>6} {'grid':>9} {'max rooms':>10} {'placed':>8} "
+        f"{'fill rate':>10} {'seconds':>9}"
+    )
+
+    for grid_width, grid_height, max_rooms in SIZES:
+        for mode, place_rooms in PLACEMENT_MODES.items():
+            start_time = time.perf_counter()
+            rooms = place_rooms(
+                grid_width, grid_height, min_size, max_size, max_rooms, margin,
+                rng=random.Random(seed)
+            )
+            elapsed_time = time.perf_counter() - start_time
+
+            room_tiles = sum(room.tile_width * room.tile_height for room in rooms)
+            fill_rate = room_tiles / (grid_width * grid_height)
+
+            print(
+                f"{mode:>6} {grid_width:>4}x{grid_height:<4} {max_rooms:>10} {len(rooms):>8} "
+                f"{fill_rate:>10.1%} {elapsed_time:>9.3f}"
+            )
+
+if __name__ == "__main__":
+    run_benchmark()
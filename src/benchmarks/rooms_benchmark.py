@@ -0,0 +1,42 @@
+"""Benchmark for the room placement throughput on large grids.
+
+Run from the src directory with:
+
+    python -m benchmarks.rooms_benchmark
+
+The number of tries is capped at 50 per room, so on grids that fill up
+most of the time is spent on rejected placements.
+"""
+
+import random
+import time
+from rooms import generate_rooms
+
+# Grid width, grid height and number of rooms to try to place
+SIZES = [
+    (100, 100, 100),
+    (300, 300, 1000),
+    (1000, 1000, 10000),
+    (2000, 2000, 20000)
+]
+
+def run_benchmark(min_size=3, max_size=10, margin=3, seed=0):
+    """A function that times the room placement for each size and prints the results."""
+
+    print(f"{'grid':>11} {'max rooms':>10} {'placed':>8} {'seconds':>9} {'rooms/s':>10}")
+
+    for grid_width, grid_height, max_rooms in SIZES:
+        start_time = time.perf_counter()
+        rooms = generate_rooms(
+            grid_width, grid_height, min_size, max_size, max_rooms, margin,
+            rng=random.Random(seed)
+        )
+        elapsed_time = time.perf_counter() - start_time
+
+        print(
+            f"{grid_width:>5}x{grid_height:<5} {max_rooms:>10} {len(rooms):>8} "
+            f"{elapsed_time:>9.3f} {len(rooms) / elapsed_time:>10.0f}"
+        )
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,407 @@
+"""Benchmark suite timing every stage of the dungeon generation pipeline.
+
+Run from the src directory with:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json
+
+Each stage is timed on the results of the previous stages for every grid size, number
+of rooms and seed, and the best time of the repeated runs is reported with the
+throughput of the stage: placed rooms, triangles, MST edges, extra edges, mapped tiles,
+classified tiles or carved corridors per second. Each run of the corridor stage
+uses a new pathfinder, so the jump tables of Jump Point Search and the abstract graph
+of HPA* are built again and timed like in a new dungeon. The peak memory of each stage is
+measured with tracemalloc in a separate run, as tracing slows the stages down, and
+only for the first seed of each size, as tracing the corridor search takes about
+twenty times longer than the search itself.
+The results can be saved as a JSON baseline, and comparing with a baseline lists the
+stages whose time or peak memory has grown by more than the threshold, in which case
+the runner exits with status 1. A baseline can only be compared with results measured
+with the same generator options, which default to the options of the game.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import corridors
+import prim
+import room_graph
+import rooms
+import walls
+from dungeon import Dungeon, DungeonGenerator, get_stage_rng
+from tile_grid import TileGrid
+
+# Grid width, grid height and number of rooms to try to place
+SIZES = [
+    (45, 30, 12),
+    (100, 100, 100),
+    (200, 200, 400),
+    (300, 300, 1000)
+]
+
+SEEDS = [0, 1, 2]
+
+# Smallest change in seconds or KiB that is reported as a regression,
+# so the noise of very short stages is not
+MIN_SECONDS = 0.002
+MIN_KIB = 64
+
+BASELINE_VERSION = 1
+
+def place_rooms(state):
+    """A function that places the rooms of the dungeon."""
+
+    generator, dungeon = state["generator"], state["dungeon"]
+    dungeon.rooms = rooms.PLACEMENT_MODES[generator.placement](
+        grid_width=dungeon.grid_width,
+        grid_height=dungeon.grid_height,
+        min_size=3,
+        max_size=10,
+        max_rooms=state["max_rooms"],
+        margin=generator.margin,
+        rng=get_stage_rng(dungeon.seed, "rooms")
+    )
+    dungeon.room_centers = [room.get_center(dungeon.tile_size) for room in dungeon.rooms]
+
+    return len(dungeon.rooms)
+
+def triangulate(state):
+    """A function that triangulates the room centers and builds the room graph."""
+
+    dungeon = state["dungeon"]
+    dungeon.triangles = state["generator"].triangulator.triangulate(dungeon.room_centers)
+    dungeon.room_graph = room_graph.RoomGraph(dungeon.room_centers, dungeon.triangles)
+
+    return len(dungeon.triangles)
+
+def create_mst(state):
+    """A function that finds the Minimum Spanning Tree of the room graph."""
+
+    dungeon = state["dungeon"]
+    state["mst_edges"] = state["generator"].mst.create_graph_mst(
+        dungeon.room_graph, get_stage_rng(dungeon.seed, "mst")
+    )
+
+    return len(state["mst_edges"])
+
+def add_extra_edges(state):
+    """A function that adds the random extra edges to the Minimum Spanning Tree."""
+
+    dungeon = state["dungeon"]
+    state["extra_edges"] = prim.add_random_graph_edges(
+        state["generator"].extra_edge_chance,
+        state["mst_edges"],
+        dungeon.room_graph,
+        get_stage_rng(dungeon.seed, "extra_edges")
+    )
+    dungeon.corridor_edges = sorted(state["mst_edges"].union(state["extra_edges"]))
+
+    return len(state["extra_edges"])
+
+def map_tiles(state):
+    """A function that marks the room tiles of the dungeon."""
+
+    dungeon = state["dungeon"]
+    state["generator"].map_tiles(dungeon, get_stage_rng(dungeon.seed, "floors"))
+
+    return len(dungeon.tiles.cells)
+
+def classify_walls(state):
+    """A function that classifies the wall tiles on a copy of the mapped tiles,
+        so the stage can be repeated on the same tiles."""
+
+    dungeon = state["dungeon"]
+
+    if "room_tiles" not in state:
+        state["room_tiles"] = dungeon.tiles
+
+    dungeon.tiles = TileGrid(dungeon.grid_width, dungeon.grid_height)
+    dungeon.tiles.cells[:] = state["room_tiles"].cells
+    dungeon.wall_map = walls.map_wall_tiles(dungeon.tiles)
+
+    return len(dungeon.tiles.cells)
+
+def carve_corridors(state):
+    """A function that finds and carves the corridors between the rooms on a copy of
+        the classified tiles with a new pathfinder, so every repeated run searches the
+        same tiles and builds the precomputed tables of the pathfinder again."""
+
+    dungeon, generator = state["dungeon"], state["generator"]
+
+    if "wall_tiles" not in state:
+        state["wall_tiles"] = dungeon.tiles
+
+    dungeon.tiles = TileGrid(dungeon.grid_width, dungeon.grid_height)
+    dungeon.tiles.cells[:] = state["wall_tiles"].cells
+
+    dungeon.paths, dungeon.corridor_map = corridors.carve_corridors(
+        [dungeon.room_graph.edges[i] for i in dungeon.corridor_edges],
+        dungeon.tiles,
+        corridors.PATHFINDERS[generator.options["pathfinder"]](),
+        dungeon.tile_size
+    )
+
+    return len(dungeon.paths)
+
+STAGES = [
+    ("rooms", place_rooms),
+    ("triangulation", triangulate),
+    ("mst", create_mst),
+    ("extra_edges", add_extra_edges),
+    ("tiles", map_tiles),
+    ("walls", classify_walls),
+    ("corridors", carve_corridors)
+]
+
+def get_result_key(stage, grid_width, grid_height, max_rooms, seed):
+    """A function that returns the key of one stage of one benchmark case."""
+
+    return f"{stage} {grid_width}x{grid_height} {max_rooms} rooms seed {seed}"
+
+def measure_stage(stage, state, repeat, measure_memory):
+    """A function that runs a stage repeatedly and then once more with tracemalloc
+        if the memory is measured.
+
+    Returns:
+        The best time in seconds, the number of items the stage produced and
+            the peak memory allocated by the stage in KiB, or None if it was not measured.
+    """
+
+    best_time = float("inf")
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        items = stage(state)
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    if not measure_memory:
+        return best_time, items, None
+
+    tracemalloc.start()
+    stage(state)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best_time, items, peak_memory / 1024
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def run_case(grid_width, grid_height, max_rooms, seed, repeat, generator_options,
+             measure_memory=True):
+    """A function that measures every stage of the pipeline on one dungeon.
+
+    Returns:
+        A dictionary of the result of each stage by result key.
+    """
+
+    generator = DungeonGenerator(
+        grid_width=grid_width, grid_height=grid_height, **generator_options
+    )
+    state = {
+        "generator": generator,
+        "dungeon": Dungeon(grid_width, grid_height, generator.tile_size, seed),
+        "max_rooms": max_rooms
+    }
+    results = {}
+
+    for name, stage in STAGES:
+        seconds, items, peak_kib = measure_stage(stage, state, repeat, measure_memory)
+
+        results[get_result_key(name, grid_width, grid_height, max_rooms, seed)] = {
+            "stage": name,
+            "grid": [grid_width, grid_height],
+            "max_rooms": max_rooms,
+            "seed": seed,
+            "seconds": seconds,
+            "items": items,
+            "items_per_second": items / seconds if seconds > 0 else None,
+            "peak_kib": peak_kib
+        }
+
+    return results
+
+def run_suite(sizes, seeds, repeat=3, generator_options=None):
+    """A function that measures every stage for each size and seed and prints the results.
+
+    Returns:
+        A dictionary of the result of each stage of each case by result key.
+    """
+
+    generator_options = generator_options or {}
+    results = {}
+
+    print(
+        f"{'stage':>13} {'grid':>9} {'max rooms':>10} {'seed':>5} {'items':>8} "
+        f"{'seconds':>9} {'items/s':>11} {'peak KiB':>9}"
+    )
+
+    for grid_width, grid_height, max_rooms in sizes:
+        for seed in seeds:
+            case_results = run_case(
+                grid_width, grid_height, max_rooms, seed, repeat, generator_options,
+                measure_memory=seed == seeds[0]
+            )
+            results.update(case_results)
+
+            for result in case_results.values():
+                throughput = result["items_per_second"] or float("inf")
+                peak_kib = "-" if result["peak_kib"] is None else f"{result['peak_kib']:.0f}"
+                print(
+                    f"{result['stage']:>13} {grid_width:>4}x{grid_height:<4} "
+                    f"{max_rooms:>10} {seed:>5} {result['items']:>8} "
+                    f"{result['seconds']:>9.4f} {throughput:>11.0f} {peak_kib:>9}"
+                )
+
+    return results
+
+def save_baseline(path, results, repeat, generator_options):
+    """A function that saves the results as a JSON baseline."""
+
+    baseline = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "generator_options": generator_options,
+        "results": results
+    }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+def load_baseline(path):
+    """A function that loads a JSON baseline.
+
+    Returns:
+        A dictionary with the generator options and the results of the baseline.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {baseline.get('version')}")
+
+    return baseline
+
+def check_baseline_options(baseline, generator_options):
+    """A function that checks that the results are measured with the same generator
+        options as the baseline, as the times of different options are not comparable.
+
+    Raises:
+        ValueError: If the options differ.
+    """
+
+    baseline_options = baseline.get("generator_options") or {}
+
+    differences = [
+        f"{name} {baseline_options.get(name)} in the baseline, {generator_options.get(name)} now"
+        for name in sorted(set(baseline_options) | set(generator_options))
+        if baseline_options.get(name) != generator_options.get(name)
+    ]
+
+    if differences:
+        raise ValueError(
+            "The generator options differ from the baseline: " + ", ".join(differences)
+        )
+
+def compare_results(results, baseline, threshold):
+    """A function that finds the results that have grown by more than the threshold.
+
+    Only the results measured in both are compared, and the changes smaller than
+        MIN_SECONDS and MIN_KIB are ignored as noise.
+
+    Args:
+        results: Dictionary of the new results by result key.
+        baseline: Dictionary of the baseline results by result key.
+        threshold: Ratio of the new and baseline values above which a result regressed.
+
+    Returns:
+        A list of (result key, measure, baseline value, new value) tuples.
+    """
+
+    regressions = []
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        for measure, min_change in (("seconds", MIN_SECONDS), ("peak_kib", MIN_KIB)):
+            old_value, new_value = baseline[key][measure], result[measure]
+
+            if old_value is None or new_value is None:
+                continue
+
+            if new_value > old_value * threshold and new_value - old_value > min_change:
+                regressions.append((key, measure, old_value, new_value))
+
+    return regressions
+
+def parse_arguments(arguments):
+    """A function that parses the command line arguments of the runner."""
+
+    parser = argparse.ArgumentParser(description="Time every stage of the dungeon pipeline.")
+    parser.add_argument("--quick", action="store_true",
+                        help="only run the two smallest sizes with one seed")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs of each stage, the best is reported")
+    parser.add_argument("--save", metavar="PATH", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="ratio to the baseline above which a stage has regressed")
+    parser.add_argument("--placement", default="random", help="room placement mode")
+    parser.add_argument("--triangulator", default="bowyer_watson", help="triangulator")
+    parser.add_argument("--mst-algorithm", default="prim", help="Minimum Spanning Tree algorithm")
+    parser.add_argument("--pathfinder", default="a_star", help="corridor pathfinder")
+
+    return parser.parse_args(arguments), parser
+
+def main(arguments=None):
+    """A function that runs the suite from the command line.
+
+    Returns:
+        The exit status, 1 if a stage regressed compared to the baseline and 0 otherwise.
+    """
+
+    options, parser = parse_arguments(arguments)
+    generator_options = {
+        "placement": options.placement,
+        "triangulator": options.triangulator,
+        "mst_algorithm": options.mst_algorithm,
+        "pathfinder": options.pathfinder
+    }
+
+    try:
+        DungeonGenerator(**generator_options)
+
+        # Check the baseline before spending minutes on the measurements
+        baseline = load_baseline(options.compare) if options.compare else None
+        if baseline is not None:
+            check_baseline_options(baseline, generator_options)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    sizes, seeds = (SIZES[:2], SEEDS[:1]) if options.quick else (SIZES, SEEDS)
+    results = run_suite(sizes, seeds, options.repeat, generator_options)
+
+    if options.save:
+        save_baseline(options.save, results, options.repeat, generator_options)
+        print(f"Saved the baseline to {options.save}")
+
+    if baseline is not None:
+        regressions = compare_results(results, baseline["results"], options.threshold)
+
+        for key, measure, old_value, new_value in regressions:
+            print(f"Regression: {key} {measure} {old_value:.4f} -> {new_value:.4f}")
+
+        if regressions:
+            return 1
+
+        print(f"No regressions compared to {options.compare}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Benchmark comparing the triangulators and the backends of the Bowyer-Watson algorithm.
+
+Run from the src directory with:
+
+    python -m benchmarks.triangulation_benchmark
+
+Both backends walk to the triangle containing each new vertex and only test the
+triangles around it. The pure Python backend tests them one at a time, while the NumPy
+backend tests each ring of neighbors in one vectorized operation. The cavities only
+have a few triangles, so the NumPy call overhead is not paid back and the NumPy backend
+stays about 1.5 times slower. The sweep-hull triangulator adds the vertices in sorted
+order and only flips the edges around each new vertex.
+"""
+
+import random
+import sys
+import time
+import bowyer_watson
+from bowyer_watson import BowyerWatson
+from sweep_hull import SweepHull
+
+SIZES = [1000, 10000, 100000]
+
+def run_benchmark(sizes, seed=0):
+    """A function that times every triangulator for each number of points and prints the results."""
+
+    triangulators = [
+        ("python", lambda: BowyerWatson(use_numpy=False)),
+        ("sweep_hull", SweepHull)
+    ]
+    if bowyer_watson.np is not None:
+        triangulators.insert(1, ("numpy", lambda: BowyerWatson(use_numpy=True)))
+    else:
+        print("NumPy is not installed, the NumPy backend is not timed")
+
+    print(f"{'triangulator':>12} {'points':>8} {'triangles':>10} {'seconds':>9}")
+
+    for size in sizes:
+        rng = random.Random(seed)
+        vertices = [(rng.uniform(0, 10000), rng.uniform(0, 10000)) for _ in range(size)]
+
+        for name, create_triangulator in triangulators:
+            start_time = time.perf_counter()
+            triangles = create_triangulator().triangulate(vertices)
+            elapsed_time = time.perf_counter() - start_time
+
+            print(f"{name:>12} {size:>8} {len(triangles):>10} {elapsed_time:>9.3f}")
+
+if __name__ == "__main__":
+    run_benchmark([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,71 @@
+"""Benchmark comparing the wall tile classifiers on large dungeons.
+
+Run from the src directory with:
+
+    python -m benchmarks.walls_benchmark
+
+The single tile classifier reads the eight neighbors of every empty tile separately,
+the rolling row classifier packs the room flags of each row once and looks the wall
+types up from neighbor masks, and the NumPy classifier builds all masks at once.
+"""
+
+import random
+import time
+import walls
+from dungeon import Dungeon, DungeonGenerator
+from rooms import generate_rooms_free
+
+# Grid width, grid height and number of rooms to try to place
+SIZES = [
+    (100, 100, 100),
+    (500, 500, 2000),
+    (1000, 1000, 5000)
+]
+
+def classify_single_tiles(grid):
+    """A function that finds the wall type of every tile one tile at a time."""
+
+    wall_map = bytearray(len(grid.cells))
+
+    for tile_y in range(1, grid.height - 1):
+        for tile_x in range(1, grid.width - 1):
+            index = grid.index(tile_x, tile_y)
+            if grid.cells[index] == 0:
+                wall_map[index] = walls.get_wall_type_at(grid.cells, grid.width, index)
+
+    return wall_map
+
+def run_benchmark(seed=0):
+    """A function that times every classifier for each size and prints the results."""
+
+    classifiers = [
+        ("single", classify_single_tiles),
+        ("rolling", walls.classify_wall_tiles)
+    ]
+    if walls.np is not None:
+        classifiers.append(("numpy", walls.classify_wall_tiles_numpy))
+    else:
+        print("NumPy is not installed, the NumPy classifier is not timed")
+
+    print(f"{'classifier':>10} {'grid':>9} {'rooms':>6} {'seconds':>9}")
+
+    for grid_width, grid_height, max_rooms in SIZES:
+        dungeon = Dungeon(grid_width, grid_height, 16)
+        dungeon.rooms = generate_rooms_free(
+            grid_width, grid_height, 3, 10, max_rooms, 3, rng=random.Random(seed)
+        )
+        generator = DungeonGenerator(grid_width=grid_width, grid_height=grid_height)
+        generator.map_tiles(dungeon, random.Random(seed))
+
+        for name, classify in classifiers:
+            start_time = time.perf_counter()
+            classify(dungeon.tiles)
+            elapsed_time = time.perf_counter() - start_time
+
+            print(
+                f"{name:>10} {grid_width:>4}x{grid_height:<4} {len(dungeon.rooms):>6} "
+                f"{elapsed_time:>9.3f}"
+            )
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,24 +1,43 @@
+import random
 from typing import Tuple
 
+try:
+    import numpy as np # pylint: disable=import-error
+except ImportError:
+    np = None # pylint: disable=invalid-name
+
 class Edge:
     """A class to represent an undirected edge between two vertices."""
 
+    __slots__ = ("v1", "v2", "key")
+
     def __init__(self, v1: Tuple, v2: Tuple):
         """A constructor that initializes an edge."""
 
         self.v1 = (v1[0], v1[1])
         self.v2 = (v2[0], v2[1])
 
-    # Use set for undirected edges
+        # Store the vertices in sorted order to compare undirected edges
+        if self.v1 <= self.v2:
+            self.key = (self.v1, self.v2)
+        else:
+            self.key = (self.v2, self.v1)
+
     def __eq__(self, other):
-        return {self.v1, self.v2} == {other.v1, other.v2}
+        return self.key == other.key
 
     def __hash__(self):
-        return hash(frozenset([self.v1, self.v2]))
+        return hash(self.key)
+
+    # Order edges by their sorted vertices so that sets of edges can be sorted
+    def __lt__(self, other):
+        return self.key < other.key
 
 class Triangle:
     """A class to represent a triangle consisting of three vertices."""
 
+    __slots__ = ("v1", "v2", "v3", "circumcenter", "sq_circumradius", "_edges")
+
     def __init__(self, v1: Tuple, v2: Tuple, v3: Tuple):
         """A constructor that initializes the vertices and the circumcircle."""
 
@@ -26,16 +45,26 @@ class Triangle:
         self.v2 = (v2[0], v2[1])
         self.v3 = (v3[0], v3[1])
 
-        self.edges = [
-            Edge(self.v1, self.v2),
-            Edge(self.v2, self.v3),
-            Edge(self.v3, self.v1)
-        ]
+        # The edges are only created when they are needed
+        self._edges = None
 
         self.circumcenter = None
         self.sq_circumradius = None
         self.calculate_circumcircle()
 
+    @property
+    def edges(self):
+        """The three edges of the triangle."""
+
+        if self._edges is None:
+            self._edges = [
+                Edge(self.v1, self.v2),
+                Edge(self.v2, self.v3),
+                Edge(self.v3, self.v1)
+            ]
+
+        return self._edges
+
     def calculate_circumcircle(self):
         """A method that calculates the circumcenter and circumradius of the triangle."""
 
@@ -82,23 +111,274 @@ class Triangle:
         dy = self.circumcenter[1] - vertex[1]
         return dx**2 + dy**2 < self.sq_circumradius
 
+def orientation(v1, v2, v3):
+    """A function that returns a positive value if the vertices are in counterclockwise
+        order, a negative value if they are in clockwise order and zero if they are collinear."""
+
+    return (v2[0] - v1[0]) * (v3[1] - v1[1]) - (v2[1] - v1[1]) * (v3[0] - v1[0])
+
+def poly_add(a, b):
+    """A function that adds two polynomials given as lists of coefficients,
+        starting from the constant term."""
+
+    if len(a) < len(b):
+        a, b = b, a
+
+    return [c + (b[i] if i < len(b) else 0) for i, c in enumerate(a)]
+
+def poly_sub(a, b):
+    """A function that subtracts a polynomial from another."""
+
+    return poly_add(a, [-c for c in b])
+
+def poly_mul(a, b):
+    """A function that multiplies two polynomials."""
+
+    result = [0] * (len(a) + len(b) - 1)
+
+    for i, c1 in enumerate(a):
+        for j, c2 in enumerate(b):
+            result[i + j] += c1 * c2
+
+    return result
+
+def poly_sign(a):
+    """A function that returns the sign of a polynomial when its variable approaches
+        infinity, which is the sign of its highest nonzero coefficient."""
+
+    for c in reversed(a):
+        if c != 0:
+            return 1 if c > 0 else -1
+
+    return 0
+
+def symbolic_orientation(v1, v2, v3):
+    """A function that returns the orientation of three vertices whose coordinates
+        are polynomials, as a polynomial."""
+
+    return poly_sub(
+        poly_mul(poly_sub(v2[0], v1[0]), poly_sub(v3[1], v1[1])),
+        poly_mul(poly_sub(v2[1], v1[1]), poly_sub(v3[0], v1[0]))
+    )
+
+def symbolic_incircle(v1, v2, v3, vertex):
+    """A function that returns a polynomial that is positive when the vertex is inside
+        the circumcircle of three counterclockwise vertices, all with polynomial coordinates."""
+
+    dx = [poly_sub(v[0], vertex[0]) for v in (v1, v2, v3)]
+    dy = [poly_sub(v[1], vertex[1]) for v in (v1, v2, v3)]
+    lifts = [poly_add(poly_mul(x, x), poly_mul(y, y)) for x, y in zip(dx, dy)]
+
+    # Expand the determinant along the column of the lifted coordinates
+    result = [0]
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        minor = poly_sub(poly_mul(dx[j], dy[k]), poly_mul(dx[k], dy[j]))
+        result = poly_add(result, poly_mul(lifts[i], minor))
+
+    return result
+
+def hilbert_index(x, y, order=16):
+    """A function that returns the position of integer coordinates along a Hilbert curve
+        that covers a grid of 2^order x 2^order cells."""
+
+    index = 0
+    grid_size = 1 << order
+    size = grid_size // 2
+
+    while size > 0:
+        rx = 1 if x & size else 0
+        ry = 1 if y & size else 0
+        index += size * size * ((3 * rx) ^ ry)
+
+        # Rotate the quadrant so that the curve continues in the right direction,
+        # the lower bits of the coordinates are mirrored like the whole grid
+        if ry == 0:
+            if rx == 1:
+                x = grid_size - 1 - x
+                y = grid_size - 1 - y
+            x, y = y, x
+
+        size //= 2
+
+    return index
+
+def get_insertion_order(vertices, seed=0):
+    """A function that orders the vertices in a biased randomized insertion order.
+
+    The shuffled vertices are split into rounds that double in size, and each round is
+        sorted along a Hilbert curve. The random rounds keep the expected number of invalid
+        triangles constant, and the sorting keeps consecutive vertices close to each other,
+        so the walk to the next vertex is short.
+    """
+
+    order = list(vertices)
+    random.Random(seed).shuffle(order)
+
+    if not order:
+        return order
+
+    min_x = min(v[0] for v in order)
+    min_y = min(v[1] for v in order)
+    max_x = max(v[0] for v in order)
+    max_y = max(v[1] for v in order)
+
+    # Scale the coordinates to fit the grid of the Hilbert curve
+    scale = 65535 / max(max_x - min_x, max_y - min_y, 1)
+
+    def curve_position(v):
+        return hilbert_index(int((v[0] - min_x) * scale), int((v[1] - min_y) * scale))
+
+    rounds = []
+    end = len(order)
+
+    while end > 0:
+        start = end // 2 if end > 64 else 0
+        rounds.append(sorted(order[start:end], key=curve_position))
+        end = start
+
+    insertion_order = []
+    for vertex_round in reversed(rounds):
+        insertion_order.extend(vertex_round)
+
+    return insertion_order
+
+class CircumcircleArrays:
+    """A class that stores the circumcenters and squared circumradii of the triangles
+        in contiguous NumPy arrays, in the same order as the list of triangles."""
+
+    def __init__(self, capacity=64):
+        """A constructor that initializes empty arrays with the given capacity."""
+
+        self.centers_x = np.empty(capacity)
+        self.centers_y = np.empty(capacity)
+        self.sq_radii = np.empty(capacity)
+        self.size = 0
+
+    def append(self, triangle, infinite=False):
+        """A method that adds the circumcircle of a triangle to the end of the arrays.
+
+        Args:
+            triangle: Triangle whose circumcircle is added.
+            infinite: Whether the triangle has a super triangle vertex, in which case
+                its circumcircle is tested separately and never contains a vertex here.
+        """
+
+        if self.size == len(self.sq_radii):
+            self.centers_x = np.concatenate([self.centers_x, np.empty(self.size)])
+            self.centers_y = np.concatenate([self.centers_y, np.empty(self.size)])
+            self.sq_radii = np.concatenate([self.sq_radii, np.empty(self.size)])
+
+        if infinite or triangle.circumcenter is None:
+            # A negative radius never contains a vertex, like a degenerate triangle
+            self.centers_x[self.size] = 0
+            self.centers_y[self.size] = 0
+            self.sq_radii[self.size] = -1
+        else:
+            self.centers_x[self.size] = triangle.circumcenter[0]
+            self.centers_y[self.size] = triangle.circumcenter[1]
+            self.sq_radii[self.size] = triangle.sq_circumradius
+
+        self.size += 1
+
+    def remove(self, slot):
+        """A method that removes a circumcircle by moving the last circumcircle into its slot."""
+
+        self.size -= 1
+
+        self.centers_x[slot] = self.centers_x[self.size]
+        self.centers_y[slot] = self.centers_y[self.size]
+        self.sq_radii[slot] = self.sq_radii[self.size]
+
+    def contains(self, slots, vertex):
+        """A method that tests the circumcircles in the given slots against a vertex
+            in one vectorized operation.
+
+        Returns:
+            A NumPy array of booleans, true for the circumcircles that contain the vertex.
+        """
+
+        slots = np.fromiter(slots, dtype=np.intp, count=len(slots))
+        dx = self.centers_x[slots] - vertex[0]
+        dy = self.centers_y[slots] - vertex[1]
+
+        return dx * dx + dy * dy < self.sq_radii[slots]
+
+    def find_containing(self, vertex):
+        """A method that returns the slots of all circumcircles that contain the vertex,
+            testing every circumcircle in one vectorized operation."""
+
+        dx = self.centers_x[:self.size] - vertex[0]
+        dy = self.centers_y[:self.size] - vertex[1]
+
+        return np.flatnonzero(dx * dx + dy * dy < self.sq_radii[:self.size])
+
+# pylint: disable=too-many-instance-attributes
 class BowyerWatson:
-    """A class that implements the Bowyer-Watson algorithm for the Delaunay triangulation."""
+    """A class that implements the Bowyer-Watson algorithm for the Delaunay triangulation.
+
+    The triangulation keeps track of neighboring triangles with a dictionary of directed
+        edges, so the triangle containing a new vertex is found by walking towards it,
+        and the invalid triangles are found by visiting the neighbors of that triangle.
+
+    With the NumPy backend, the circumcircles are also stored in arrays, and the
+        neighbors of the invalid triangles found so far are tested against a new vertex
+        together in one vectorized operation, one ring of neighbors at a time.
 
-    def __init__(self):
-        """A constructor that initializes an empty list to store the triangulation triangles."""
+    The vertices of the super triangle are treated as points infinitely far away, so
+        the triangles that have them are tested with polynomials of that distance. A super
+        triangle of any finite size could otherwise cut off thin triangles on the convex hull."""
+
+    def __init__(self, use_numpy=False):
+        """A constructor that initializes an empty list to store the triangulation triangles.
+
+        Args:
+            use_numpy: Whether to use the NumPy backend, which falls back to
+                the pure Python backend if NumPy is not installed.
+        """
 
         self.triangles = []
 
+        self.use_numpy = use_numpy and np is not None
+        self.circumcircles = None
+
+        # Index of each triangle in the list of triangles
+        self.triangle_slots = {}
+        # Vertices of each triangle in counterclockwise order
+        self.ccw_vertices = {}
+        # Triangle on the left side of each directed edge
+        self.half_edges = {}
+
+        # Coordinates of each super triangle vertex as polynomials of its distance
+        self.super_vertices = {}
+        # Triangles that have a super triangle vertex
+        self.infinite_triangles = set()
+
+        self.last_triangle = None
+
+        # GenerationStats object that counts the invalid triangles, None if not counted
+        self.stats = None
+
     def triangulate(self, vertices):
         """A method that performs the Delaunay triangulation for the given vertices."""
 
         # Create the super triangle
         super_triangle = self.create_super_triangle(vertices)
-        self.triangles = [super_triangle]
 
-        # Iterate over given vertices one at a time
-        for vertex in vertices:
+        self.triangles = []
+        self.triangle_slots = {}
+        self.ccw_vertices = {}
+        self.half_edges = {}
+        self.infinite_triangles = set()
+
+        if self.use_numpy:
+            self.circumcircles = CircumcircleArrays()
+
+        self.add_triangle(super_triangle)
+
+        # Iterate over given vertices one at a time in a randomized order
+        # The order is seeded so that the same vertices give the same triangulation
+        for vertex in get_insertion_order(vertices):
             self.add_vertex(vertex)
 
         # Final step of the triangulation procedure
@@ -112,10 +392,155 @@ class BowyerWatson:
         """A method that adds a new vertex into the triangulation."""
 
         invalid_triangles = self.find_invalid_triangles(vertex)
-        polygon_edges = self.find_polygonal_hole_edges(invalid_triangles)
+        boundary = self.find_hole_boundary(invalid_triangles)
+
+        if self.stats is not None:
+            self.stats.count("invalid_triangles", len(invalid_triangles))
+            self.stats.record_max("max_cavity_size", len(invalid_triangles))
 
         self.remove_invalid_triangles(invalid_triangles)
-        self.create_new_triangle(vertex, polygon_edges)
+
+        # Fill the polygonal hole without creating Edge objects for its boundary
+        for start, end in boundary:
+            self.add_triangle(Triangle(vertex, start, end))
+
+    def add_triangle(self, triangle):
+        """A method that adds a triangle to the triangulation and links it to its neighbors."""
+
+        v1, v2, v3 = triangle.v1, triangle.v2, triangle.v3
+
+        infinite = (v1 in self.super_vertices or v2 in self.super_vertices or
+                    v3 in self.super_vertices)
+        if infinite:
+            self.infinite_triangles.add(triangle)
+
+        self.triangle_slots[triangle] = len(self.triangles)
+        self.triangles.append(triangle)
+
+        if self.circumcircles is not None:
+            self.circumcircles.append(triangle, infinite)
+
+        if self.get_orientation(v1, v2, v3) < 0:
+            v2, v3 = v3, v2
+
+        self.ccw_vertices[triangle] = (v1, v2, v3)
+        self.half_edges[(v1, v2)] = triangle
+        self.half_edges[(v2, v3)] = triangle
+        self.half_edges[(v3, v1)] = triangle
+
+        self.last_triangle = triangle
+
+    def remove_triangle(self, triangle):
+        """A method that removes a triangle from the triangulation in constant time."""
+
+        # Move the last triangle into the slot of the removed triangle
+        slot = self.triangle_slots.pop(triangle)
+        last_triangle = self.triangles.pop()
+
+        if last_triangle is not triangle:
+            self.triangles[slot] = last_triangle
+            self.triangle_slots[last_triangle] = slot
+
+        if self.circumcircles is not None:
+            self.circumcircles.remove(slot)
+
+        self.unlink_triangle(triangle)
+
+    def unlink_triangle(self, triangle):
+        """A method that removes the links between a triangle and its neighbors."""
+
+        v1, v2, v3 = self.ccw_vertices.pop(triangle)
+        self.infinite_triangles.discard(triangle)
+
+        for edge in ((v1, v2), (v2, v3), (v3, v1)):
+            if self.half_edges.get(edge) is triangle:
+                del self.half_edges[edge]
+
+    def get_symbolic_vertex(self, vertex):
+        """A method that returns the coordinates of a vertex as polynomials of the distance
+            of the super triangle vertices."""
+
+        if vertex in self.super_vertices:
+            return self.super_vertices[vertex]
+
+        return ([vertex[0]], [vertex[1]])
+
+    def get_orientation(self, v1, v2, v3):
+        """A method that returns a positive value if the vertices are in counterclockwise
+            order, a negative value if they are in clockwise order and zero if they are
+            collinear, treating the super triangle vertices as infinitely far away."""
+
+        if (v1 not in self.super_vertices and v2 not in self.super_vertices and
+                v3 not in self.super_vertices):
+            return orientation(v1, v2, v3)
+
+        return poly_sign(symbolic_orientation(
+            self.get_symbolic_vertex(v1),
+            self.get_symbolic_vertex(v2),
+            self.get_symbolic_vertex(v3)
+        ))
+
+    def in_circumcircle(self, triangle, vertex):
+        """A method that checks if a vertex is inside the circumcircle of a triangle,
+            treating the super triangle vertices as infinitely far away."""
+
+        if triangle not in self.infinite_triangles:
+            return triangle.vertex_in_circumcircle(vertex)
+
+        v1, v2, v3 = self.ccw_vertices[triangle]
+
+        return poly_sign(symbolic_incircle(
+            self.get_symbolic_vertex(v1),
+            self.get_symbolic_vertex(v2),
+            self.get_symbolic_vertex(v3),
+            self.get_symbolic_vertex(vertex)
+        )) > 0
+
+    def get_neighbors(self, triangle):
+        """A method that returns the neighbors of a triangle across each of its edges,
+            with None for edges that are not shared with another triangle."""
+
+        v1, v2, v3 = self.ccw_vertices[triangle]
+
+        return [
+            self.half_edges.get((v2, v1)),
+            self.half_edges.get((v3, v2)),
+            self.half_edges.get((v1, v3))
+        ]
+
+    def locate_triangle(self, vertex):
+        """A method that walks from the most recently added triangle towards the given vertex
+            and returns the triangle that contains it.
+
+        Returns:
+            The triangle containing the vertex, or None if the walk leaves the triangulation.
+        """
+
+        triangle = self.last_triangle
+        if triangle not in self.ccw_vertices:
+            if not self.triangles:
+                return None
+            triangle = self.triangles[0]
+
+        # Cap the number of steps in case the walk gets stuck in a cycle
+        for _ in range(len(self.triangles)):
+            v1, v2, v3 = self.ccw_vertices[triangle]
+            orient = self.get_orientation if triangle in self.infinite_triangles else orientation
+
+            # Step over the first edge that has the vertex on its outer side
+            if orient(v1, v2, vertex) < 0:
+                triangle = self.half_edges.get((v2, v1))
+            elif orient(v2, v3, vertex) < 0:
+                triangle = self.half_edges.get((v3, v2))
+            elif orient(v3, v1, vertex) < 0:
+                triangle = self.half_edges.get((v1, v3))
+            else:
+                return triangle
+
+            if triangle is None:
+                return None
+
+        return None
 
     def create_super_triangle(self, vertices):
         """A method that creates a triangle containing all given vertices."""
@@ -132,7 +557,8 @@ class BowyerWatson:
 
         # Find the maximum difference between x or y coordinates
         # to determine how large the super triangle has to be to contain all vertices
-        d_max = max(max_x - min_x, max_y - min_y)
+        # The difference is at least one so that the super triangle vertices are distinct
+        d_max = max(max_x - min_x, max_y - min_y, 1)
 
         # Center the super triangle around the min and max coordinates
         mid_x = (min_x + max_x) / 2
@@ -143,64 +569,113 @@ class BowyerWatson:
         v1 = (mid_x, mid_y - 20 * d_max)
         v2 = (mid_x - 20 * d_max, mid_y + 20 * d_max)
         v3 = (mid_x + 20 * d_max, mid_y + 20 * d_max)
+
+        # The same vertices moved infinitely far away in the same directions
+        self.super_vertices = {
+            v1: ([mid_x], [mid_y, -1]),
+            v2: ([mid_x, -1], [mid_y, 1]),
+            v3: ([mid_x, 1], [mid_y, 1])
+        }
+
         return Triangle(v1, v2, v3)
 
     def find_invalid_triangles(self, vertex):
-        """A method that finds triangles with circumcircles that contain the given vertex."""
+        """A method that finds triangles with circumcircles that contain the given vertex.
 
-        invalid_triangles = set()
+        The invalid triangles form a connected area around the triangle containing the vertex,
+            so only the neighbors of already found invalid triangles have to be checked."""
 
-        for t in self.triangles:
-            if t.vertex_in_circumcircle(vertex):
-                invalid_triangles.add(t)
+        start_triangle = self.locate_triangle(vertex)
+
+        if start_triangle is None or not self.in_circumcircle(start_triangle, vertex):
+            # Fall back to checking every triangle if the vertex is outside the triangulation
+            if self.circumcircles is not None:
+                slots = self.circumcircles.find_containing(vertex)
+                invalid_triangles = {self.triangles[slot] for slot in slots}
+                invalid_triangles.update(
+                    t for t in self.infinite_triangles if self.in_circumcircle(t, vertex)
+                )
+                return invalid_triangles
+
+            invalid_triangles = set()
+
+            for t in self.triangles:
+                if self.in_circumcircle(t, vertex):
+                    invalid_triangles.add(t)
+
+            return invalid_triangles
+
+        if self.circumcircles is not None:
+            return self.find_invalid_triangles_vectorized(vertex, start_triangle)
+
+        invalid_triangles = {start_triangle}
+        stack = [start_triangle]
+
+        while stack:
+            for neighbor in self.get_neighbors(stack.pop()):
+                if neighbor is not None and neighbor not in invalid_triangles:
+                    if self.in_circumcircle(neighbor, vertex):
+                        invalid_triangles.add(neighbor)
+                        stack.append(neighbor)
 
         return invalid_triangles
 
-    def find_polygonal_hole_edges(self, invalid_triangles):
-        """A method that finds all edges in the set of invalid triangles that
-            are not shared between two invalid triangles.
+    def find_invalid_triangles_vectorized(self, vertex, start_triangle):
+        """A method that finds the invalid triangles around the triangle containing
+            the vertex with the NumPy backend.
 
-        This basically means the edges at the boundaries of the polygonal hole,
-            which is formed by removing invalid triangles."""
+        The neighbors of the invalid triangles found in the previous ring are the
+            candidates of the next ring, and each ring is tested in one operation."""
 
-        edge_counts = {}
+        invalid_triangles = {start_triangle}
+        tested = {start_triangle}
+        ring = [start_triangle]
 
-        for t in invalid_triangles:
-            for edge in t.edges:
-                if edge not in edge_counts:
-                    edge_counts[edge] = 1
-                else:
-                    edge_counts[edge] += 1
+        while ring:
+            candidates = []
+            for triangle in ring:
+                for neighbor in self.get_neighbors(triangle):
+                    if neighbor is not None and neighbor not in tested:
+                        tested.add(neighbor)
+                        candidates.append(neighbor)
 
-        # Find the edges that are not shared between multiple triangles
-        polygonal_hole_edges = set()
+            if not candidates:
+                break
 
-        for edge, count in edge_counts.items():
-            if count == 1:
-                polygonal_hole_edges.add(edge)
+            inside = self.circumcircles.contains(
+                [self.triangle_slots[t] for t in candidates], vertex
+            )
+            ring = [t for t, is_inside in zip(candidates, inside) if is_inside]
 
-        return polygonal_hole_edges
+            # The arrays never contain a vertex for the triangles with a super triangle vertex
+            ring.extend(
+                t for t in candidates
+                if t in self.infinite_triangles and self.in_circumcircle(t, vertex)
+            )
+            invalid_triangles.update(ring)
 
-    def remove_invalid_triangles(self, invalid_triangles):
-        """A method that removes invalid triangles from the triangulation."""
+        return invalid_triangles
 
-        valid_triangles = []
+    def find_hole_boundary(self, invalid_triangles):
+        """A method that returns the edges of the polygonal hole as pairs of vertices."""
 
-        for t in self.triangles:
-            if t not in invalid_triangles:
-                valid_triangles.append(t)
+        boundary = []
 
-        self.triangles = valid_triangles
+        for t in invalid_triangles:
+            v1, v2, v3 = self.ccw_vertices[t]
+
+            # Find the edges whose neighbor is not an invalid triangle
+            for start, end in ((v1, v2), (v2, v3), (v3, v1)):
+                if self.half_edges.get((end, start)) not in invalid_triangles:
+                    boundary.append((start, end))
 
-    def create_new_triangle(self, vertex, polygonal_hole_edges):
-        """A method that forms new triangles by connecting the given vertex with the
-            unshared edges of the polygonal hole and adds these triangles to the triangulation.
+        return boundary
 
-        This basically means filling the polygonal hole with new triangles."""
+    def remove_invalid_triangles(self, invalid_triangles):
+        """A method that removes invalid triangles from the triangulation."""
 
-        # Connect vertex to the two endpoints of one polygonal edge
-        for edge in polygonal_hole_edges:
-            self.triangles.append(Triangle(vertex, edge.v1, edge.v2))
+        for t in invalid_triangles:
+            self.remove_triangle(t)
 
     def remove_super_triangle(self, super_triangle):
         """A method that removes triangles that share a vertex with the initial super triangle."""
@@ -216,5 +691,14 @@ class BowyerWatson:
                 st2 not in (t.v1, t.v2, t.v3) and
                 st3 not in (t.v1, t.v2, t.v3)):
                 valid_triangles.append(t)
+            elif t in self.ccw_vertices:
+                self.unlink_triangle(t)
 
         self.triangles = valid_triangles
+        self.infinite_triangles = set()
+        self.triangle_slots = {t: slot for slot, t in enumerate(valid_triangles)}
+
+        if self.circumcircles is not None:
+            self.circumcircles = CircumcircleArrays(max(len(valid_triangles), 1))
+            for t in valid_triangles:
+                self.circumcircles.append(t)
@@ -5,6 +5,6 @@ DUNGEON_WIDTH = 720
 DUNGEON_HEIGHT = 480
 
 POPUP_WIDTH = 460
-POPUP_HEIGHT = 320
+POPUP_HEIGHT = 370
 
 TILE_SIZE = 16
@@ -0,0 +1,182 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from a_star import AStar, FastAStar, MultiTargetAStar
+from hpa_star import HierarchicalAStar
+from jump_point_search import JumpPointSearch
+from tile_grid import CORRIDOR_TILE, TileGrid
+
+# Pathfinders that can be selected by name, each one has find_path and find_paths methods
+# that return the paths between tiles as lists of tile coordinates
+PATHFINDERS = {
+    "a_star": AStar,
+    "fast_a_star": FastAStar,
+    "multi_target": MultiTargetAStar,
+    "jump_point": JumpPointSearch,
+    "hpa_star": HierarchicalAStar
+}
+
+# Tile grid and pathfinder of a worker process, set when the worker starts
+_WORKER_STATE = {}
+
+def _init_worker(memory_name, width, height, pathfinder):
+    """A function that attaches a worker process to the tile grid in shared memory."""
+
+    memory = shared_memory.SharedMemory(name=memory_name)
+
+    _WORKER_STATE["memory"] = memory
+    _WORKER_STATE["tiles"] = TileGrid.from_buffer(width, height, memory.buf)
+    _WORKER_STATE["pathfinder"] = pathfinder
+
+def _find_group_paths(group):
+    """A function that finds the paths from one start tile in a worker process."""
+
+    start_pos, goal_positions = group
+
+    return _WORKER_STATE["pathfinder"].find_paths(
+        start_pos, goal_positions, _WORKER_STATE["tiles"]
+    )
+
+def find_paths_in_parallel(groups, tiles, pathfinder, workers):
+    """A function that finds the paths of groups of goals in a pool of worker processes.
+
+    The tiles are copied once to shared memory, which the workers read without copying.
+
+    Args:
+        groups: List of (start tile, list of goal tiles) tuples.
+        tiles: TileGrid object.
+        pathfinder: Pathfinder object that is sent to each worker.
+        workers: Number of worker processes.
+
+    Returns:
+        A list of the paths of each group, in the same order as the groups.
+    """
+
+    memory = shared_memory.SharedMemory(create=True, size=max(len(tiles.cells), 1))
+
+    try:
+        memory.buf[:len(tiles.cells)] = tiles.cells
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(memory.name, tiles.width, tiles.height, pathfinder)
+        ) as executor:
+            # The results are returned in the order of the groups,
+            # whichever worker finishes first
+            chunk_size = max(1, len(groups) // (workers * 4))
+            return list(executor.map(_find_group_paths, groups, chunksize=chunk_size))
+    finally:
+        memory.close()
+        memory.unlink()
+
+def mark_corridor_tiles(paths, tiles):
+    """A function that marks the non-room tiles on the given paths as corridor tiles.
+
+    Args:
+        paths: Lists of tile coordinates, None for the paths that were not found.
+        tiles: TileGrid object.
+    """
+
+    for path in paths:
+        for tile_x, tile_y in path or ():
+            if tiles.get(tile_x, tile_y) != 1:
+                tiles.set(tile_x, tile_y, CORRIDOR_TILE)
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def find_corridor_paths(edges, tiles, pathfinder, tile_size, workers=1, reuse=False):
+    """A function that finds the paths of the given edges, searching the paths
+        that start from the same tile together.
+
+    Args:
+        edges: Edges between the room centers in pixel coordinates.
+        tiles: TileGrid object.
+        pathfinder: Pathfinder object used to find the paths.
+        tile_size: Size of a tile in pixels.
+        workers: Number of worker processes, the paths are found in this process if it is one.
+        reuse: Whether to mark the tiles of each found path as corridor tiles before
+            the next search, so that the later paths follow the earlier corridors.
+            The paths are then always found one group after another in this process.
+
+    Returns:
+        A list of the found paths in the same order as the edges.
+    """
+
+    # Group the goal tiles of the edges by their start tile
+    goals = {}
+    for i, edge in enumerate(edges):
+        start_pos = (edge.v1[0] // tile_size, edge.v1[1] // tile_size)
+        goal_pos = (edge.v2[0] // tile_size, edge.v2[1] // tile_size)
+        goals.setdefault(start_pos, []).append((i, goal_pos))
+
+    groups = [
+        (start_pos, [goal_pos for _, goal_pos in edge_goals])
+        for start_pos, edge_goals in goals.items()
+    ]
+
+    if reuse:
+        group_paths = []
+        for start_pos, goal_positions in groups:
+            goal_paths = pathfinder.find_paths(start_pos, goal_positions, tiles)
+            mark_corridor_tiles(goal_paths, tiles)
+            group_paths.append(goal_paths)
+    elif workers > 1 and len(groups) > 1:
+        group_paths = find_paths_in_parallel(groups, tiles, pathfinder, workers)
+    else:
+        group_paths = [
+            pathfinder.find_paths(start_pos, goal_positions, tiles)
+            for start_pos, goal_positions in groups
+        ]
+
+    paths = [None] * len(edges)
+
+    for edge_goals, goal_paths in zip(goals.values(), group_paths):
+        for (i, _), path in zip(edge_goals, goal_paths):
+            paths[i] = path
+
+    return paths
+
+# pylint: disable=too-many-locals,too-many-nested-blocks
+def carve_corridors(edges, tiles, pathfinder, tile_size, workers=1, reuse=False):
+    """A function that finds the paths between the rooms connected by the given edges.
+
+    Args:
+        edges: Edges between the room centers in pixel coordinates.
+        tiles: TileGrid object with non-room tiles as zeros, room tiles as ones
+            and wall tiles as twos.
+        pathfinder: Pathfinder object used to find the paths.
+        tile_size: Size of a tile in pixels.
+        workers: Number of worker processes used to find the paths.
+        reuse: Whether the later corridors should follow the earlier ones, in which case
+            the carved tiles are marked as corridor tiles in the tiles.
+
+    Returns:
+        A list of the found paths and a corridor map with the floor tile variant
+            of each carved tile.
+    """
+
+    corridor_map = [[None for col in range(tiles.height)] for row in range(tiles.width)]
+    paths = find_corridor_paths(edges, tiles, pathfinder, tile_size, workers, reuse)
+
+    for path in paths:
+        # Skip the edges whose rooms could not be connected
+        if path is None:
+            continue
+
+        for tile_x, tile_y in path:
+            if tiles.get(tile_x, tile_y) in (0, 2, CORRIDOR_TILE):
+                floor_variant = (tile_x + tile_y) % 2
+                corridor_map[tile_x][tile_y] = floor_variant
+
+                neighbor_tiles = [
+                    (tile_x, tile_y - 1),
+                    (tile_x, tile_y + 1),
+                    (tile_x - 1, tile_y),
+                    (tile_x + 1, tile_y)
+                ]
+
+                # Open the room tiles next to the corridor with the same floor tile
+                for new_x, new_y in neighbor_tiles:
+                    if tiles.in_bounds(new_x, new_y) and tiles.get(new_x, new_y) == 1:
+                        corridor_map[new_x][new_y] = floor_variant
+
+    return paths, corridor_map
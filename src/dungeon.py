@@ -0,0 +1,266 @@
+import random
+import rooms
+import triangulation
+import prim
+import mst
+import room_graph
+import walls
+import corridors
+from generation_stats import GenerationStats, time_stage
+from tile_grid import TileGrid
+from config import DUNGEON_WIDTH, DUNGEON_HEIGHT, TILE_SIZE
+
+def get_stage_rng(seed, stage):
+    """A function that returns an independent random number generator
+        for one stage of the pipeline."""
+
+    return random.Random(f"{seed}-{stage}")
+
+# pylint: disable=too-many-instance-attributes
+class Dungeon:
+    """A class to represent a generated dungeon as plain data."""
+
+    def __init__(self, grid_width, grid_height, tile_size, seed=None):
+        """A constructor that initializes an empty dungeon.
+
+        Args:
+            grid_width: Dungeon width in tile units.
+            grid_height: Dungeon height in tile units.
+            tile_size: Size of a tile in pixels.
+            seed: Seed the dungeon was generated with.
+        """
+
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.tile_size = tile_size
+        self.seed = seed
+
+        self.rooms = []
+        self.room_centers = []
+        self.triangles = []
+        self.room_graph = None
+        self.mst_edges = set()
+        self.extra_edges = set()
+        self.corridor_edges = []
+
+        self.tiles = TileGrid(grid_width, grid_height)
+        self.floor_map = []
+        self.wall_map = TileGrid(grid_width, grid_height)
+        self.paths = []
+        self.corridor_map = []
+
+        # Stage times and counters of the generation, None if they were not collected
+        self.stats = None
+
+def check_options(options, workers):
+    """A function that checks the algorithms and the corridor options of a generator.
+
+    Raises:
+        ValueError: If an algorithm is unknown or the options cannot be combined.
+    """
+
+    if options["placement"] not in rooms.PLACEMENT_MODES:
+        raise ValueError(f"Unknown room placement mode: {options['placement']}")
+
+    if options["triangulator"] not in triangulation.TRIANGULATORS:
+        raise ValueError(f"Unknown triangulator: {options['triangulator']}")
+
+    if options["mst_algorithm"] not in mst.MST_ALGORITHMS:
+        raise ValueError(
+            f"Unknown Minimum Spanning Tree algorithm: {options['mst_algorithm']}"
+        )
+
+    if options["pathfinder"] not in corridors.PATHFINDERS:
+        raise ValueError(f"Unknown pathfinder: {options['pathfinder']}")
+
+    if options["corridor_reuse"] and workers > 1:
+        raise ValueError("Corridor reuse cannot be combined with multiple workers")
+
+class DungeonGenerator:
+    """A class that runs the dungeon generation pipeline without a display."""
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, grid_width=DUNGEON_WIDTH // TILE_SIZE,
+                 grid_height=DUNGEON_HEIGHT // TILE_SIZE,
+                 tile_size=TILE_SIZE, margin=3, extra_edge_chance=15, placement="random",
+                 triangulator="bowyer_watson", mst_algorithm="prim", pathfinder="a_star",
+                 workers=1, corridor_reuse=False, collect_stats=False):
+        """A constructor that initializes the generator and the algorithms it uses.
+
+        Args:
+            grid_width: Dungeon width in tile units.
+            grid_height: Dungeon height in tile units.
+            tile_size: Size of a tile in pixels.
+            margin: Minimum number of empty tiles around each room.
+            extra_edge_chance: Chance in percent of adding each extra edge.
+            placement: Room placement mode, either "random" or "free".
+            triangulator: Triangulation algorithm, either "bowyer_watson" or "sweep_hull".
+            mst_algorithm: Minimum Spanning Tree algorithm, either "prim" or "kruskal".
+            pathfinder: Corridor pathfinding algorithm, either "a_star", "fast_a_star",
+                "multi_target", "jump_point" or "hpa_star".
+            workers: Number of processes used to find the corridor paths.
+            corridor_reuse: Whether the later corridors should follow the earlier ones.
+                The corridors are then carved one after another, so it cannot be
+                combined with more than one worker.
+            collect_stats: Whether to time the stages and count the work of the algorithms
+                in a GenerationStats object stored in each dungeon. The pathfinder counters
+                are only collected when the paths are found with one worker.
+        """
+
+        # Options that change the generated dungeons, the number of workers and
+        # collecting the stats do not
+        self.options = {
+            "grid_width": grid_width,
+            "grid_height": grid_height,
+            "tile_size": tile_size,
+            "margin": margin,
+            "extra_edge_chance": extra_edge_chance,
+            "placement": placement,
+            "triangulator": triangulator,
+            "mst_algorithm": mst_algorithm,
+            "pathfinder": pathfinder,
+            "corridor_reuse": corridor_reuse
+        }
+        check_options(self.options, workers)
+
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.tile_size = tile_size
+        self.margin = margin
+        self.extra_edge_chance = extra_edge_chance
+        self.placement = placement
+
+        self.triangulator = triangulation.TRIANGULATORS[triangulator]()
+        self.mst = mst.MST_ALGORITHMS[mst_algorithm]()
+        self.pathfinder = corridors.PATHFINDERS[pathfinder]()
+        self.workers = workers
+        self.corridor_reuse = corridor_reuse
+        self.collect_stats = collect_stats
+
+    def generate(self, min_size, max_size, max_rooms, seed=None):
+        """A method that generates a new dungeon.
+
+        The same seed and parameters always generate the same dungeon, as every
+            random step of the pipeline uses its own generator derived from the seed.
+
+        Args:
+            min_size: Minimum room size in tile units.
+            max_size: Maximum room size in tile units.
+            max_rooms: Number of rooms to try to place.
+            seed: Seed for the dungeon, a random seed is chosen if no seed is given.
+
+        Returns:
+            A Dungeon object containing the results of every generation step.
+        """
+
+        if seed is None:
+            seed = random.randrange(2**32)
+
+        dungeon = Dungeon(self.grid_width, self.grid_height, self.tile_size, seed)
+        stats = self._start_stats(dungeon)
+
+        with time_stage(stats, "rooms"):
+            self._place_rooms(dungeon, min_size, max_size, max_rooms, stats)
+
+        with time_stage(stats, "triangulation"):
+            dungeon.triangles = self.triangulator.triangulate(dungeon.room_centers)
+
+            # Build the graph of the triangulation edges once for the MST,
+            # extra edges and corridors
+            graph = room_graph.RoomGraph(dungeon.room_centers, dungeon.triangles)
+            dungeon.room_graph = graph
+
+        self._connect_rooms(dungeon, stats)
+
+        with time_stage(stats, "tiles"):
+            self.map_tiles(dungeon, get_stage_rng(seed, "floors"))
+
+        with time_stage(stats, "walls"):
+            dungeon.wall_map = walls.map_wall_tiles(dungeon.tiles)
+
+        with time_stage(stats, "corridors"):
+            dungeon.paths, dungeon.corridor_map = corridors.carve_corridors(
+                [graph.edges[i] for i in dungeon.corridor_edges],
+                dungeon.tiles,
+                self.pathfinder,
+                self.tile_size,
+                self.workers,
+                self.corridor_reuse
+            )
+
+        return dungeon
+
+    def _place_rooms(self, dungeon, min_size, max_size, max_rooms, stats):
+        """A method that places the rooms of a dungeon and finds their centers."""
+
+        dungeon.rooms = rooms.PLACEMENT_MODES[self.placement](
+            grid_width=self.grid_width,
+            grid_height=self.grid_height,
+            min_size=min_size,
+            max_size=max_size,
+            max_rooms=max_rooms,
+            margin=self.margin,
+            rng=get_stage_rng(dungeon.seed, "rooms"),
+            stats=stats
+        )
+
+        for room in dungeon.rooms:
+            dungeon.room_centers.append(room.get_center(self.tile_size))
+
+    def _connect_rooms(self, dungeon, stats):
+        """A method that chooses the corridor edges of a dungeon from its room graph:
+            the edges of the Minimum Spanning Tree and the random extra edges."""
+
+        graph = dungeon.room_graph
+
+        with time_stage(stats, "mst"):
+            mst_edges = self.mst.create_graph_mst(graph, get_stage_rng(dungeon.seed, "mst"))
+
+        with time_stage(stats, "extra_edges"):
+            extra_edges = prim.add_random_graph_edges(
+                self.extra_edge_chance,
+                mst_edges,
+                graph,
+                get_stage_rng(dungeon.seed, "extra_edges")
+            )
+
+        dungeon.mst_edges = graph.get_edges(mst_edges)
+        dungeon.extra_edges = graph.get_edges(extra_edges)
+        dungeon.corridor_edges = sorted(mst_edges.union(extra_edges))
+
+    def _start_stats(self, dungeon):
+        """A method that creates the GenerationStats object of a dungeon and passes it
+            to the algorithms, if the stats are collected.
+
+        Returns:
+            The GenerationStats object, or None if the stats are not collected.
+        """
+
+        stats = GenerationStats() if self.collect_stats else None
+        dungeon.stats = stats
+
+        self.triangulator.stats = stats
+
+        # The pathfinder is copied to each worker process, so its counts would be lost
+        self.pathfinder.stats = stats if self.workers == 1 else None
+
+        return stats
+
+    def map_tiles(self, dungeon, rng):
+        """A method that marks non-room tiles as zeros and room tiles as ones.
+
+        The method also initializes a floor map with the floor tile variant of each room tile."""
+
+        # Initialize all tiles as zeros
+        dungeon.tiles = TileGrid(self.grid_width, self.grid_height)
+        dungeon.floor_map = [
+            [None for col in range(self.grid_height)] for row in range(self.grid_width)
+        ]
+
+        # Mark tiles inside rooms as ones
+        for room in dungeon.rooms:
+            dungeon.tiles.fill_rect(room.tile_x, room.tile_y, room.tile_width, room.tile_height, 1)
+
+            for i in range(room.tile_width):
+                for j in range(room.tile_height):
+                    dungeon.floor_map[room.tile_x + i][room.tile_y + j] = rng.choice([0, 1])
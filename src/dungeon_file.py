@@ -0,0 +1,216 @@
+import mmap
+import struct
+from bowyer_watson import Edge, Triangle
+from dungeon import Dungeon
+from rooms import Room
+from tile_grid import TileGrid
+
+# Dungeon file layout, all numbers little-endian:
+#   header: magic, format version, tile size, grid width, grid height, seed
+#       and the number of rooms, triangles and edges
+#   room table: x, y, width and height of each room in tile units
+#   triangle table: room indices of the three vertices of each triangle
+#   edge list: room indices of the two ends of each edge and its kind
+#   tile layers: tile types, wall types, floor variants and corridor floor variants,
+#       each one byte per tile stored row by row
+MAGIC = b"DUNG"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHIIQIII")
+ROOM = struct.Struct("<IIII")
+TRIANGLE = struct.Struct("<III")
+EDGE = struct.Struct("<IIB")
+
+# Kinds of the edges in the edge list
+MST_EDGE = 0
+EXTRA_EDGE = 1
+
+# Floor variant of the tiles without a floor in the floor and corridor layers
+NO_FLOOR = 255
+
+def pack_floor_layer(floor_map, width, height):
+    """A function that packs a list of lists of floor variants into one byte per tile."""
+
+    layer = TileGrid(width, height, NO_FLOOR)
+
+    for tile_x, column in enumerate(floor_map):
+        layer.cells[tile_x::width] = bytes(
+            NO_FLOOR if floor_variant is None else floor_variant for floor_variant in column
+        )
+
+    return layer.cells
+
+def unpack_floor_layer(cells, width):
+    """A function that unpacks a floor layer into a list of lists of floor variants."""
+
+    return [
+        [None if floor_variant == NO_FLOOR else floor_variant
+         for floor_variant in cells[tile_x::width]]
+        for tile_x in range(width)
+    ]
+
+def can_store_seed(seed):
+    """A function that checks whether a seed fits in the header of a dungeon file."""
+
+    return isinstance(seed, int) and not isinstance(seed, bool) and 0 <= seed < 2**64
+
+def pack_dungeon(dungeon):
+    """A function that packs a dungeon into the bytes of a dungeon file.
+
+    The triangulation graph, corridor edge indices, paths and stats are not stored.
+
+    Returns:
+        A list of byte strings that form the file when joined.
+    """
+
+    if not can_store_seed(dungeon.seed):
+        raise ValueError(f"Seed cannot be stored in a dungeon file: {dungeon.seed}")
+
+    # Room index of each room center, used to store the triangles and edges
+    room_indices = {center: i for i, center in enumerate(dungeon.room_centers)}
+
+    edges = (
+        [(edge, MST_EDGE) for edge in sorted(dungeon.mst_edges)] +
+        [(edge, EXTRA_EDGE) for edge in sorted(dungeon.extra_edges)]
+    )
+
+    chunks = [HEADER.pack(
+        MAGIC, VERSION, dungeon.tile_size, dungeon.grid_width, dungeon.grid_height,
+        dungeon.seed, len(dungeon.rooms), len(dungeon.triangles), len(edges)
+    )]
+
+    chunks.extend(
+        ROOM.pack(room.tile_x, room.tile_y, room.tile_width, room.tile_height)
+        for room in dungeon.rooms
+    )
+    chunks.extend(
+        TRIANGLE.pack(room_indices[t.v1], room_indices[t.v2], room_indices[t.v3])
+        for t in dungeon.triangles
+    )
+    chunks.extend(
+        EDGE.pack(room_indices[edge.v1], room_indices[edge.v2], kind) for edge, kind in edges
+    )
+
+    width, height = dungeon.grid_width, dungeon.grid_height
+    chunks.append(dungeon.tiles.cells)
+    chunks.append(dungeon.wall_map.cells)
+    chunks.append(pack_floor_layer(dungeon.floor_map, width, height))
+    chunks.append(pack_floor_layer(dungeon.corridor_map, width, height))
+
+    return chunks
+
+def save_dungeon(dungeon, path):
+    """A function that writes a dungeon to a dungeon file.
+
+    Returns:
+        The size of the written file in bytes.
+    """
+
+    with open(path, "wb") as file:
+        for chunk in pack_dungeon(dungeon):
+            file.write(chunk)
+
+        return file.tell()
+
+def read_header(view):
+    """A function that reads and checks the header of a dungeon file.
+
+    Returns:
+        The tile size, grid width, grid height, seed and the number of rooms,
+            triangles and edges.
+    """
+
+    if len(view) < HEADER.size or bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a dungeon file")
+
+    _, version, *fields = HEADER.unpack_from(view)
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported dungeon file version: {version}")
+
+    _, width, height, _, room_count, triangle_count, edge_count = fields
+    file_size = (
+        HEADER.size + room_count * ROOM.size + triangle_count * TRIANGLE.size +
+        edge_count * EDGE.size + 4 * width * height
+    )
+    if len(view) < file_size:
+        raise ValueError("Dungeon file is truncated")
+
+    return tuple(fields)
+
+def unpack_room_graph(dungeon, triangle_bytes, edge_bytes):
+    """A function that reads the triangles and edges of a dungeon from their tables.
+
+    Raises:
+        ValueError: If a room index is outside the room table.
+    """
+
+    centers = dungeon.room_centers
+
+    try:
+        dungeon.triangles = [
+            Triangle(centers[a], centers[b], centers[c])
+            for a, b, c in TRIANGLE.iter_unpack(triangle_bytes)
+        ]
+
+        for a, b, kind in EDGE.iter_unpack(edge_bytes):
+            edges = dungeon.mst_edges if kind == MST_EDGE else dungeon.extra_edges
+            edges.add(Edge(centers[a], centers[b]))
+    except IndexError as error:
+        raise ValueError("Dungeon file has a room index outside the room table") from error
+
+# pylint: disable=too-many-locals
+def unpack_dungeon(buffer):
+    """A function that reads a dungeon from the bytes of a dungeon file.
+
+    The tile types and wall types are TileGrid objects that use the buffer without copying.
+
+    Args:
+        buffer: Bytes of the dungeon file, for example an mmap object.
+
+    Returns:
+        A Dungeon object.
+    """
+
+    view = memoryview(buffer)
+    tile_size, width, height, seed, room_count, triangle_count, edge_count = read_header(view)
+
+    dungeon = Dungeon(width, height, tile_size, seed)
+    offset = HEADER.size
+
+    for room_fields in ROOM.iter_unpack(view[offset:offset + room_count * ROOM.size]):
+        room = Room(*room_fields)
+        dungeon.rooms.append(room)
+        dungeon.room_centers.append(room.get_center(tile_size))
+    offset += room_count * ROOM.size
+
+    triangle_bytes = view[offset:offset + triangle_count * TRIANGLE.size]
+    offset += triangle_count * TRIANGLE.size
+    unpack_room_graph(dungeon, triangle_bytes, view[offset:offset + edge_count * EDGE.size])
+    offset += edge_count * EDGE.size
+
+    # The four tile layers follow each other
+    layers = [
+        view[offset + i * width * height:offset + (i + 1) * width * height] for i in range(4)
+    ]
+    dungeon.tiles = TileGrid.from_buffer(width, height, layers[0])
+    dungeon.wall_map = TileGrid.from_buffer(width, height, layers[1])
+    dungeon.floor_map = unpack_floor_layer(layers[2], width)
+    dungeon.corridor_map = unpack_floor_layer(layers[3], width)
+
+    return dungeon
+
+def load_dungeon(path):
+    """A function that loads a dungeon file by mapping it to memory.
+
+    The file is mapped copy-on-write, so the tile types and wall types are read from
+        the file only when they are accessed, and changing them does not change the file.
+
+    Returns:
+        A Dungeon object.
+    """
+
+    with open(path, "rb") as file:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    return unpack_dungeon(mapped_file)
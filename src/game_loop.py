@@ -1,18 +1,26 @@
 import os
 import sys
-import random
 import pygame
 import popup
-import rooms
-import bowyer_watson
-import prim
-import a_star
+import layers
+import dungeon
+import walls
+from generation_cache import GenerationCache
 from config import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT,
     DUNGEON_WIDTH, DUNGEON_HEIGHT, TILE_SIZE
 )
 
-# pylint: disable=too-many-instance-attributes,too-many-nested-blocks,too-many-return-statements
+# Layers that are composited onto the dungeon surface in each view
+VIEW_LAYERS = {
+    0: ["rooms"],
+    1: ["rooms", "triangulation"],
+    2: ["rooms", "mst"],
+    3: ["rooms", "mst", "extra_edges"],
+    4: ["rooms", "paths"]
+}
+
+# pylint: disable=too-many-instance-attributes,too-many-statements
 class GameLoop:
     def __init__(self):
         """A constructor that initializes the game window."""
@@ -33,17 +41,25 @@ class GameLoop:
 
         self.current_view = 0
 
-        self.rooms = None
-        self.triangles = None
-        self.mst_edges = None
-        self.extra_edges = None
-        self.tiles = None
-        self.floor_map = None
+        self.dungeon = None
+        self.seed_text = None
+
+        # Generation stats overlay, toggled with the S key
+        self.show_stats = False
+        self.stats_texts = []
 
         self.popup = popup.InputPopup()
-        self.bowyer_watson = bowyer_watson.BowyerWatson()
-        self.prim = prim.Prim()
-        self.a_star = a_star.AStar()
+        self.generator = dungeon.DungeonGenerator(
+            grid_width=DUNGEON_WIDTH // TILE_SIZE,
+            grid_height=DUNGEON_HEIGHT // TILE_SIZE,
+            tile_size=TILE_SIZE,
+            collect_stats=True
+        )
+
+        # Dungeons that have already been generated with the same values are reused
+        self.cache = GenerationCache(self.generator)
+
+        self._create_layers()
 
         self.dungeon_surface.fill((37, 19, 26))
 
@@ -53,6 +69,7 @@ class GameLoop:
         font_path = os.path.join(self.dir_name, "assets", "fonts", "PressStart2P-Regular.ttf")
         self.title_font = pygame.font.Font(font_path, 32)
         self.main_font = pygame.font.Font(font_path, 20)
+        self.small_font = pygame.font.Font(font_path, 12)
 
         self.title_text = self.title_font.render("2D DUNGEON GENERATOR", True, (255, 255, 255))
         self.title_position = (DISPLAY_WIDTH // 2 - self.title_text.get_width() // 2, 40)
@@ -132,6 +149,28 @@ class GameLoop:
             os.path.join(self.dir_name, "assets", "sprite_10.png")
         ).convert()
 
+        self.wall_tiles = {
+            walls.TOP_WALL: self.top_wall_tile,
+            walls.BOTTOM_WALL: self.bottom_wall_tile,
+            walls.LEFT_WALL: self.left_wall_tile,
+            walls.RIGHT_WALL: self.right_wall_tile,
+            walls.TOP_L_CORNER: self.top_l_corner_tile,
+            walls.TOP_R_CORNER: self.top_r_corner_tile,
+            walls.BOTTOM_L_CORNER: self.bottom_l_corner_tile,
+            walls.BOTTOM_R_CORNER: self.bottom_r_corner_tile
+        }
+
+    def _create_layers(self):
+        """A method that creates the cached layers of the dungeon view."""
+
+        self.layers = layers.LayerCache((DUNGEON_WIDTH, DUNGEON_HEIGHT))
+
+        self.layers.add_layer("rooms", self._draw_rooms_and_walls, background=(37, 19, 26))
+        self.layers.add_layer("triangulation", self._draw_triangulation)
+        self.layers.add_layer("mst", self._draw_mst)
+        self.layers.add_layer("extra_edges", self._draw_extra_edges)
+        self.layers.add_layer("paths", self._draw_paths)
+
     def start(self):
         """A method that runs the main game loop."""
 
@@ -150,12 +189,15 @@ class GameLoop:
             user_input = self.popup.handle_events(event)
 
             if user_input:
-                min_size, max_size, max_rooms = user_input
-                self._generate_dungeon(min_size, max_size, max_rooms)
+                min_size, max_size, max_rooms, seed = user_input
+                self._generate_dungeon(min_size, max_size, max_rooms, seed)
 
             if self.popup.popup_active:
                 continue
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_s:
+                self.show_stats = not self.show_stats
+
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if self.exit_button_rect.collidepoint(event.pos):
                     pygame.quit()
@@ -172,60 +214,39 @@ class GameLoop:
                     if self.current_view < 4:
                         self.current_view = self.current_view + 1
 
-    def _generate_dungeon(self, min_size, max_size, max_rooms):
+    def _generate_dungeon(self, min_size, max_size, max_rooms, seed=None):
         """A method that generates a new dungeon when the button is pressed."""
 
         self.current_view = 0
 
-        self.rooms = rooms.generate_rooms(
-            grid_width=DUNGEON_WIDTH // TILE_SIZE,
-            grid_height=DUNGEON_HEIGHT // TILE_SIZE,
-            min_size=min_size,
-            max_size=max_size,
-            max_rooms=max_rooms,
-            margin=3
+        self.dungeon = self.cache.get_dungeon(min_size, max_size, max_rooms, seed)
+        self.seed_text = self.small_font.render(
+            f"SEED: {self.dungeon.seed}", True, (255, 255, 255)
         )
 
-        room_centers = []
-        for room in self.rooms:
-            center_x = room.tile_x * TILE_SIZE + room.tile_width * TILE_SIZE // 2
-            center_y = room.tile_y * TILE_SIZE + room.tile_height * TILE_SIZE // 2
-            room_centers.append((center_x, center_y))
-
-        self.triangles = self.bowyer_watson.triangulate(room_centers)
-
-        self.prim.get_vertices(self.triangles)
-        self.mst_edges = self.prim.create_mst()
-
-        self.extra_edges = prim.add_random_edges(15, self.mst_edges, self.triangles)
+        # The stats of a cached dungeon are from the time it was generated
+        stats_lines = [f"source: {self.cache.last_source}"]
+        if self.dungeon.stats is not None:
+            stats_lines.extend(self.dungeon.stats.get_lines())
 
-        self._map_tiles()
-
-    def _map_tiles(self):
-        """A method that marks non-room tiles as zeros and room tiles as ones.
-
-        The method also initializes a floor map that is used for drawing floor tiles."""
+        self.stats_texts = [
+            self.small_font.render(line.upper(), True, (255, 255, 255))
+            for line in stats_lines
+        ]
 
-        # Initialize all tiles as zeros
-        tile_height = DUNGEON_HEIGHT // TILE_SIZE
-        tile_width = DUNGEON_WIDTH // TILE_SIZE
-        self.tiles = [[0 for col in range(tile_height)] for row in range(tile_width)]
+        # The cached layers are redrawn only after a new dungeon has been generated
+        self.layers.mark_dirty()
 
-        self.floor_map = [[None for col in range(tile_height)] for row in range(tile_width)]
+    def _draw_rooms_and_walls(self, surface):
+        """A method that draws the rooms and the wall tiles onto the given surface."""
 
-        # Mark tiles inside rooms as ones
-        for room in self.rooms:
-            for i in range(room.tile_width):
-                for j in range(room.tile_height):
-                    tile_x = room.tile_x + i
-                    tile_y = room.tile_y + j
-                    self.tiles[tile_x][tile_y] = 1
-                    self.floor_map[tile_x][tile_y] = random.choice(self.floor_tiles)
+        self._draw_rooms(surface)
+        self._draw_wall_tiles(surface)
 
-    def _draw_rooms(self):
-        """A method that draws the rooms onto the dungeon surface."""
+    def _draw_rooms(self, surface):
+        """A method that draws the rooms onto the given surface."""
 
-        for room in self.rooms:
+        for room in self.dungeon.rooms:
             for i in range(room.tile_width):
                 for j in range(room.tile_height):
                     tile_x = room.tile_x + i
@@ -238,126 +259,65 @@ class GameLoop:
                         TILE_SIZE
                     )
 
-                    floor_tile = self.floor_map[tile_x][tile_y]
-                    self.dungeon_surface.blit(floor_tile, tile_rect)
-
-    def _get_wall_tile(self, tile_x, tile_y):
-        """A method that finds the position of a tile based on the surrounding tiles
-            and returns the corresponding wall tile."""
-
-        if 0 < tile_x < len(self.tiles) - 1:
-            if 0 < tile_y < len(self.tiles[0]) - 1:
-
-                up = self.tiles[tile_x][tile_y - 1] == 1
-                down = self.tiles[tile_x][tile_y + 1] == 1
-                left = self.tiles[tile_x - 1][tile_y] == 1
-                right = self.tiles[tile_x + 1][tile_y] == 1
-
-                up_l = self.tiles[tile_x - 1][tile_y - 1] == 1
-                up_r = self.tiles[tile_x + 1][tile_y - 1] == 1
-                down_l = self.tiles[tile_x - 1][tile_y + 1] == 1
-                down_r = self.tiles[tile_x + 1][tile_y + 1] == 1
-
-                if not up and down and not left and not right:
-                    return self.top_wall_tile
-                if up and not down and not left and not right:
-                    return self.bottom_wall_tile
-                if not up and not down and not left and right:
-                    return self.left_wall_tile
-                if not up and not down and left and not right:
-                    return self.right_wall_tile
-
-                if not up and not down and not left and not right:
-                    if not up_l and not up_r and not down_l and down_r:
-                        return self.top_l_corner_tile
-                    if not up_l and not up_r and down_l and not down_r:
-                        return self.top_r_corner_tile
-                    if not up_l and up_r and not down_l and not down_r:
-                        return self.bottom_l_corner_tile
-                    if up_l and not up_r and not down_l and not down_r:
-                        return self.bottom_r_corner_tile
-
-        return None
-
-    def _draw_wall_tiles(self):
-        """A method that draws the wall tiles onto the dungeon surface."""
-
-        wall_tiles = set()
-
-        for tile_x in range(len(self.tiles)):
-            for tile_y in range(len(self.tiles[tile_x])):
-                if self.tiles[tile_x][tile_y] in (0, 2):
-                    wall_tile = self._get_wall_tile(tile_x, tile_y)
-
-                    if wall_tile:
-                        tile_rect = pygame.Rect(
-                                    tile_x * TILE_SIZE,
-                                    tile_y * TILE_SIZE,
-                                    TILE_SIZE,
-                                    TILE_SIZE
-                        )
-                        self.dungeon_surface.blit(wall_tile, tile_rect)
-                        wall_tiles.add((tile_x, tile_y))
-
-        # Mark wall tiles as twos
-        for tile_x, tile_y in wall_tiles:
-            self.tiles[tile_x][tile_y] = 2
-
-    def _draw_triangulation(self):
-        """A method that draws the Delaunay triangulation onto the dungeon surface."""
-
-        for triangle in self.triangles:
+                    floor_tile = self.floor_tiles[self.dungeon.floor_map[tile_x][tile_y]]
+                    surface.blit(floor_tile, tile_rect)
+
+    def _draw_wall_tiles(self, surface):
+        """A method that draws the wall tiles onto the given surface."""
+
+        wall_map = self.dungeon.wall_map
+
+        for tile_x in range(len(wall_map)):
+            for tile_y in range(len(wall_map[tile_x])):
+                wall_type = wall_map[tile_x][tile_y]
+
+                if wall_type:
+                    wall_tile = self.wall_tiles[wall_type]
+                    tile_rect = pygame.Rect(
+                                tile_x * TILE_SIZE,
+                                tile_y * TILE_SIZE,
+                                TILE_SIZE,
+                                TILE_SIZE
+                    )
+                    surface.blit(wall_tile, tile_rect)
+
+    def _draw_triangulation(self, surface):
+        """A method that draws the Delaunay triangulation onto the given surface."""
+
+        for triangle in self.dungeon.triangles:
             for edge in triangle.edges:
-                pygame.draw.line(self.dungeon_surface, (57, 255, 20), edge.v1, edge.v2)
+                pygame.draw.line(surface, (57, 255, 20), edge.v1, edge.v2)
 
-    def _draw_mst(self):
-        """A method that draws the Minimum Spanning Tree onto the dungeon surface."""
+    def _draw_mst(self, surface):
+        """A method that draws the Minimum Spanning Tree onto the given surface."""
 
-        for edge in self.mst_edges:
-            pygame.draw.line(self.dungeon_surface, (57, 255, 20), edge.v1, edge.v2)
+        for edge in self.dungeon.mst_edges:
+            pygame.draw.line(surface, (57, 255, 20), edge.v1, edge.v2)
 
-    def _draw_extra_edges(self):
-        """A method that draws the added extra edges onto the dungeon surface."""
+    def _draw_extra_edges(self, surface):
+        """A method that draws the added extra edges onto the given surface."""
 
-        for edge in self.extra_edges:
-            pygame.draw.line(self.dungeon_surface, (57, 255, 20), edge.v1, edge.v2)
+        for edge in self.dungeon.extra_edges:
+            pygame.draw.line(surface, (57, 255, 20), edge.v1, edge.v2)
 
-    def _draw_paths(self):
-        """A method that draws the A* paths onto the dungeon surface."""
+    def _draw_paths(self, surface):
+        """A method that draws the carved A* paths onto the given surface."""
 
-        for edge in self.mst_edges.union(self.extra_edges):
-            start_pos = (edge.v1[0] // TILE_SIZE, edge.v1[1] // TILE_SIZE)
-            goal_pos = (edge.v2[0] // TILE_SIZE, edge.v2[1] // TILE_SIZE)
+        corridor_map = self.dungeon.corridor_map
 
-            path = self.a_star.find_path(start_pos, goal_pos, self.tiles)
+        for tile_x in range(len(corridor_map)):
+            for tile_y in range(len(corridor_map[tile_x])):
+                floor_variant = corridor_map[tile_x][tile_y]
 
-            for tile_x, tile_y in path:
-                if self.tiles[tile_x][tile_y] in (0, 2):
+                if floor_variant is not None:
+                    floor_tile = self.floor_tiles[floor_variant]
                     tile_rect = pygame.Rect(
                         tile_x * TILE_SIZE,
                         tile_y * TILE_SIZE,
                         TILE_SIZE,
                         TILE_SIZE
                     )
-                    floor_tile = self.floor_tiles[(tile_x + tile_y) % 2]
-                    self.dungeon_surface.blit(floor_tile, tile_rect)
-
-                    neighbor_tiles = [
-                        (tile_x, tile_y - 1),
-                        (tile_x, tile_y + 1),
-                        (tile_x - 1, tile_y),
-                        (tile_x + 1, tile_y)
-                    ]
-
-                    for new_x, new_y in neighbor_tiles:
-                        if self.tiles[new_x][new_y] == 1:
-                            tile_rect = pygame.Rect(
-                                new_x * TILE_SIZE,
-                                new_y * TILE_SIZE,
-                                TILE_SIZE,
-                                TILE_SIZE
-                            )
-                            self.dungeon_surface.blit(floor_tile, tile_rect)
+                    surface.blit(floor_tile, tile_rect)
 
     def _render(self):
         """A method that renders the current game frame."""
@@ -365,23 +325,8 @@ class GameLoop:
         self.display.fill((0, 0, 0))
         self.dungeon_surface.fill((37, 19, 26))
 
-        if self.rooms:
-            if self.current_view >= 0:
-                self._draw_rooms()
-                self._draw_wall_tiles()
-
-            if self.current_view == 1:
-                self._draw_triangulation()
-
-            if self.current_view == 2:
-                self._draw_mst()
-
-            if self.current_view == 3:
-                self._draw_mst()
-                self._draw_extra_edges()
-
-            if self.current_view == 4:
-                self._draw_paths()
+        if self.dungeon:
+            self.layers.composite(self.dungeon_surface, VIEW_LAYERS[self.current_view])
 
         self.display.blit(self.dungeon_surface, self.dungeon_rect)
         self._render_ui()
@@ -400,7 +345,7 @@ class GameLoop:
         pygame.draw.rect(self.display, (0, 0, 0), self.exit_button_rect)
         self.display.blit(self.exit_button_text, self.exit_text_rect)
 
-        if self.rooms:
+        if self.dungeon:
             if self.current_view > 0:
                 pygame.draw.rect(self.display, (0, 0, 0), self.left_button_rect)
                 self.display.blit(self.left_button_text, self.left_text_rect)
@@ -408,3 +353,30 @@ class GameLoop:
             if self.current_view < 4:
                 pygame.draw.rect(self.display, (0, 0, 0), self.right_button_rect)
                 self.display.blit(self.right_button_text, self.right_text_rect)
+
+            # Show the seed so that the same dungeon can be generated again
+            self.display.blit(
+                self.seed_text, (self.dungeon_rect.x, self.dungeon_rect.bottom + 15)
+            )
+
+            if self.show_stats:
+                self._render_stats()
+
+    def _render_stats(self):
+        """A method that renders the stage times and counters of the generation
+            over the dungeon view."""
+
+        line_height = self.small_font.get_linesize() + 4
+        overlay = pygame.Surface(
+            (
+                max(text.get_width() for text in self.stats_texts) + 20,
+                len(self.stats_texts) * line_height + 16
+            ),
+            pygame.SRCALPHA
+        )
+        overlay.fill((0, 0, 0, 190))
+
+        for i, text in enumerate(self.stats_texts):
+            overlay.blit(text, (10, 10 + i * line_height))
+
+        self.display.blit(overlay, (self.dungeon_rect.x + 10, self.dungeon_rect.y + 10))
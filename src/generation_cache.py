@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import random
+from collections import OrderedDict
+import dungeon_file
+
+class GenerationCache:
+    """A class that caches the dungeons of a generator by their generation parameters.
+
+    As the same seed and parameters always generate the same dungeon, each dungeon is
+        stored under a hash of the seed, the room parameters and the generator options.
+        The dungeons are kept in memory and the least recently used ones are evicted
+        when there are too many dungeons or tiles. If a cache directory is given,
+        the dungeons are also saved as dungeon files, which are loaded when the dungeon
+        is no longer in memory, for example after a restart."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, generator, max_entries=32, max_tiles=None, cache_dir=None):
+        """A constructor that initializes an empty cache.
+
+        Args:
+            generator: DungeonGenerator object used for the dungeons that are not cached.
+            max_entries: Largest number of dungeons kept in memory.
+            max_tiles: Largest total number of tiles of the dungeons kept in memory,
+                or None for no limit.
+            cache_dir: Directory of the dungeon files, or None to keep the dungeons
+                only in memory.
+        """
+
+        self.generator = generator
+        self.max_entries = max_entries
+        self.max_tiles = max_tiles
+        self.cache_dir = cache_dir
+
+        # Dungeons by key from the least recently used to the most recently used
+        self.entries = OrderedDict()
+        self.total_tiles = 0
+
+        # Where the previous dungeon came from: "memory", "disk" or "generated"
+        self.last_source = None
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get_key(self, min_size, max_size, max_rooms, seed):
+        """A method that returns the key of a dungeon as a hexadecimal SHA-256 hash."""
+
+        parameters = {
+            "file_version": dungeon_file.VERSION,
+            "options": self.generator.options,
+            "min_size": min_size,
+            "max_size": max_size,
+            "max_rooms": max_rooms,
+            "seed": seed
+        }
+        encoded = json.dumps(parameters, sort_keys=True).encode("utf-8")
+
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get_path(self, key):
+        """A method that returns the path of the dungeon file of a key."""
+
+        return os.path.join(self.cache_dir, f"{key}.dungeon")
+
+    def get_dungeon(self, min_size, max_size, max_rooms, seed=None):
+        """A method that returns the dungeon of the given parameters, generating it
+            only if it is not cached.
+
+        The returned dungeon may be shared with earlier calls, so it should not be changed.
+
+        Args:
+            min_size: Minimum room size in tile units.
+            max_size: Maximum room size in tile units.
+            max_rooms: Number of rooms to try to place.
+            seed: Seed for the dungeon, a random seed is chosen if no seed is given.
+
+        Returns:
+            A Dungeon object.
+        """
+
+        if seed is None:
+            seed = random.randrange(2**32)
+
+        key = self.get_key(min_size, max_size, max_rooms, seed)
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.last_source = "memory"
+            return self.entries[key]
+
+        dungeon = self._load(key, seed)
+
+        if dungeon is None:
+            dungeon = self.generator.generate(min_size, max_size, max_rooms, seed)
+            self.last_source = "generated"
+            self._save(key, dungeon)
+        else:
+            self.last_source = "disk"
+
+        self._add(key, dungeon)
+
+        return dungeon
+
+    def clear(self):
+        """A method that removes every dungeon from memory, keeping the dungeon files."""
+
+        self.entries.clear()
+        self.total_tiles = 0
+
+    def _add(self, key, dungeon):
+        """A method that adds a dungeon to memory and evicts the least recently used
+            dungeons until the cache is within its limits."""
+
+        self.entries[key] = dungeon
+        self.total_tiles += dungeon.grid_width * dungeon.grid_height
+
+        # The newest dungeon is kept even if it alone is over the tile limit
+        while len(self.entries) > 1 and (
+                len(self.entries) > self.max_entries or
+                (self.max_tiles is not None and self.total_tiles > self.max_tiles)):
+            _, evicted = self.entries.popitem(last=False)
+            self.total_tiles -= evicted.grid_width * evicted.grid_height
+
+    def _uses_disk(self, seed):
+        """A method that checks whether the dungeons of a seed are saved to disk,
+            which needs a cache directory and a seed the dungeon files can store."""
+
+        return self.cache_dir is not None and dungeon_file.can_store_seed(seed)
+
+    def _load(self, key, seed):
+        """A method that loads the dungeon file of a key.
+
+        Returns:
+            A Dungeon object, or None if the dungeon is not saved to disk or there is
+                no valid file.
+        """
+
+        if not self._uses_disk(seed):
+            return None
+
+        try:
+            return dungeon_file.load_dungeon(self.get_path(key))
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, key, dungeon):
+        """A method that saves a dungeon to the dungeon file of a key, if the dungeon
+            is saved to disk.
+
+        The file is written under a temporary name and then renamed, so other processes
+            sharing the directory never load a partly written file."""
+
+        if not self._uses_disk(dungeon.seed):
+            return
+
+        path = self.get_path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+
+        dungeon_file.save_dungeon(dungeon, temporary_path)
+        os.replace(temporary_path, path)
@@ -0,0 +1,61 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+class GenerationStats:
+    """A class that collects the stage times and counters of one dungeon generation."""
+
+    def __init__(self):
+        """A constructor that initializes empty stage times and counters."""
+
+        # Seconds spent in each stage and the counts of each counter, in the order
+        # they were first recorded
+        self.stage_times = {}
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        """A method that times the code run inside the with block as a stage.
+
+        The times of stages with the same name are added together."""
+
+        start_time = time.perf_counter()
+
+        try:
+            yield self
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            self.stage_times[name] = self.stage_times.get(name, 0) + elapsed_time
+
+    def count(self, name, amount=1):
+        """A method that adds an amount to a counter."""
+
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_max(self, name, value):
+        """A method that sets a counter to the value if it is larger than the counter."""
+
+        self.counters[name] = max(self.counters.get(name, value), value)
+
+    def get_total_time(self):
+        """A method that returns the total time of the stages in seconds."""
+
+        return sum(self.stage_times.values())
+
+    def get_lines(self):
+        """A method that returns the stage times in milliseconds and the counters
+            as lines of text."""
+
+        lines = [f"{name}: {seconds * 1000:.1f} ms" for name, seconds in self.stage_times.items()]
+        lines.append(f"total: {self.get_total_time() * 1000:.1f} ms")
+        lines.extend(f"{name}: {value}" for name, value in self.counters.items())
+
+        return lines
+
+def time_stage(stats, name):
+    """A function that returns a context manager timing a stage if stats is a
+        GenerationStats object, and doing nothing if it is None."""
+
+    if stats is None:
+        return nullcontext()
+
+    return stats.stage(name)
@@ -0,0 +1,463 @@
+import heapq
+from a_star import FastAStar
+from tile_grid import as_tile_grid
+
+# pylint: disable=too-many-instance-attributes
+class AbstractGraph:
+    """A class that stores the abstract graph of a tile grid for hierarchical pathfinding.
+
+    The grid is divided into square clusters. The passable tile pairs along the border of
+        two clusters are divided into entrances, which are runs of pairs with the same tile
+        types, and one or two pairs of each entrance become transitions. The tiles of the
+        transitions are the nodes of the graph, and the graph has an edge between the two
+        tiles of each transition and between the nodes of the same cluster, with the cost
+        of the cheapest path inside the cluster. The clusters made of a single tile type
+        are not searched, as the cheapest paths inside them only move towards the target.
+        The edges are directed, as the cost of a path is the sum of the costs of the tiles
+        it enters."""
+
+    # Entrances longer than this get a transition at both ends instead of in the middle
+    MAX_SINGLE_TRANSITION = 6
+
+    def __init__(self, grid, step_costs, cluster_size):
+        """A constructor that builds the graph of the given grid.
+
+        Args:
+            grid: TileGrid object.
+            step_costs: Cost of moving onto each tile type, infinite for blocked tiles.
+            cluster_size: Width and height of a cluster in tile units.
+        """
+
+        self.width = grid.width
+        self.height = grid.height
+        self.cells = bytes(grid.cells)
+        self.step_costs = step_costs
+        self.cluster_size = cluster_size
+        self.clusters_across = -(-self.width // cluster_size)
+
+        # Nodes of each cluster and the outgoing edges of each node as (node, cost) pairs
+        self.cluster_nodes = {}
+        self.edges = {}
+
+        # Clusters whose nodes have been connected to each other
+        self.connected_clusters = set()
+
+        self.uniform_clusters = self._find_uniform_clusters()
+        self._add_entrances()
+
+    def matches(self, grid):
+        """A method that checks whether the graph was built from the same tiles as a grid."""
+
+        return (
+            self.width == grid.width and self.height == grid.height and
+            self.cells == grid.cells
+        )
+
+    def get_edges(self, node):
+        """A method that returns the outgoing edges of a node.
+
+        The nodes of a cluster are connected to each other when the edges of one of them
+            are needed for the first time, so the clusters that no search reaches are
+            never searched."""
+
+        cluster = self.get_cluster(node)
+
+        if cluster not in self.connected_clusters:
+            self.connected_clusters.add(cluster)
+            nodes = self.cluster_nodes[cluster]
+
+            for cluster_node in nodes:
+                costs = self.get_cluster_costs(cluster_node, cluster, nodes)
+                self.edges[cluster_node].extend(
+                    (other, cost) for other, cost in costs.items() if other != cluster_node
+                )
+
+        return self.edges[node]
+
+    def get_cluster(self, index):
+        """A method that returns the number of the cluster that contains a tile."""
+
+        tile_x, tile_y = index % self.width, index // self.width
+
+        return (
+            (tile_y // self.cluster_size) * self.clusters_across +
+            tile_x // self.cluster_size
+        )
+
+    def get_bounds(self, cluster):
+        """A method that returns the first and last tile coordinates of a cluster
+            as (start x, start y, end x, end y), with the end coordinates excluded."""
+
+        start_x = (cluster % self.clusters_across) * self.cluster_size
+        start_y = (cluster // self.clusters_across) * self.cluster_size
+
+        return (
+            start_x, start_y,
+            min(start_x + self.cluster_size, self.width),
+            min(start_y + self.cluster_size, self.height)
+        )
+
+    def _find_uniform_clusters(self):
+        """A method that finds the clusters whose tiles are all of the same passable type."""
+
+        uniform_clusters = set()
+        clusters_down = -(-self.height // self.cluster_size)
+
+        for cluster in range(self.clusters_across * clusters_down):
+            start_x, start_y, end_x, end_y = self.get_bounds(cluster)
+            tile_type = self.cells[start_y * self.width + start_x]
+
+            if self.step_costs[tile_type] == float("inf"):
+                continue
+
+            if all(
+                self.cells[row * self.width + start_x:row * self.width + end_x].count(tile_type)
+                == end_x - start_x
+                for row in range(start_y, end_y)
+            ):
+                uniform_clusters.add(cluster)
+
+        return uniform_clusters
+
+    def _add_entrances(self):
+        """A method that adds the transitions along the borders between the clusters."""
+
+        width, height, size = self.width, self.height, self.cluster_size
+
+        # The tiles on the edge of the grid are left out, so the transitions and the paths
+        # between them never run along the edge, where the corridors have no room for walls
+
+        # Borders between clusters next to each other horizontally
+        for border_x in range(size, width, size):
+            for start_y in range(0, height, size):
+                self._add_border([
+                    (tile_y * width + border_x - 1, tile_y * width + border_x)
+                    for tile_y in range(max(start_y, 1), min(start_y + size, height - 1))
+                ])
+
+        # Borders between clusters next to each other vertically
+        for border_y in range(size, height, size):
+            for start_x in range(0, width, size):
+                self._add_border([
+                    ((border_y - 1) * width + tile_x, border_y * width + tile_x)
+                    for tile_x in range(max(start_x, 1), min(start_x + size, width - 1))
+                ])
+
+    def _add_border(self, pairs):
+        """A method that divides the tile pairs along a border into entrances."""
+
+        cells, step_costs = self.cells, self.step_costs
+        entrance = []
+        entrance_types = None
+
+        for tile_a, tile_b in pairs:
+            tile_types = (cells[tile_a], cells[tile_b])
+            passable = (
+                step_costs[tile_types[0]] != float("inf") and
+                step_costs[tile_types[1]] != float("inf")
+            )
+
+            if entrance and (not passable or tile_types != entrance_types):
+                self._add_entrance(entrance)
+                entrance = []
+
+            if passable:
+                entrance.append((tile_a, tile_b))
+                entrance_types = tile_types
+
+        if entrance:
+            self._add_entrance(entrance)
+
+    def _add_entrance(self, entrance):
+        """A method that adds the transitions of an entrance to the graph."""
+
+        if len(entrance) > self.MAX_SINGLE_TRANSITION:
+            transitions = [entrance[0], entrance[-1]]
+        else:
+            transitions = [entrance[len(entrance) // 2]]
+
+        for tile_a, tile_b in transitions:
+            for index in (tile_a, tile_b):
+                if index not in self.edges:
+                    self.edges[index] = []
+                    self.cluster_nodes.setdefault(self.get_cluster(index), []).append(index)
+
+            self.edges[tile_a].append((tile_b, self.step_costs[self.cells[tile_b]]))
+            self.edges[tile_b].append((tile_a, self.step_costs[self.cells[tile_a]]))
+
+    # pylint: disable=too-many-locals
+    def search_cluster(self, start, cluster, targets):
+        """A method that finds the cheapest paths from a tile to the target tiles of
+            its cluster with Dijkstra's algorithm, without leaving the cluster.
+
+        Returns:
+            Dictionaries of the path cost and the previous tile of each reached tile.
+        """
+
+        width, cells, step_costs = self.width, self.cells, self.step_costs
+        start_x, start_y, end_x, end_y = self.get_bounds(cluster)
+
+        g_scores = {start: 0}
+        parents = {start: -1}
+        closed = set()
+        open_queue = [(0, start)]
+        remaining_targets = set(targets)
+
+        while open_queue and remaining_targets:
+            current_g, current = heapq.heappop(open_queue)
+
+            if current in closed:
+                continue
+            closed.add(current)
+            remaining_targets.discard(current)
+
+            tile_x, tile_y = current % width, current // width
+
+            for neighbor, inside in ((current - 1, tile_x > start_x),
+                                     (current + 1, tile_x < end_x - 1),
+                                     (current - width, tile_y > start_y),
+                                     (current + width, tile_y < end_y - 1)):
+                if not inside or neighbor in closed:
+                    continue
+
+                new_g_score = current_g + step_costs[cells[neighbor]]
+
+                if new_g_score < g_scores.get(neighbor, float("inf")):
+                    g_scores[neighbor] = new_g_score
+                    parents[neighbor] = current
+                    heapq.heappush(open_queue, (new_g_score, neighbor))
+
+        return g_scores, parents
+
+    def get_cluster_costs(self, start, cluster, targets):
+        """A method that returns the costs of the cheapest paths from a tile to the target
+            tiles of the same cluster, leaving out the targets that cannot be reached."""
+
+        if cluster in self.uniform_clusters:
+            # Every path that only moves towards the target is the cheapest
+            step_cost = self.step_costs[self.cells[start]]
+            start_x, start_y = start % self.width, start // self.width
+
+            return {
+                target: step_cost * (
+                    abs(target % self.width - start_x) + abs(target // self.width - start_y)
+                )
+                for target in targets
+            }
+
+        g_scores, _ = self.search_cluster(start, cluster, targets)
+
+        return {
+            target: g_scores[target]
+            for target in targets if g_scores.get(target, float("inf")) != float("inf")
+        }
+
+    def get_cluster_path(self, start, end, cluster):
+        """A method that returns the indices of the tiles on the cheapest path between
+            two tiles of the same cluster."""
+
+        if cluster in self.uniform_clusters:
+            # Move horizontally first and then vertically, or the other way around
+            # if the corner of the path would be on the edge of the grid
+            width = self.width
+            corner_x, corner_y = end % width, start // width
+
+            if not (0 < corner_x < width - 1 and 0 < corner_y < self.height - 1):
+                corner_x, corner_y = start % width, end // width
+
+            corner = corner_y * width + corner_x
+
+            return self.get_line(start, corner) + self.get_line(corner, end)[1:]
+
+        _, parents = self.search_cluster(start, cluster, [end])
+
+        path = []
+        current = end
+        while current != -1:
+            path.append(current)
+            current = parents[current]
+
+        return path[::-1]
+
+    def get_line(self, start, end):
+        """A method that returns the indices of the tiles on the straight line between
+            two tiles of the same row or column."""
+
+        if start // self.width == end // self.width:
+            step = 1 if end >= start else -1
+        else:
+            step = self.width if end >= start else -self.width
+
+        return list(range(start, end + step, step))
+
+class HierarchicalAStar(FastAStar):
+    """A class that implements hierarchical pathfinding (HPA*) on an abstract graph.
+
+    The abstract graph of the grid is built once and reused for every search until the
+        tiles change, and the costs inside each cluster are found once when a search
+        first reaches the cluster. Each search connects the start and goal tiles to the
+        nodes of their clusters, finds the cheapest path on the abstract graph with the A*
+        algorithm and then finds the tile paths inside the clusters on that path. The found
+        paths are close to the cheapest paths, but not always the cheapest, as the paths
+        can only cross the cluster borders at the transitions."""
+
+    CLUSTER_SIZE = 16
+
+    def __init__(self):
+        """A constructor that initializes the pathfinder without an abstract graph."""
+
+        self.graph = None
+
+    def get_abstract_graph(self, grid):
+        """A method that returns the abstract graph of a grid, building it if the tiles
+            have changed since the previous search."""
+
+        if self.graph is None or not self.graph.matches(grid):
+            self.graph = AbstractGraph(grid, self.STEP_COSTS, self.CLUSTER_SIZE)
+
+        return self.graph
+
+    def connect_goal(self, graph, start, goal):
+        """A method that finds the costs of the paths from the nodes of the goal cluster
+            to the goal tile, and from the start tile to the nodes of the start cluster.
+
+        Returns:
+            Dictionaries of the outgoing edge costs of the start tile and the
+                edge costs from the nodes of the goal cluster to the goal tile.
+        """
+
+        start_cluster = graph.get_cluster(start)
+        goal_cluster = graph.get_cluster(goal)
+
+        start_targets = list(graph.cluster_nodes.get(start_cluster, []))
+        if start_cluster == goal_cluster:
+            start_targets.append(goal)
+
+        start_edges = graph.get_cluster_costs(start, start_cluster, start_targets)
+
+        # The path from a node to the goal enters the goal instead of the node,
+        # so its cost differs from the cost of the reversed path by the costs of the tiles
+        goal_nodes = graph.cluster_nodes.get(goal_cluster, [])
+        goal_cost = self.STEP_COSTS[graph.cells[goal]]
+        goal_edges = {
+            node: cost + goal_cost - self.STEP_COSTS[graph.cells[node]]
+            for node, cost in graph.get_cluster_costs(goal, goal_cluster, goal_nodes).items()
+        }
+
+        return start_edges, goal_edges
+
+    def find_path(self, start_pos, goal_pos, tiles):
+        """A method that finds a path from the start tile to the goal tile.
+
+        Args:
+            start_pos: Coordinates of the start tile.
+            goal_pos: Coordinates of the goal tile.
+            tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+
+        Returns:
+            A list of the tile coordinates on the path, or None if no path is found.
+        """
+
+        grid = as_tile_grid(tiles)
+
+        if not grid.in_bounds(*start_pos) or not grid.in_bounds(*goal_pos):
+            return None
+
+        start = grid.index(*start_pos)
+        goal = grid.index(*goal_pos)
+
+        if start == goal:
+            return [start_pos]
+
+        if self.STEP_COSTS[grid.cells[goal]] == float("inf"):
+            return None
+
+        graph = self.get_abstract_graph(grid)
+        parents = self.search_abstract_graph(
+            graph, start, goal, self.get_heuristic_weight(grid)
+        )
+
+        # The abstract graph has no transitions on the edge of the grid, so the goal
+        # may still be reachable along the edge
+        if parents is None:
+            return super().find_path(start_pos, goal_pos, grid)
+
+        return self.refine_path(graph, goal, parents)
+
+    # pylint: disable=too-many-locals,too-many-statements
+    def search_abstract_graph(self, graph, start, goal, weight):
+        """A method that finds the cheapest path from the start tile to the goal tile
+            on the abstract graph with the A* algorithm.
+
+        Returns:
+            A dictionary of the previous node of each reached node, or None if the goal
+                cannot be reached.
+        """
+
+        width = graph.width
+        goal_x, goal_y = goal % width, goal // width
+        start_edges, goal_edges = self.connect_goal(graph, start, goal)
+
+        g_scores = {start: 0}
+        parents = {start: -1}
+        closed = set()
+
+        # Nodes with equal scores are popped in the order of their indices
+        open_queue = [(0, start)]
+        pushes = 1
+
+        while open_queue:
+            current = heapq.heappop(open_queue)[1]
+
+            if current == goal:
+                self.record_search(len(closed), pushes)
+                return parents
+
+            if current in closed:
+                continue
+            closed.add(current)
+
+            edges = list(graph.get_edges(current)) if current in graph.edges else []
+            if current == start:
+                edges.extend(start_edges.items())
+            if current in goal_edges:
+                edges.append((goal, goal_edges[current]))
+
+            for neighbor, cost in edges:
+                new_g_score = g_scores[current] + cost
+
+                if neighbor not in closed and new_g_score < g_scores.get(neighbor, float("inf")):
+                    g_scores[neighbor] = new_g_score
+                    parents[neighbor] = current
+                    h_score = weight * (
+                        abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)
+                    )
+                    heapq.heappush(open_queue, (new_g_score + h_score, neighbor))
+                    pushes += 1
+
+        self.record_search(len(closed), pushes)
+        return None
+
+    def refine_path(self, graph, goal, parents):
+        """A method that turns the path of abstract graph nodes into a path of tiles,
+            finding the paths inside only the clusters the path goes through."""
+
+        nodes = []
+        current = goal
+        while current != -1:
+            nodes.append(current)
+            current = parents[current]
+        nodes.reverse()
+
+        path = [nodes[0]]
+
+        for node_a, node_b in zip(nodes, nodes[1:]):
+            cluster = graph.get_cluster(node_a)
+
+            # The two tiles of a transition are next to each other
+            if cluster != graph.get_cluster(node_b):
+                path.append(node_b)
+            else:
+                path.extend(graph.get_cluster_path(node_a, node_b, cluster)[1:])
+
+        return [(index % graph.width, index // graph.width) for index in path]
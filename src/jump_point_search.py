@@ -0,0 +1,454 @@
+import heapq
+from array import array
+from a_star import FastAStar
+from tile_grid import as_tile_grid
+
+# Translation table that turns every non-zero byte into a one
+NONZERO_FLAGS = bytes([0]) + bytes([1]) * 255
+
+# Translation tables that turn the codes of the stop tiles (1) and the blocked tiles
+# (2, or 3 if a blocked tile is also marked as a stop) of a line into ones
+EVENT_FLAGS = bytes([0, 1, 1, 1]) + bytes(252)
+STOP_FLAGS = bytes([0, 1]) + bytes(254)
+BLOCKED_FLAGS = bytes([0, 0, 1, 1]) + bytes(252)
+
+def bytes_or(bytes_a, bytes_b):
+    """A function that returns the bitwise OR of two equally long byte strings."""
+
+    return (
+        int.from_bytes(bytes_a, "big") | int.from_bytes(bytes_b, "big")
+    ).to_bytes(len(bytes_a), "big")
+
+def find_changes(cells, offset):
+    """A function that returns the indices i where cells[i] differs from cells[i + offset].
+
+    The cells are compared as two large integers, so only the differing bytes are visited
+        in Python."""
+
+    length = len(cells) - offset
+    if length <= 0:
+        return []
+
+    differences = (
+        int.from_bytes(cells[:length], "big") ^ int.from_bytes(cells[offset:], "big")
+    ).to_bytes(length, "big").translate(NONZERO_FLAGS)
+
+    indices = []
+    index = differences.find(1)
+
+    while index != -1:
+        indices.append(index)
+        index = differences.find(1, index + 1)
+
+    return indices
+
+# pylint: disable=too-many-statements
+def get_line_distances(codes):
+    """A function that finds the jump distances along one row or column.
+
+    Args:
+        codes: Code of each tile in the opposite order of the jump direction, so that
+            each jump moves towards the start of the codes. The code is one for tiles
+            where the jump stops, two or three for blocked tiles and zero for other tiles.
+
+    Returns:
+        An array of the jump distances and a byte string with a one for the tiles
+            whose jump stops before a blocked tile or the edge of the grid.
+    """
+
+    events = codes.translate(EVENT_FLAGS)
+    stop_flags = codes.translate(STOP_FLAGS)
+    blocked_flags = codes.translate(BLOCKED_FLAGS)
+    distances = array("i")
+    found = bytearray()
+
+    # The edge of the grid acts like a blocked tile before the first tile
+    run_end = 0
+    stops = False
+
+    while True:
+        event = events.find(1, run_end)
+        run = (len(codes) if event == -1 else event) - run_end
+
+        if stops:
+            distances.extend(range(1, run + 1))
+            found += bytes([1]) * run
+        else:
+            distances.extend(range(-1, -run - 1, -1))
+            found += bytes(run)
+
+        if event == -1:
+            return distances, found
+
+        # Consecutive stop tiles or blocked tiles are handled together
+        stops = codes[event] == 1
+        run_end = (stop_flags if stops else blocked_flags).find(0, event)
+        if run_end == -1:
+            run_end = len(codes)
+
+        distances.frombytes(bytes(distances.itemsize * (run_end - event)))
+        found += (bytes([1]) if stops else bytes(1)) * (run_end - event)
+
+# pylint: disable=too-many-instance-attributes
+class JumpTables:
+    """A class that stores the precomputed jump distances of a tile grid.
+
+    For every tile and direction, the tables store the number of steps to the first tile
+        where a jump in that direction stops. If the jump runs into a blocked tile or the
+        edge of the grid before it stops, the number of steps to the last passable tile
+        is stored as the negative number -(steps + 1).
+
+    A jump stops at tiles next to a passable tile of a different type, as the search
+        may have to enter the other tile type there. A vertical jump also stops where a
+        tile beside the previous tile is blocked or of a different type, so that the tile
+        beside the stop cannot be reached by moving horizontally first. A horizontal jump
+        stops where a vertical jump up or down would stop."""
+
+    def __init__(self, grid, step_costs):
+        """A constructor that builds the tables of the given grid.
+
+        Args:
+            grid: TileGrid object.
+            step_costs: Cost of moving onto each tile type, infinite for blocked tiles.
+        """
+
+        self.width = grid.width
+        self.height = grid.height
+        self.cells = bytes(grid.cells)
+        self.open_tiles = self.cells.translate(
+            bytes(0 if cost == float("inf") else 1 for cost in step_costs[:256])
+        )
+
+        # Blocked tiles have the code two in the lines given to get_line_distances
+        self.blocked_codes = self.open_tiles.translate(bytes([2]) + bytes(255))
+        self.boundary = self._find_boundary_tiles()
+
+        stops_up, stops_down = self._find_vertical_stops()
+        self.up, found_up = self._build_table(stops_up, self.width, False)
+        self.down, found_down = self._build_table(stops_down, self.width, True)
+
+        # A horizontal jump stops where a jump up or down from it finds a jump point
+        size, width = len(self.cells), self.width
+        stops_sideways = bytes_or(
+            self.boundary,
+            bytes_or(bytes(width) + found_up[:size - width], found_down[width:] + bytes(width))
+        )
+        self.left, _ = self._build_table(stops_sideways, 1, False)
+        self.right, _ = self._build_table(stops_sideways, 1, True)
+
+    def matches(self, grid):
+        """A method that checks whether the tables were built from the same tiles as a grid."""
+
+        return (
+            self.width == grid.width and self.height == grid.height and
+            self.cells == grid.cells
+        )
+
+    def get_table(self, step):
+        """A method that returns the table of the direction with the given index offset."""
+
+        if step == 1:
+            return self.right
+        if step == -1:
+            return self.left
+
+        return self.down if step > 0 else self.up
+
+    def _find_boundary_tiles(self):
+        """A method that marks the passable tiles next to a passable tile of a different type."""
+
+        width, open_tiles = self.width, self.open_tiles
+        boundary = bytearray(len(self.cells))
+
+        for offset in (1, width):
+            for index in find_changes(self.cells, offset):
+                other = index + offset
+
+                # Tiles at the end of a row are not next to the start of the next row
+                if offset == 1 and other % width == 0:
+                    continue
+
+                if open_tiles[index] and open_tiles[other]:
+                    boundary[index] = 1
+                    boundary[other] = 1
+
+        return boundary
+
+    def _find_vertical_stops(self):
+        """A method that marks the tiles where the jumps up and down stop.
+
+        A jump up stops at a tile if the tile beside it is passable, but the tile below
+            that tile is blocked or of a different type, and likewise for jumps down."""
+
+        width, open_tiles = self.width, self.open_tiles
+        stops_up = bytearray(self.boundary)
+        stops_down = bytearray(self.boundary)
+
+        # Each pair of diagonal tiles with different types can force a turn at both tiles
+        for index in find_changes(self.cells, width + 1):
+            if index % width == width - 1:
+                continue
+
+            lower = index + width + 1
+            if open_tiles[index] and open_tiles[index + 1]:
+                stops_up[index] = 1
+            if open_tiles[lower] and open_tiles[lower - 1]:
+                stops_down[lower] = 1
+
+        for index in find_changes(self.cells[1:], width - 1):
+            upper = index + 1
+            lower = index + width
+
+            if upper % width == 0:
+                continue
+
+            if open_tiles[upper] and open_tiles[upper - 1]:
+                stops_up[upper] = 1
+            if open_tiles[lower] and open_tiles[lower + 1]:
+                stops_down[lower] = 1
+
+        return stops_up, stops_down
+
+    def _build_table(self, stops, step, reverse):
+        """A method that builds the jump table of one direction.
+
+        Args:
+            stops: Byte string with a one for each tile where the jump stops.
+            step: Distance between neighboring tiles of a line, the grid width for
+                columns and one for rows.
+            reverse: Whether the jump moves towards the end of the line.
+
+        Returns:
+            The jump table and a byte string with a one for the tiles whose jump
+                finds a jump point.
+        """
+
+        size, width = len(self.cells), self.width
+        codes = bytes_or(stops, self.blocked_codes)
+
+        table = array("i", [0]) * size
+        found = bytearray(size)
+
+        if step == 1:
+            lines = [slice(start, start + width) for start in range(0, size, width)]
+        else:
+            lines = [slice(start, size, width) for start in range(width)]
+
+        for line in lines:
+            if reverse:
+                line_distances, line_found = get_line_distances(codes[line][::-1])
+                table[line] = line_distances[::-1]
+                found[line] = line_found[::-1]
+            else:
+                table[line], found[line] = get_line_distances(codes[line])
+
+        return table, found
+
+class JumpPointSearch(FastAStar):
+    """A class that implements Jump Point Search with precomputed jump distances.
+
+    Inside a region of tiles of the same type, there are many equally cheap paths between
+        two tiles, so only the paths that move horizontally before moving vertically are
+        searched. Instead of pushing every tile to the priority queue, the search jumps
+        along the rows and columns to the next jump point, looking up the length of each
+        jump from JumpTables. The tiles next to a different tile type are expanded in every
+        direction, so the found paths have the same cost as the paths found by the AStar
+        class. The tables are built once for each grid and reused while the tiles stay
+        the same."""
+
+    def __init__(self):
+        """A constructor that initializes the pathfinder without jump tables."""
+
+        self.tables = None
+
+    def get_jump_tables(self, grid):
+        """A method that returns the jump tables of a grid, building them if the tiles
+            have changed since the previous search."""
+
+        if self.tables is None or not self.tables.matches(grid):
+            self.tables = JumpTables(grid, self.STEP_COSTS)
+
+        return self.tables
+
+    # pylint: disable=too-many-return-statements
+    def jump(self, tables, index, step, goal):
+        """A method that jumps from a tile in one direction to the next jump point.
+
+        Args:
+            tables: JumpTables object of the grid.
+            index: Index of the tile to jump from.
+            step: Index offset of the direction, 1 or -1 for horizontal jumps
+                and the grid width or its negation for vertical jumps.
+            goal: Index of the goal tile.
+
+        Returns:
+            The index of the jump point and the number of steps to it,
+                or None if the direction leads to a dead end.
+        """
+
+        width = tables.width
+
+        if step in (1, -1):
+            if (index % width) + step not in range(width):
+                return None
+        elif not 0 <= index + step < len(tables.cells):
+            return None
+
+        first = index + step
+        if not tables.open_tiles[first]:
+            return None
+
+        steps = tables.get_table(step)[first]
+        stops = steps >= 0
+        if not stops:
+            steps = -steps - 1
+
+        last = first + steps * step
+
+        # The goal and the tile in the column of the goal are jump points
+        # if the jump passes them
+        if step in (1, -1):
+            if goal // width == first // width:
+                target = goal
+            else:
+                target = first - first % width + goal % width
+            if min(first, last) <= target <= max(first, last):
+                return target, abs(target - index)
+        elif goal % width == first % width and min(first, last) <= goal <= max(first, last):
+            return goal, abs(goal - index) // width
+
+        if stops:
+            return last, steps + 1
+
+        return None
+
+    def get_jump_directions(self, tables, index, arrival):
+        """A method that returns the directions to jump to from a jump point.
+
+        Args:
+            tables: JumpTables object of the grid.
+            index: Index of the jump point.
+            arrival: Direction in which the jump point was reached, zero for the start tile.
+        """
+
+        width, cells = tables.width, tables.cells
+
+        if arrival == 0 or tables.boundary[index]:
+            return [step for step in (1, -1, width, -width) if step != -arrival]
+
+        if arrival in (1, -1):
+            return [arrival, width, -width]
+
+        # Turns from a vertical jump are only needed if moving horizontally first is blocked
+        directions = [arrival]
+        tile_x = index % width
+
+        for side, exists in ((-1, tile_x > 0), (1, tile_x < width - 1)):
+            if (exists and tables.open_tiles[index + side] and
+                    cells[index - arrival + side] != cells[index]):
+                directions.append(side)
+
+        return directions
+
+    # pylint: disable=too-many-locals,too-many-statements
+    def find_path(self, start_pos, goal_pos, tiles):
+        """A method that finds the optimal path from the start tile to the goal tile.
+
+        Args:
+            start_pos: Coordinates of the start tile.
+            goal_pos: Coordinates of the goal tile.
+            tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+
+        Returns:
+            A list of the tile coordinates on the path, or None if no path is found.
+        """
+
+        grid = as_tile_grid(tiles)
+
+        if not grid.in_bounds(*start_pos) or not grid.in_bounds(*goal_pos):
+            return None
+
+        tables = self.get_jump_tables(grid)
+        width = grid.width
+        cells = tables.cells
+        weight = self.get_heuristic_weight(grid)
+        goal_x, goal_y = goal_pos
+
+        start = grid.index(*start_pos)
+        goal = grid.index(*goal_pos)
+
+        # Only the jump points are stored, so dictionaries are used instead of
+        # arrays with an entry for every tile
+        g_scores = {start: 0}
+        parents = {start: -1}
+        arrivals = {start: 0}
+        closed = set()
+
+        counter = 0
+        open_queue = [(0, counter, start)]
+
+        while open_queue:
+            current = heapq.heappop(open_queue)[2]
+
+            if current == goal:
+                self.record_search(len(closed), counter + 1)
+                return self.reconstruct_jump_path(current, parents, width)
+
+            if current in closed:
+                continue
+            closed.add(current)
+
+            for step in self.get_jump_directions(tables, current, arrivals[current]):
+                jump_point = self.jump(tables, current, step, goal)
+
+                if jump_point is None or jump_point[0] in closed:
+                    continue
+
+                # Every tile of a jump has the same type as the jump point
+                neighbor, distance = jump_point
+                new_g_score = g_scores[current] + distance * self.STEP_COSTS[cells[neighbor]]
+
+                if new_g_score < g_scores.get(neighbor, float("inf")):
+                    g_scores[neighbor] = new_g_score
+                    parents[neighbor] = current
+                    arrivals[neighbor] = step
+
+                    counter += 1
+                    h_score = weight * (
+                        abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)
+                    )
+                    heapq.heappush(open_queue, (new_g_score + h_score, counter, neighbor))
+
+        self.record_search(len(closed), counter + 1)
+        return None
+
+    def reconstruct_jump_path(self, goal, parents, width):
+        """A method that reconstructs the path from the goal tile to the start tile,
+            filling in the tiles that were jumped over between the jump points.
+
+        Args:
+            goal: Index of the goal tile.
+            parents: Dictionary of the previous jump point of each jump point.
+            width: Grid width in tile units.
+        """
+
+        final_path = []
+        current = goal
+
+        while current != -1:
+            parent = parents[current]
+            final_path.append((current % width, current // width))
+
+            if parent != -1:
+                # Consecutive jump points are always on the same row or column
+                if current // width == parent // width:
+                    step = 1 if parent > current else -1
+                else:
+                    step = width if parent > current else -width
+
+                for index in range(current + step, parent, step):
+                    final_path.append((index % width, index // width))
+
+            current = parent
+
+        return final_path[::-1]
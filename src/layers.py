@@ -0,0 +1,65 @@
+import pygame
+
+class LayerCache:
+    """A class that stores pre-rendered surfaces for the layers of the dungeon view.
+
+    Each layer is drawn by its bake function only when the layer is marked as dirty,
+        so rendering a frame only has to blit the cached surfaces."""
+
+    def __init__(self, size):
+        """A constructor that initializes an empty layer cache.
+
+        Args:
+            size: Width and height of the layer surfaces in pixels.
+        """
+
+        self.size = size
+        self.layers = {}
+        self.surfaces = {}
+        self.dirty_layers = set()
+
+    def add_layer(self, name, bake_function, background=None):
+        """A method that adds a new layer to the cache.
+
+        Args:
+            name: Name of the layer.
+            bake_function: Function that draws the layer onto the given surface.
+            background: Fill color of an opaque layer, or None for a transparent layer.
+        """
+
+        self.layers[name] = (bake_function, background)
+        self.dirty_layers.add(name)
+
+    def mark_dirty(self, names=None):
+        """A method that marks the given layers, or all layers, to be redrawn."""
+
+        if names is None:
+            names = self.layers.keys()
+
+        self.dirty_layers.update(names)
+
+    def get_surface(self, name):
+        """A method that returns the surface of a layer and redraws it if it is dirty."""
+
+        if name in self.dirty_layers or name not in self.surfaces:
+            bake_function, background = self.layers[name]
+
+            if background is None:
+                surface = pygame.Surface(self.size, pygame.SRCALPHA)
+                surface.fill((0, 0, 0, 0))
+            else:
+                surface = pygame.Surface(self.size)
+                surface.fill(background)
+
+            bake_function(surface)
+
+            self.surfaces[name] = surface
+            self.dirty_layers.discard(name)
+
+        return self.surfaces[name]
+
+    def composite(self, target, names):
+        """A method that blits the given layers onto the target surface in order."""
+
+        for name in names:
+            target.blit(self.get_surface(name), (0, 0))
@@ -0,0 +1,152 @@
+import math
+from prim import Prim
+
+def get_weighted_edges(triangles):
+    """A function that finds the unique edges of a triangulation and their weights.
+
+    Returns:
+        A list of (weight, edge) tuples sorted by weight, with the edge length as the weight.
+    """
+
+    edges = set()
+    for triangle in triangles:
+        edges.update(triangle.edges)
+
+    weighted_edges = []
+    for edge in edges:
+        weight = math.sqrt((edge.v1[0] - edge.v2[0])**2 + (edge.v1[1] - edge.v2[1])**2)
+        weighted_edges.append((weight, edge))
+
+    # Equally long edges are sorted by their vertices, so the order is always the same
+    weighted_edges.sort()
+
+    return weighted_edges
+
+class UnionFind:
+    """A class that keeps track of disjoint sets of integer elements."""
+
+    def __init__(self, size):
+        """A constructor that puts every element in its own set."""
+
+        self.parent = list(range(size))
+        self.set_size = [1] * size
+
+    def find(self, element):
+        """A method that returns the representative element of the set containing an element.
+
+        The method compresses the path by pointing every visited element to its grandparent."""
+
+        parent = self.parent
+
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+
+        return element
+
+    def union(self, element_a, element_b):
+        """A method that merges the sets containing two elements.
+
+        Returns:
+            True if the elements were in different sets, otherwise False.
+        """
+
+        root_a = self.find(element_a)
+        root_b = self.find(element_b)
+
+        if root_a == root_b:
+            return False
+
+        # Attach the smaller set under the larger set to keep the paths short
+        if self.set_size[root_a] < self.set_size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self.parent[root_b] = root_a
+        self.set_size[root_a] += self.set_size[root_b]
+
+        return True
+
+class Kruskal:
+    """A class that implements Kruskal's algorithm to create a Minimum Spanning Tree.
+
+    The class has the same interface as the Prim class, so either one can be used
+        to create the Minimum Spanning Tree of a triangulation."""
+
+    def __init__(self):
+        """A constructor that initializes an empty list of weighted edges and a set of vertices."""
+
+        self.vertices = set()
+        self.weighted_edges = []
+
+    def get_vertices(self, triangles):
+        """A method that builds a set of all vertices and a sorted list of weighted edges."""
+
+        self.weighted_edges = get_weighted_edges(triangles)
+
+        self.vertices.clear()
+        for _, edge in self.weighted_edges:
+            self.vertices.add(edge.v1)
+            self.vertices.add(edge.v2)
+
+    # pylint: disable=unused-argument
+    def create_mst(self, rng=None):
+        """A method that creates the Minimum Spanning Tree.
+
+        Args:
+            rng: Not used, as the result does not depend on a starting vertex.
+                The argument is accepted so that the class can replace the Prim class.
+        """
+
+        vertex_indices = {vertex: i for i, vertex in enumerate(self.vertices)}
+        union_find = UnionFind(len(vertex_indices))
+
+        mst_edges = set()
+        needed_edges = len(vertex_indices) - 1
+
+        # Add the shortest edges that connect two separate trees until there is only one tree
+        for _, edge in self.weighted_edges:
+            if len(mst_edges) >= needed_edges:
+                break
+
+            if union_find.union(vertex_indices[edge.v1], vertex_indices[edge.v2]):
+                mst_edges.add(edge)
+
+        return mst_edges
+
+    def create_graph_mst(self, graph, rng=None):
+        """A method that creates the Minimum Spanning Tree of a room graph.
+
+        Args:
+            graph: RoomGraph object of the triangulation.
+            rng: Not used, as the result does not depend on a starting vertex.
+
+        Returns:
+            A set of the edge indices of the Minimum Spanning Tree.
+        """
+
+        # Equally long edges stay in the order of the graph edges, as the sort is stable
+        weights = graph.weights
+        sorted_edges = sorted(range(graph.edge_count()), key=weights.__getitem__)
+
+        edge_starts = graph.edge_starts
+        edge_ends = graph.edge_ends
+        union_find = UnionFind(graph.vertex_count())
+
+        mst_edges = set()
+        connected_count = sum(1 for i in range(graph.vertex_count()) if graph.get_degree(i))
+        needed_edges = connected_count - 1
+
+        for edge in sorted_edges:
+            if len(mst_edges) >= needed_edges:
+                break
+
+            if union_find.union(edge_starts[edge], edge_ends[edge]):
+                mst_edges.add(edge)
+
+        return mst_edges
+
+# Minimum Spanning Tree algorithms that can be selected by name
+MST_ALGORITHMS = {
+    "prim": Prim,
+    "kruskal": Kruskal
+}
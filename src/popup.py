@@ -47,7 +47,16 @@ class InputBox:
         pygame.draw.rect(window, color, self.box_rect)
 
         box_text = self.main_font.render(self.text, True, (0, 0, 0))
-        window.blit(box_text, (self.box_rect.x + 5, self.box_rect.y + 10))
+
+        # Show only the end of a text that is wider than the box, so the last typed
+        # characters stay visible
+        visible_width = self.box_rect.width - 10
+        scroll = max(box_text.get_width() - visible_width, 0)
+        window.blit(
+            box_text,
+            (self.box_rect.x + 5, self.box_rect.y + 10),
+            pygame.Rect(scroll, 0, visible_width, box_text.get_height())
+        )
 
     def get_input_value(self):
         """A method that returns the value the user submitted."""
@@ -70,8 +79,10 @@ class InputPopup:
         self.min_size = InputBox(self.popup_rect.x + 295, self.popup_rect.y + 50, 105, 35, "3")
         self.max_size = InputBox(self.popup_rect.x + 295, self.popup_rect.y + 100, 105, 35, "10")
         self.max_rooms = InputBox(self.popup_rect.x + 295, self.popup_rect.y + 150, 105, 35, "12")
+        # The seed box is wide enough for the ten digit seeds chosen for random dungeons
+        self.seed = InputBox(self.popup_rect.x + 150, self.popup_rect.y + 200, 250, 35)
 
-        self.input_boxes = [self.min_size, self.max_size, self.max_rooms]
+        self.input_boxes = [self.min_size, self.max_size, self.max_rooms, self.seed]
 
         dir_name = os.path.dirname(__file__)
         font_path = os.path.join(dir_name, "assets", "fonts", "PressStart2P-Regular.ttf")
@@ -81,10 +92,11 @@ class InputPopup:
         self.min_size_text = self.main_font.render("MIN ROOM SIZE:", True, (255, 255, 255))
         self.max_size_text = self.main_font.render("MAX ROOM SIZE:", True, (255, 255, 255))
         self.max_rooms_text = self.main_font.render("ROOM AMOUNT:", True, (255, 255, 255))
+        self.seed_text = self.main_font.render("SEED:", True, (255, 255, 255))
 
         self.done_button_rect = pygame.Rect(
             self.popup_rect.x + (POPUP_WIDTH // 2 - 200 // 2),
-            self.popup_rect.y + 220,
+            self.popup_rect.y + 270,
             200,
             50
         )
@@ -122,6 +134,9 @@ class InputPopup:
         max_size = self.max_size.get_input_value()
         max_rooms = self.max_rooms.get_input_value()
 
+        # An empty seed means that a random seed is used
+        seed = self.seed.get_input_value() if self.seed.text else None
+
         if min_size > max_size:
             self.min_size.invalid_input = True
             self.max_size.invalid_input = True
@@ -139,7 +154,7 @@ class InputPopup:
             self.max_rooms.invalid_input]
         ):
             self.popup_active = False
-            return min_size, max_size, max_rooms
+            return min_size, max_size, max_rooms, seed
 
         return None
 
@@ -160,6 +175,7 @@ class InputPopup:
             display.blit(self.min_size_text, (self.popup_rect.x + 55, self.popup_rect.y + 60))
             display.blit(self.max_size_text, (self.popup_rect.x + 55, self.popup_rect.y + 110))
             display.blit(self.max_rooms_text, (self.popup_rect.x + 55, self.popup_rect.y + 160))
+            display.blit(self.seed_text, (self.popup_rect.x + 55, self.popup_rect.y + 210))
 
             pygame.draw.rect(display, (37, 19, 26), self.done_button_rect)
             display.blit(self.done_button_text, self.done_text_rect)
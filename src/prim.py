@@ -38,11 +38,23 @@ class Prim:
 
         return math.sqrt((v1[0] - v2[0])**2 + (v1[1] - v2[1])**2)
 
-    def create_mst(self):
-        """A method that creates the Minimum Spanning Tree."""
+    def create_mst(self, rng=None):
+        """A method that creates the Minimum Spanning Tree.
+
+        Args:
+            rng: Random number generator used to choose the starting vertex,
+                defaults to the global random module.
+        """
+
+        if rng is None:
+            rng = random
+
+        if not self.vertices:
+            return set()
 
         # Choose a random starting vertex
-        start_vertex = random.choice(list(self.vertices))
+        # Sort the vertices so that the choice only depends on the generator state
+        start_vertex = rng.choice(sorted(self.vertices))
 
         explored_vertices = set()
         unexplored_vertices = set(self.vertices)
@@ -82,9 +94,82 @@ class Prim:
 
         return mst_edges
 
-def add_random_edges(chance, mst_edges, triangles):
+    def create_graph_mst(self, graph, rng=None):
+        """A method that creates the Minimum Spanning Tree of a room graph.
+
+        The method works like create_mst, but uses the vertex indices, neighbor arrays
+            and precomputed edge weights of the graph.
+
+        Args:
+            graph: RoomGraph object of the triangulation.
+            rng: Random number generator used to choose the starting vertex,
+                defaults to the global random module.
+
+        Returns:
+            A set of the edge indices of the Minimum Spanning Tree.
+        """
+
+        if rng is None:
+            rng = random
+
+        connected_vertices = [i for i in range(graph.vertex_count()) if graph.get_degree(i)]
+
+        if not connected_vertices:
+            return set()
+
+        # The vertex indices are in sorted order, so the choice is the same as in create_mst
+        start_vertex = rng.choice(connected_vertices)
+
+        explored_vertices = bytearray(graph.vertex_count())
+        explored_vertices[start_vertex] = 1
+        unexplored_count = len(connected_vertices) - 1
+
+        possible_edges = []
+        push_graph_edges(possible_edges, graph, start_vertex, explored_vertices)
+
+        mst_edges = set()
+
+        while possible_edges and unexplored_count:
+            _, _, next_vertex, edge = heapq.heappop(possible_edges)
+
+            if not explored_vertices[next_vertex]:
+                mst_edges.add(edge)
+                explored_vertices[next_vertex] = 1
+                unexplored_count -= 1
+
+                push_graph_edges(possible_edges, graph, next_vertex, explored_vertices)
+
+        return mst_edges
+
+def push_graph_edges(possible_edges, graph, vertex, explored_vertices):
+    """A function that pushes the edges from a vertex to its unexplored neighbors
+        to the priority queue of possible edges."""
+
+    weights = graph.weights
+    adjacent_vertices = graph.adjacent_vertices
+    adjacent_edges = graph.adjacent_edges
+
+    for slot in range(graph.offsets[vertex], graph.offsets[vertex + 1]):
+        neighbor = adjacent_vertices[slot]
+
+        if not explored_vertices[neighbor]:
+            edge = adjacent_edges[slot]
+            heapq.heappush(possible_edges, (weights[edge], vertex, neighbor, edge))
+
+def add_random_edges(chance, mst_edges, triangles, rng=None):
     """A function that adds random extra edges from the triangulation to the set of edges
-        to introduce cycles to the dungeon."""
+        to introduce cycles to the dungeon.
+
+    Args:
+        chance: Chance in percent of adding each extra edge.
+        mst_edges: Edges of the Minimum Spanning Tree.
+        triangles: Triangles of the Delaunay triangulation.
+        rng: Random number generator used to choose the edges,
+            defaults to the global random module.
+    """
+
+    if rng is None:
+        rng = random
 
     bw_edges = set()
     extra_edges = set()
@@ -94,8 +179,38 @@ def add_random_edges(chance, mst_edges, triangles):
             if edge not in mst_edges:
                 bw_edges.add(edge)
 
-    for edge in bw_edges:
-        if random.randint(1, 100) <= chance:
+    # Sort the edges so that the chosen edges only depend on the generator state
+    for edge in sorted(bw_edges):
+        if rng.randint(1, 100) <= chance:
+            extra_edges.add(edge)
+
+    return extra_edges
+
+def add_random_graph_edges(chance, mst_edges, graph, rng=None):
+    """A function that adds random extra edges from a room graph to the set of edges
+        to introduce cycles to the dungeon.
+
+    The function works like add_random_edges, but uses the edge indices of the graph.
+
+    Args:
+        chance: Chance in percent of adding each extra edge.
+        mst_edges: Edge indices of the Minimum Spanning Tree.
+        graph: RoomGraph object of the triangulation.
+        rng: Random number generator used to choose the edges,
+            defaults to the global random module.
+
+    Returns:
+        A set of the edge indices of the extra edges.
+    """
+
+    if rng is None:
+        rng = random
+
+    extra_edges = set()
+
+    # The edges of the graph are sorted, so the chosen edges are the same as in add_random_edges
+    for edge in range(graph.edge_count()):
+        if edge not in mst_edges and rng.randint(1, 100) <= chance:
             extra_edges.add(edge)
 
     return extra_edges
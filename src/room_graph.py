@@ -0,0 +1,113 @@
+import math
+from array import array
+from bowyer_watson import Edge
+from triangulation import CompactTriangulation
+
+class RoomGraph:
+    """A class that stores the weighted graph of the triangulation edges between the rooms.
+
+    The graph is built once after the triangulation and shared by the later stages.
+        The vertices are numbered in sorted order and the edges are sorted in the same
+        order as Edge objects, so the stages give the same results as with Edge sets.
+        The neighbors of each vertex are stored in compressed sparse row arrays: the
+        neighbors of vertex i are at indices offsets[i] to offsets[i + 1] - 1."""
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, room_centers, triangles):
+        """A constructor that builds the graph from the triangles.
+
+        Args:
+            room_centers: Center of each room in pixel coordinates.
+            triangles: Triangles of the Delaunay triangulation of the room centers.
+        """
+
+        self.vertices = sorted(set(room_centers))
+        self.vertex_indices = {vertex: i for i, vertex in enumerate(self.vertices)}
+
+        # Room index of each vertex
+        self.vertex_rooms = array("l", [0] * len(self.vertices))
+        for room_index, center in enumerate(room_centers):
+            self.vertex_rooms[self.vertex_indices[center]] = room_index
+
+        # The unique edges of the triangles as vertex index pairs with the smaller index
+        # first, sorted like Edge objects as the vertices are numbered in sorted order
+        compact = CompactTriangulation.from_triangles(self.vertices, triangles)
+        self.edge_starts = compact.edges[0::2]
+        self.edge_ends = compact.edges[1::2]
+
+        # Every edge goes from the smaller vertex to the larger one,
+        # so the corridors are always carved in the same direction
+        self.edges = [
+            Edge(self.vertices[start], self.vertices[end])
+            for start, end in zip(self.edge_starts, self.edge_ends)
+        ]
+
+        # Weight of each edge
+        self.weights = array("d", [
+            math.sqrt((edge.v1[0] - edge.v2[0])**2 + (edge.v1[1] - edge.v2[1])**2)
+            for edge in self.edges
+        ])
+
+        self._build_adjacency()
+
+    def _build_adjacency(self):
+        """A method that builds the compressed sparse row arrays of the neighbors."""
+
+        vertex_count = len(self.vertices)
+
+        # Count the neighbors of each vertex and turn the counts into start offsets
+        self.offsets = array("l", [0] * (vertex_count + 1))
+        for i in range(len(self.edges)):
+            self.offsets[self.edge_starts[i] + 1] += 1
+            self.offsets[self.edge_ends[i] + 1] += 1
+
+        for i in range(vertex_count):
+            self.offsets[i + 1] += self.offsets[i]
+
+        # Neighbor vertex and connecting edge of each adjacency entry
+        self.adjacent_vertices = array("l", [0] * self.offsets[vertex_count])
+        self.adjacent_edges = array("l", [0] * self.offsets[vertex_count])
+
+        next_slot = array("l", self.offsets[:vertex_count])
+        for i in range(len(self.edges)):
+            for vertex, neighbor in ((self.edge_starts[i], self.edge_ends[i]),
+                                     (self.edge_ends[i], self.edge_starts[i])):
+                slot = next_slot[vertex]
+                self.adjacent_vertices[slot] = neighbor
+                self.adjacent_edges[slot] = i
+                next_slot[vertex] += 1
+
+    def vertex_count(self):
+        """A method that returns the number of vertices."""
+
+        return len(self.vertices)
+
+    def edge_count(self):
+        """A method that returns the number of edges."""
+
+        return len(self.edges)
+
+    def get_degree(self, vertex_index):
+        """A method that returns the number of neighbors of a vertex."""
+
+        return self.offsets[vertex_index + 1] - self.offsets[vertex_index]
+
+    def get_neighbors(self, vertex_index):
+        """A method that returns (neighbor vertex index, edge index) pairs of a vertex."""
+
+        start, end = self.offsets[vertex_index], self.offsets[vertex_index + 1]
+
+        return list(zip(self.adjacent_vertices[start:end], self.adjacent_edges[start:end]))
+
+    def get_edge_rooms(self, edge_index):
+        """A method that returns the indices of the two rooms connected by an edge."""
+
+        return (
+            self.vertex_rooms[self.edge_starts[edge_index]],
+            self.vertex_rooms[self.edge_ends[edge_index]]
+        )
+
+    def get_edges(self, edge_indices):
+        """A method that returns the edges with the given indices as a set of Edge objects."""
+
+        return {self.edges[i] for i in edge_indices}
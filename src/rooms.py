@@ -1,6 +1,5 @@
 import random
-import pygame
-from config import TILE_SIZE
+from array import array
 
 class Room:
     """A class to represent a room consisting of tiles."""
@@ -20,16 +19,82 @@ class Room:
         self.tile_width = tile_width
         self.tile_height = tile_height
 
-        # Convert tile coordinates into pixel coordinates
-        self.room_rect = pygame.Rect(
-            tile_x * TILE_SIZE,
-            tile_y * TILE_SIZE,
-            tile_width * TILE_SIZE,
-            tile_height * TILE_SIZE
+    def overlaps(self, other, margin=0):
+        """A method that checks whether the room, extended by the given margin
+            on every side, overlaps with another room."""
+
+        return (
+            self.tile_x - margin < other.tile_x + other.tile_width and
+            other.tile_x < self.tile_x + self.tile_width + margin and
+            self.tile_y - margin < other.tile_y + other.tile_height and
+            other.tile_y < self.tile_y + self.tile_height + margin
+        )
+
+    def get_center(self, tile_size):
+        """A method that returns the center of the room in pixel coordinates."""
+
+        center_x = self.tile_x * tile_size + self.tile_width * tile_size // 2
+        center_y = self.tile_y * tile_size + self.tile_height * tile_size // 2
+        return (center_x, center_y)
+
+class RoomIndex:
+    """A class that stores rooms in the buckets of a uniform grid to find
+        overlapping rooms without checking every placed room."""
+
+    def __init__(self, cell_size):
+        """A constructor that initializes an empty index.
+
+        Args:
+            cell_size: Width and height of a bucket in tile units.
+        """
+
+        self.cell_size = cell_size
+        self.buckets = {}
+
+    def get_cells(self, tile_x, tile_y, tile_width, tile_height):
+        """A method that returns the buckets covered by an area in tile units."""
+
+        first_x = tile_x // self.cell_size
+        first_y = tile_y // self.cell_size
+        last_x = (tile_x + tile_width - 1) // self.cell_size
+        last_y = (tile_y + tile_height - 1) // self.cell_size
+
+        cells = []
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                cells.append((cell_x, cell_y))
+
+        return cells
+
+    def add(self, room):
+        """A method that adds a room to every bucket it covers."""
+
+        for cell in self.get_cells(room.tile_x, room.tile_y, room.tile_width, room.tile_height):
+            if cell not in self.buckets:
+                self.buckets[cell] = []
+            self.buckets[cell].append(room)
+
+    def overlaps(self, new_room, margin):
+        """A method that checks whether a room, extended by the given margin,
+            overlaps with any room in the index."""
+
+        cells = self.get_cells(
+            new_room.tile_x - margin,
+            new_room.tile_y - margin,
+            new_room.tile_width + 2 * margin,
+            new_room.tile_height + 2 * margin
         )
 
-# pylint: disable=too-many-positional-arguments,too-many-locals
-def generate_rooms(grid_width, grid_height, min_size, max_size, max_rooms, margin):
+        for cell in cells:
+            for room in self.buckets.get(cell, ()):
+                if new_room.overlaps(room, margin):
+                    return True
+
+        return False
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def generate_rooms(grid_width, grid_height, min_size, max_size, max_rooms, margin, rng=None,
+                   stats=None):
     """A function that randomly generates rooms on a grid.
 
     Args:
@@ -42,39 +107,193 @@ def generate_rooms(grid_width, grid_height, min_size, max_size, max_rooms, margi
         max_rooms: Number of rooms to try to place.
         margin: Minimum number of empty tiles around each room.
 
+        rng: Random number generator used for the room sizes and positions,
+            defaults to the global random module.
+        stats: GenerationStats object that counts the tries and the rejected rooms.
+
     Returns:
         A list of Room objects with valid placements.
     """
 
+    if rng is None:
+        rng = random
+
     rooms = []
 
+    # Buckets at least as large as a room with its margins make each overlap check
+    # look at only a few nearby rooms
+    room_index = RoomIndex(max_size + 2 * margin)
+
     tries = 0
     max_tries = max_rooms * 50 # Cap the number of tries to prevent infinite loops
 
     while len(rooms) < max_rooms and tries < max_tries:
-        tile_width = random.randint(min_size, max_size)
-        tile_height = random.randint(min_size, max_size)
+        tile_width = rng.randint(min_size, max_size)
+        tile_height = rng.randint(min_size, max_size)
 
-        tile_x = random.randint(margin, grid_width - tile_width - margin)
-        tile_y = random.randint(margin, grid_height - tile_height - margin)
+        tile_x = rng.randint(margin, grid_width - tile_width - margin)
+        tile_y = rng.randint(margin, grid_height - tile_height - margin)
 
         new_room = Room(tile_x, tile_y, tile_width, tile_height)
 
-        # Check if the new room overlaps with any existing rooms
-        rect_with_margin = new_room.room_rect.inflate(
-            2 * margin * TILE_SIZE, 2 * margin * TILE_SIZE
+        # Generate room if it does not overlap with any existing rooms
+        if not room_index.overlaps(new_room, margin):
+            rooms.append(new_room)
+            room_index.add(new_room)
+
+        tries += 1
+
+    if stats is not None:
+        stats.count("room_tries", tries)
+        stats.count("rejected_rooms", tries - len(rooms))
+
+    return rooms
+
+class FreePositions:
+    """A class that keeps track of the top-left positions where a room of the minimum size
+        can still be placed, so that positions can be sampled without rejected tries."""
+
+    # pylint: disable=too-many-positional-arguments
+    def __init__(self, grid_width, grid_height, min_size, margin):
+        """A constructor that marks every position inside the grid margins as free.
+
+        Args:
+            grid_width: Dungeon width in tile units.
+            grid_height: Dungeon height in tile units.
+            min_size: Minimum room size in tile units.
+            margin: Minimum number of empty tiles around each room.
+        """
+
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.min_size = min_size
+        self.margin = margin
+
+        # Positions are stored as y * grid_width + x, and each free position
+        # stores its index in the list of positions so it can be removed in O(1)
+        self.positions = array("l")
+        self.slots = array("l", [-1]) * (grid_width * grid_height)
+
+        for tile_y in range(margin, grid_height - min_size - margin + 1):
+            for tile_x in range(margin, grid_width - min_size - margin + 1):
+                position = tile_y * grid_width + tile_x
+                self.slots[position] = len(self.positions)
+                self.positions.append(position)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def sample(self, rng):
+        """A method that returns a random free position in tile units."""
+
+        position = self.positions[rng.randrange(len(self.positions))]
+        return position % self.grid_width, position // self.grid_width
+
+    def remove(self, tile_x, tile_y):
+        """A method that removes a position from the free positions if it is free."""
+
+        position = tile_y * self.grid_width + tile_x
+        slot = self.slots[position]
+
+        if slot == -1:
+            return
+
+        # Move the last position into the slot of the removed position
+        last_position = self.positions.pop()
+        if last_position != position:
+            self.positions[slot] = last_position
+            self.slots[last_position] = slot
+
+        self.slots[position] = -1
+
+    def add_room(self, room):
+        """A method that removes the positions where a room of the minimum size
+            would overlap with the given room or its margin."""
+
+        reach = self.min_size + self.margin - 1
+
+        first_x = max(self.margin, room.tile_x - reach)
+        first_y = max(self.margin, room.tile_y - reach)
+        last_x = min(
+            self.grid_width - self.min_size - self.margin,
+            room.tile_x + room.tile_width + self.margin - 1
+        )
+        last_y = min(
+            self.grid_height - self.min_size - self.margin,
+            room.tile_y + room.tile_height + self.margin - 1
         )
 
-        overlaps = False
-        for room in rooms:
-            if rect_with_margin.colliderect(room.room_rect):
-                overlaps = True
-                break
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                self.remove(tile_x, tile_y)
 
-        # Generate room if no collisions were found
-        if overlaps is False:
-            rooms.append(new_room)
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def generate_rooms_free(grid_width, grid_height, min_size, max_size, max_rooms, margin,
+                        rng=None, stats=None):
+    """A function that generates rooms on a grid by sampling only free positions.
 
-        tries += 1
+    Every try places a room: the position is sampled from the positions where a room
+        of the minimum size still fits, and the randomly chosen room size is shrunk
+        until the room fits. Rooms are placed until max_rooms rooms have been placed
+        or the grid is full.
+
+    Args:
+        grid_width: Dungeon width in tile units.
+        grid_height: Dungeon height in tile units.
+
+        min_size: Minimum room size in tile units.
+        max_size: Maximum room size in tile units.
+
+        max_rooms: Number of rooms to try to place.
+        margin: Minimum number of empty tiles around each room.
+
+        rng: Random number generator used for the room sizes and positions,
+            defaults to the global random module.
+        stats: GenerationStats object that counts the tries and the shrinking steps
+            of the rooms that did not fit.
+
+    Returns:
+        A list of Room objects with valid placements.
+    """
+
+    if rng is None:
+        rng = random
+
+    rooms = []
+    shrink_steps = 0
+
+    room_index = RoomIndex(max_size + 2 * margin)
+    free_positions = FreePositions(grid_width, grid_height, min_size, margin)
+
+    while len(rooms) < max_rooms and free_positions:
+        tile_x, tile_y = free_positions.sample(rng)
+
+        tile_width = min(rng.randint(min_size, max_size), grid_width - tile_x - margin)
+        tile_height = min(rng.randint(min_size, max_size), grid_height - tile_y - margin)
+
+        new_room = Room(tile_x, tile_y, tile_width, tile_height)
+
+        # Shrink the room until it fits, a room of the minimum size always fits
+        while room_index.overlaps(new_room, margin):
+            if new_room.tile_width >= new_room.tile_height and new_room.tile_width > min_size:
+                new_room.tile_width -= 1
+            else:
+                new_room.tile_height -= 1
+
+            shrink_steps += 1
+
+        rooms.append(new_room)
+        room_index.add(new_room)
+        free_positions.add_room(new_room)
+
+    if stats is not None:
+        stats.count("room_tries", len(rooms))
+        stats.count("room_shrink_steps", shrink_steps)
 
     return rooms
+
+# Room placement functions by placement mode
+PLACEMENT_MODES = {
+    "random": generate_rooms,
+    "free": generate_rooms_free
+}
@@ -0,0 +1,164 @@
+from bowyer_watson import Triangle, orientation
+
+def in_circumcircle(v1, v2, v3, vertex):
+    """A function that checks whether a vertex is inside the circumcircle of a triangle
+        whose vertices are in counterclockwise order."""
+
+    ax, ay = v1[0] - vertex[0], v1[1] - vertex[1]
+    bx, by = v2[0] - vertex[0], v2[1] - vertex[1]
+    cx, cy = v3[0] - vertex[0], v3[1] - vertex[1]
+
+    determinant = (
+        (ax * ax + ay * ay) * (bx * cy - cx * by) -
+        (bx * bx + by * by) * (ax * cy - cx * ay) +
+        (cx * cx + cy * cy) * (ax * by - bx * ay)
+    )
+
+    return determinant > 0
+
+class SweepHull:
+    """A class that implements a sweep-hull algorithm for the Delaunay triangulation.
+
+    The vertices are added in sorted order, so each new vertex lies outside the convex hull
+        of the previous vertices and is connected to the hull edges it can see. Edges that
+        break the Delaunay condition are then flipped until the triangulation is valid."""
+
+    def __init__(self):
+        """A constructor that initializes the triangulation and the convex hull."""
+
+        # Third vertex of the counterclockwise triangle on the left side of each directed edge
+        self.half_edges = {}
+
+        # Next and previous vertex of each vertex on the convex hull in counterclockwise order
+        self.next_vertex = {}
+        self.prev_vertex = {}
+
+        # Number of flipped edges and the GenerationStats object they are counted in,
+        # None if they are not counted
+        self.flips = 0
+        self.stats = None
+
+    def triangulate(self, vertices):
+        """A method that performs the Delaunay triangulation for the given vertices."""
+
+        self.half_edges = {}
+        self.next_vertex = {}
+        self.prev_vertex = {}
+        self.flips = 0
+
+        sorted_vertices = sorted({(v[0], v[1]) for v in vertices})
+
+        # Skip the vertices that are on the same line as the first two vertices
+        first_index = 2
+        while (first_index < len(sorted_vertices) and
+               orientation(sorted_vertices[0], sorted_vertices[1],
+                           sorted_vertices[first_index]) == 0):
+            first_index += 1
+
+        if first_index >= len(sorted_vertices):
+            return []
+
+        self.create_first_triangles(sorted_vertices[:first_index], sorted_vertices[first_index])
+
+        for i in range(first_index + 1, len(sorted_vertices)):
+            self.add_vertex(sorted_vertices[i], sorted_vertices[i - 1])
+
+        if self.stats is not None:
+            self.stats.count("edge_flips", self.flips)
+
+        return self.get_triangles()
+
+    def create_first_triangles(self, line_vertices, vertex):
+        """A method that connects a vertex to a line of sorted collinear vertices
+            and creates the first convex hull."""
+
+        left_side = orientation(line_vertices[0], line_vertices[-1], vertex) > 0
+
+        for start, end in zip(line_vertices, line_vertices[1:]):
+            if left_side:
+                self.add_triangle(start, end, vertex)
+            else:
+                self.add_triangle(end, start, vertex)
+
+        hull = line_vertices + [vertex] if left_side else [vertex] + line_vertices[::-1]
+
+        for start, end in zip(hull, hull[1:] + hull[:1]):
+            self.next_vertex[start] = end
+            self.prev_vertex[end] = start
+
+    def add_vertex(self, vertex, last_vertex):
+        """A method that connects a new vertex to the convex hull edges it can see.
+
+        The previous vertex in sorted order is always on the convex hull next to
+            the edges that the new vertex can see."""
+
+        # Walk forward along the hull while the edges are visible from the new vertex
+        end = last_vertex
+        while orientation(end, self.next_vertex[end], vertex) < 0:
+            hull_next = self.next_vertex[end]
+            self.add_triangle(end, vertex, hull_next)
+            self.legalize_edge(vertex, hull_next, end)
+            end = hull_next
+
+        # Walk backward along the hull while the edges are visible from the new vertex
+        start = last_vertex
+        while orientation(self.prev_vertex[start], start, vertex) < 0:
+            hull_prev = self.prev_vertex[start]
+            self.add_triangle(hull_prev, vertex, start)
+            self.legalize_edge(vertex, start, hull_prev)
+            start = hull_prev
+
+        # Replace the visible edges with the two edges to the new vertex
+        self.next_vertex[start] = vertex
+        self.prev_vertex[vertex] = start
+        self.next_vertex[vertex] = end
+        self.prev_vertex[end] = vertex
+
+    def add_triangle(self, v1, v2, v3):
+        """A method that adds a triangle whose vertices are in counterclockwise order."""
+
+        self.half_edges[(v1, v2)] = v3
+        self.half_edges[(v2, v3)] = v1
+        self.half_edges[(v3, v1)] = v2
+
+    def legalize_edge(self, vertex, start, end):
+        """A method that flips the edges opposite to a new vertex until they
+            meet the Delaunay condition.
+
+        Args:
+            vertex: The new vertex.
+            start: First vertex of the edge in the counterclockwise triangle (start, end, vertex).
+            end: Second vertex of the edge.
+        """
+
+        stack = [(start, end)]
+
+        while stack:
+            start, end = stack.pop()
+            opposite = self.half_edges.get((end, start))
+
+            if opposite is None or not in_circumcircle(start, end, vertex, opposite):
+                continue
+
+            # Replace the edge with an edge between the new vertex and the opposite vertex
+            del self.half_edges[(start, end)]
+            del self.half_edges[(end, start)]
+
+            self.add_triangle(start, opposite, vertex)
+            self.add_triangle(opposite, end, vertex)
+            self.flips += 1
+
+            stack.append((start, opposite))
+            stack.append((opposite, end))
+
+    def get_triangles(self):
+        """A method that returns the triangles of the triangulation as Triangle objects."""
+
+        triangles = []
+
+        for (v1, v2), v3 in self.half_edges.items():
+            # Every triangle is stored once for each of its edges
+            if v1 < v2 and v1 < v3:
+                triangles.append(Triangle(v1, v2, v3))
+
+        return triangles
@@ -1,5 +1,13 @@
+import random
 import unittest
-from a_star import Vertex, AStar
+from a_star import Vertex, Pathfinder, AStar, FastAStar, MultiTargetAStar
+from generation_stats import GenerationStats
+from tile_grid import TileGrid
+
+class TestPathfinder(unittest.TestCase):
+    def test_pathfinder_without_find_path_cannot_be_created(self):
+        with self.assertRaises(TypeError):
+            Pathfinder()
 
 class TestAStar(unittest.TestCase):
     def setUp(self):
@@ -46,4 +54,150 @@ class TestAStar(unittest.TestCase):
         self.assertEqual(self.a_star.get_tile_cost(0), 1)
         self.assertEqual(self.a_star.get_tile_cost(1), 10)
         self.assertEqual(self.a_star.get_tile_cost(2), 50)
+        self.assertEqual(self.a_star.get_tile_cost(3), 0)
         self.assertEqual(self.a_star.get_tile_cost(100), float("inf"))
+
+class TestFastAStar(unittest.TestCase):
+    def setUp(self):
+        self.fast_a_star = FastAStar()
+
+        # Random rooms surrounded by walls on an empty grid
+        rng = random.Random(6)
+        self.grid = TileGrid(40, 30)
+        for _ in range(12):
+            x, y = rng.randint(0, 32), rng.randint(0, 22)
+            self.grid.fill_rect(x, y, 7, 7, 2)
+            self.grid.fill_rect(x + 1, y + 1, 5, 5, 1)
+
+    def get_path_cost(self, path):
+        costs = {0: 2, 1: 11, 2: 51}
+        return sum(costs[self.grid.get(x, y)] for x, y in path[1:])
+
+    def test_path_from_start_to_goal_found(self):
+        path = self.fast_a_star.find_path((1, 1), (5, 5), [[0] * 10 for _ in range(10)])
+
+        self.assertEqual(path[0], (1, 1))
+        self.assertEqual(path[-1], (5, 5))
+        self.assertEqual(len(path), 9)
+
+    def test_start_and_goal_with_same_position(self):
+        self.assertEqual(self.fast_a_star.find_path((1, 1), (1, 1), self.grid), [(1, 1)])
+
+    def test_no_path_when_goal_out_of_reach(self):
+        self.assertIsNone(self.fast_a_star.find_path((1, 1), (100, 100), self.grid))
+
+    def test_no_path_through_blocked_tiles(self):
+        grid = TileGrid(5, 5)
+        grid.fill_rect(2, 0, 1, 5, 9)
+
+        self.assertIsNone(self.fast_a_star.find_path((0, 0), (4, 4), grid))
+
+    def test_path_moves_one_tile_at_a_time(self):
+        path = self.fast_a_star.find_path((0, 0), (39, 29), self.grid)
+
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+
+    def test_same_path_cost_as_a_star(self):
+        a_star = AStar()
+        rng = random.Random(8)
+
+        for _ in range(20):
+            start_pos = (rng.randrange(40), rng.randrange(30))
+            goal_pos = (rng.randrange(40), rng.randrange(30))
+
+            path = self.fast_a_star.find_path(start_pos, goal_pos, self.grid)
+            expected_path = a_star.find_path(start_pos, goal_pos, self.grid)
+
+            self.assertEqual((path[0], path[-1]), (start_pos, goal_pos))
+            self.assertEqual(self.get_path_cost(path), self.get_path_cost(expected_path))
+
+    def test_search_counts_recorded_when_stats_collected(self):
+        self.fast_a_star.stats = GenerationStats()
+
+        self.fast_a_star.find_path((0, 0), (5, 0), TileGrid(10, 10))
+        self.fast_a_star.find_path((0, 0), (20, 20), TileGrid(10, 10))
+
+        # The straight path is found without expanding any other tiles
+        self.assertEqual(
+            self.fast_a_star.stats.counters,
+            {"searches": 1, "expanded_nodes": 5, "heap_pushes": 11}
+        )
+
+    def test_heuristic_weight_lowered_on_corridor_tiles(self):
+        self.assertEqual(self.fast_a_star.get_heuristic_weight(self.grid), 2)
+
+        self.grid.set(0, 0, 3)
+
+        self.assertEqual(self.fast_a_star.get_heuristic_weight(self.grid), 1)
+
+    def test_same_path_cost_as_a_star_with_corridor_tiles(self):
+        a_star = AStar()
+        rng = random.Random(11)
+
+        # Corridors that cross the grid and the rooms
+        self.grid.fill_rect(0, 14, 40, 1, 3)
+        self.grid.fill_rect(20, 0, 1, 30, 3)
+        costs = {0: 2, 1: 11, 2: 51, 3: 1}
+
+        for _ in range(20):
+            start_pos = (rng.randrange(40), rng.randrange(30))
+            goal_pos = (rng.randrange(40), rng.randrange(30))
+
+            path = self.fast_a_star.find_path(start_pos, goal_pos, self.grid)
+            expected_path = a_star.find_path(start_pos, goal_pos, self.grid)
+
+            self.assertEqual(
+                sum(costs[self.grid.get(x, y)] for x, y in path[1:]),
+                sum(costs[self.grid.get(x, y)] for x, y in expected_path[1:])
+            )
+
+class TestMultiTargetAStar(unittest.TestCase):
+    def setUp(self):
+        self.multi_target = MultiTargetAStar()
+
+        rng = random.Random(9)
+        self.grid = TileGrid(40, 30)
+        for _ in range(12):
+            x, y = rng.randint(0, 32), rng.randint(0, 22)
+            self.grid.fill_rect(x, y, 7, 7, 2)
+            self.grid.fill_rect(x + 1, y + 1, 5, 5, 1)
+
+    def get_path_cost(self, path):
+        costs = {0: 2, 1: 11, 2: 51}
+        return sum(costs[self.grid.get(x, y)] for x, y in path[1:])
+
+    def test_same_path_costs_as_single_searches(self):
+        fast_a_star = FastAStar()
+        rng = random.Random(10)
+
+        for _ in range(10):
+            start_pos = (rng.randrange(40), rng.randrange(30))
+            goal_positions = [(rng.randrange(40), rng.randrange(30)) for _ in range(5)]
+
+            paths = self.multi_target.find_paths(start_pos, goal_positions, self.grid)
+
+            for goal_pos, path in zip(goal_positions, paths):
+                expected_path = fast_a_star.find_path(start_pos, goal_pos, self.grid)
+
+                self.assertEqual((path[0], path[-1]), (start_pos, goal_pos))
+                self.assertEqual(self.get_path_cost(path), self.get_path_cost(expected_path))
+
+    def test_unreachable_goals_have_no_path(self):
+        grid = TileGrid(6, 5)
+        grid.fill_rect(3, 0, 1, 5, 9)
+
+        paths = self.multi_target.find_paths((0, 0), [(5, 4), (2, 2), (10, 10)], grid)
+
+        self.assertIsNone(paths[0])
+        self.assertEqual(paths[1][-1], (2, 2))
+        self.assertIsNone(paths[2])
+
+    def test_duplicate_goals_get_same_path(self):
+        paths = self.multi_target.find_paths((1, 1), [(8, 8), (3, 3), (8, 8)], self.grid)
+
+        self.assertEqual(paths[0], paths[2])
+
+    def test_single_path_found(self):
+        self.assertEqual(self.multi_target.find_path((2, 2), (2, 2), self.grid), [(2, 2)])
+        self.assertEqual(len(self.multi_target.find_path((0, 0), (3, 4), self.grid)), 8)
@@ -0,0 +1,82 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+import batch
+from dungeon import DungeonGenerator
+from dungeon_file import load_dungeon
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.output_dir = os.path.join(self.temp_dir.name, "dungeons")
+        self.options = {"grid_width": 45, "grid_height": 30, "tile_size": 16}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_same_dungeon(self, dungeon, expected):
+        self.assertEqual(dungeon.seed, expected.seed)
+        self.assertEqual(dungeon.room_centers, expected.room_centers)
+        self.assertEqual(dungeon.mst_edges, expected.mst_edges)
+        self.assertEqual(bytes(dungeon.tiles.cells), bytes(expected.tiles.cells))
+        self.assertEqual(dungeon.corridor_map, expected.corridor_map)
+
+    def test_dungeon_written_for_every_seed(self):
+        results = batch.generate_batch(range(5, 8), 3, 10, 12, self.output_dir, self.options)
+
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            ["dungeon_5.dungeon", "dungeon_6.dungeon", "dungeon_7.dungeon"]
+        )
+
+        for seed, (room_count, file_size) in zip(range(5, 8), results):
+            path = batch.get_dungeon_path(self.output_dir, seed)
+
+            self.assertEqual(room_count, len(load_dungeon(path).rooms))
+            self.assertEqual(file_size, os.path.getsize(path))
+
+    def test_saved_dungeon_same_as_generated_dungeon(self):
+        batch.generate_batch([4], 3, 10, 12, self.output_dir, self.options)
+
+        dungeon = load_dungeon(batch.get_dungeon_path(self.output_dir, 4))
+        expected = DungeonGenerator(**self.options).generate(3, 10, 12, seed=4)
+
+        self.assert_same_dungeon(dungeon, expected)
+
+    def test_workers_generate_same_dungeons(self):
+        results = batch.generate_batch(
+            range(4), 3, 10, 12, self.output_dir, self.options, workers=2
+        )
+        generator = DungeonGenerator(**self.options)
+
+        self.assertEqual(len(results), 4)
+
+        for seed in range(4):
+            dungeon = load_dungeon(batch.get_dungeon_path(self.output_dir, seed))
+            self.assert_same_dungeon(dungeon, generator.generate(3, 10, 12, seed=seed))
+
+    def test_main_prints_throughput(self):
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            batch.main([
+                "3", "--start-seed", "10", "--output", self.output_dir, "--workers", "1",
+                "--grid-width", "45", "--grid-height", "30", "--max-rooms", "8"
+            ])
+
+        self.assertIn("Generated 3 dungeons", output.getvalue())
+        self.assertIn("dungeons/s", output.getvalue())
+        self.assertEqual(len(os.listdir(self.output_dir)), 3)
+
+    def test_invalid_arguments_rejected(self):
+        for arguments in (["0"], ["1", "--min-size", "5", "--max-size", "4"],
+                          ["1", "--pathfinder", "unknown"], ["1", "--start-seed", "-5"],
+                          ["2", "--start-seed", str(2**64 - 1)],
+                          ["1", "--max-size", "10", "--grid-width", "15"],
+                          ["1", "--max-size", "10", "--grid-height", "15"]):
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                batch.main(arguments + ["--output", self.output_dir])
+
+        self.assertFalse(os.path.exists(self.output_dir))
@@ -0,0 +1,128 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from benchmarks import suite
+from dungeon import Dungeon, DungeonGenerator
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "baseline.json")
+
+        self.generator_options = {
+            "placement": "random",
+            "triangulator": "bowyer_watson",
+            "mst_algorithm": "prim",
+            "pathfinder": "a_star"
+        }
+        self.baseline = {
+            "walls 45x30 12 rooms seed 0": {"seconds": 0.01, "peak_kib": 100},
+            "corridors 45x30 12 rooms seed 0": {"seconds": 0.05, "peak_kib": None}
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_main(self, arguments):
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            return suite.main(arguments)
+
+    def test_no_regressions_within_threshold(self):
+        results = {
+            "walls 45x30 12 rooms seed 0": {"seconds": 0.012, "peak_kib": 120},
+            "corridors 45x30 12 rooms seed 0": {"seconds": 0.06, "peak_kib": 500}
+        }
+
+        self.assertEqual(suite.compare_results(results, self.baseline, 1.25), [])
+
+    def test_regressions_above_threshold_found(self):
+        results = {
+            "walls 45x30 12 rooms seed 0": {"seconds": 0.02, "peak_kib": 300},
+            "corridors 45x30 12 rooms seed 0": {"seconds": 0.05, "peak_kib": None}
+        }
+
+        self.assertEqual(
+            suite.compare_results(results, self.baseline, 1.25),
+            [
+                ("walls 45x30 12 rooms seed 0", "seconds", 0.01, 0.02),
+                ("walls 45x30 12 rooms seed 0", "peak_kib", 100, 300)
+            ]
+        )
+
+    def test_small_changes_ignored(self):
+        results = {"walls 45x30 12 rooms seed 0": {"seconds": 0.013, "peak_kib": 150}}
+        regressions = suite.compare_results(results, self.baseline, 1.01)
+
+        self.assertEqual(regressions, [("walls 45x30 12 rooms seed 0", "seconds", 0.01, 0.013)])
+
+    def test_results_missing_from_baseline_ignored(self):
+        results = {"walls 200x200 400 rooms seed 0": {"seconds": 1.0, "peak_kib": 1000}}
+
+        self.assertEqual(suite.compare_results(results, self.baseline, 1.25), [])
+
+    def test_saved_baseline_loaded(self):
+        suite.save_baseline(self.path, self.baseline, 3, self.generator_options)
+        baseline = suite.load_baseline(self.path)
+
+        self.assertEqual(baseline["results"], self.baseline)
+        self.assertEqual(baseline["generator_options"], self.generator_options)
+
+    def test_baseline_with_other_version_not_loaded(self):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write('{"version": 0, "results": {}}')
+
+        with self.assertRaises(ValueError):
+            suite.load_baseline(self.path)
+
+    def test_baseline_with_same_options_accepted(self):
+        suite.save_baseline(self.path, self.baseline, 3, self.generator_options)
+
+        suite.check_baseline_options(suite.load_baseline(self.path), self.generator_options)
+
+    def test_baseline_with_other_options_rejected(self):
+        suite.save_baseline(self.path, self.baseline, 3, self.generator_options)
+        generator_options = dict(self.generator_options, pathfinder="fast_a_star")
+
+        with self.assertRaisesRegex(ValueError, "pathfinder a_star in the baseline"):
+            suite.check_baseline_options(suite.load_baseline(self.path), generator_options)
+
+    def test_compare_with_other_options_stops_before_measuring(self):
+        suite.save_baseline(self.path, self.baseline, 3, self.generator_options)
+
+        with self.assertRaises(SystemExit) as context:
+            self.run_main(["--quick", "--compare", self.path, "--placement", "free"])
+
+        self.assertEqual(context.exception.code, 2)
+
+    def test_repeated_corridor_runs_search_same_tiles_again(self):
+        generator = DungeonGenerator(grid_width=45, grid_height=30, pathfinder="jump_point")
+        state = {
+            "generator": generator,
+            "dungeon": Dungeon(45, 30, generator.tile_size, 4),
+            "max_rooms": 12
+        }
+
+        for _, stage in suite.STAGES:
+            stage(state)
+        paths = state["dungeon"].paths
+        tiles = bytes(state["dungeon"].tiles.cells)
+
+        suite.carve_corridors(state)
+
+        self.assertEqual(state["dungeon"].paths, paths)
+        self.assertEqual(bytes(state["dungeon"].tiles.cells), tiles)
+        self.assertIsNone(generator.pathfinder.tables)
+
+    def test_default_options_same_as_game(self):
+        options, _ = suite.parse_arguments([])
+
+        self.assertEqual(
+            (options.placement, options.triangulator, options.mst_algorithm, options.pathfinder),
+            ("random", "bowyer_watson", "prim", "a_star")
+        )
+
+    def test_unknown_algorithm_rejected(self):
+        with self.assertRaises(SystemExit):
+            self.run_main(["--quick", "--mst-algorithm", "unknown"])
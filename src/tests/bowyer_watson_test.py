@@ -1,6 +1,10 @@
 import math
+import random
 import unittest
-from bowyer_watson import Edge, Triangle, BowyerWatson
+import bowyer_watson
+from bowyer_watson import (
+    Edge, Triangle, BowyerWatson, get_insertion_order, hilbert_index, orientation
+)
 
 class TestEdge(unittest.TestCase):
     def test_edges_equal_with_reverse_order_vertices(self):
@@ -10,6 +14,18 @@ class TestEdge(unittest.TestCase):
         self.assertEqual(e1, e2)
         self.assertEqual(hash(e1), hash(e2))
 
+    def test_edges_store_no_instance_dictionary(self):
+        e = Edge((0, 0), (1, 1))
+
+        self.assertFalse(hasattr(e, "__dict__"))
+
+    def test_edges_sorted_by_sorted_vertices(self):
+        e1 = Edge((2, 0), (0, 5))
+        e2 = Edge((1, 1), (1, 0))
+
+        self.assertEqual(sorted([e1, e2]), [e1, e2])
+        self.assertEqual(sorted([e2, e1]), [e1, e2])
+
 class TestTriangle(unittest.TestCase):
     def test_correct_circumcircle_calculated(self):
         v1, v2, v3 = ((0, 0), (3, 0), (0, 5))
@@ -31,6 +47,15 @@ class TestTriangle(unittest.TestCase):
         # Check the circumradius is the same as the calculated distances
         self.assertAlmostEqual(d1**2, triangle.sq_circumradius)
 
+    def test_edges_created_from_vertices(self):
+        triangle = Triangle((0, 0), (3, 0), (0, 5))
+
+        self.assertEqual(
+            triangle.edges,
+            [Edge((0, 0), (3, 0)), Edge((3, 0), (0, 5)), Edge((0, 5), (0, 0))]
+        )
+        self.assertIs(triangle.edges, triangle.edges)
+
     def test_no_circumcircle_when_determinant_zero(self):
         # Test with a degenerate triangle
         triangle = Triangle((0, 0), (1, 1), (2, 2))
@@ -49,6 +74,26 @@ class TestTriangle(unittest.TestCase):
 
         self.assertFalse(triangle.vertex_in_circumcircle((0, 0)))
 
+class TestInsertionOrder(unittest.TestCase):
+    def test_insertion_order_contains_all_vertices(self):
+        rng = random.Random(1)
+        vertices = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(500)]
+
+        self.assertEqual(sorted(get_insertion_order(vertices)), sorted(vertices))
+
+    def test_same_vertices_give_same_order(self):
+        vertices = [(1, 1), (5, 2), (7, 3), (2, 4), (8, 6), (5, 7), (2, 8), (8, 9)]
+
+        self.assertEqual(get_insertion_order(vertices), get_insertion_order(vertices))
+
+    def test_hilbert_curve_visits_neighboring_cells(self):
+        cells = sorted((hilbert_index(x, y, order=3), (x, y)) for x in range(8) for y in range(8))
+
+        self.assertEqual([index for index, _ in cells], list(range(64)))
+
+        for (_, (x1, y1)), (_, (x2, y2)) in zip(cells, cells[1:]):
+            self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+
 class TestBowyerWatson(unittest.TestCase):
     def setUp(self):
         self.vertices = [(1, 1), (5, 2), (7, 3), (2, 4), (8, 6), (5, 7), (2, 8), (8, 9)]
@@ -57,7 +102,8 @@ class TestBowyerWatson(unittest.TestCase):
 
         self.new_vertex = (5, 5)
         self.invalid_triangles = self.bowyer_watson.find_invalid_triangles(self.new_vertex)
-        self.polygon_edges = self.bowyer_watson.find_polygonal_hole_edges(self.invalid_triangles)
+        self.hole_boundary = self.bowyer_watson.find_hole_boundary(self.invalid_triangles)
+        self.polygon_edges = {Edge(start, end) for start, end in self.hole_boundary}
 
     def test_all_vertices_in_super_triangle(self):
         super_triangle = self.bowyer_watson.create_super_triangle(self.vertices)
@@ -133,8 +179,8 @@ class TestBowyerWatson(unittest.TestCase):
             self.assertNotIn(t, self.bowyer_watson.triangles)
 
     def test_polygonal_hole_filled(self):
-        old_triangles = len(self.bowyer_watson.triangles)
-        self.bowyer_watson.create_new_triangle(self.new_vertex, self.polygon_edges)
+        old_triangles = len(self.bowyer_watson.triangles) - len(self.invalid_triangles)
+        self.bowyer_watson.add_vertex(self.new_vertex)
         new_triangles = len(self.bowyer_watson.triangles) - old_triangles
 
         # Check the amount of new triangles is the same as the amount of polygon edges
@@ -185,3 +231,129 @@ class TestBowyerWatson(unittest.TestCase):
                     queue.append(next_v)
 
         self.assertEqual(connected_vertices, set(self.vertices))
+
+    def test_neighbors_share_an_edge(self):
+        self.bowyer_watson.triangulate(self.vertices)
+
+        for t in self.bowyer_watson.triangles:
+            for neighbor in self.bowyer_watson.get_neighbors(t):
+                if neighbor is not None:
+                    shared = {t.v1, t.v2, t.v3} & {neighbor.v1, neighbor.v2, neighbor.v3}
+                    self.assertEqual(len(shared), 2)
+                    self.assertIn(t, self.bowyer_watson.get_neighbors(neighbor))
+
+    def test_located_triangle_contains_vertex(self):
+        self.bowyer_watson.triangulate(self.vertices)
+
+        for vertex in [(5, 5), (3, 3), (6, 7)]:
+            t = self.bowyer_watson.locate_triangle(vertex)
+
+            self.assertIsNotNone(t)
+            self.assertIn(t, self.bowyer_watson.triangles)
+
+            # Check the vertex is on the same side of every edge
+            sides = [
+                orientation(t.v1, t.v2, vertex),
+                orientation(t.v2, t.v3, vertex),
+                orientation(t.v3, t.v1, vertex)
+            ]
+            self.assertTrue(all(side >= 0 for side in sides) or all(side <= 0 for side in sides))
+
+    def test_no_triangle_located_outside_triangulation(self):
+        self.bowyer_watson.triangulate(self.vertices)
+
+        self.assertIsNone(self.bowyer_watson.locate_triangle((100, 100)))
+
+    def test_triangulation_is_delaunay(self):
+        rng = random.Random(2)
+        vertices = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+        triangles = self.bowyer_watson.triangulate(vertices)
+
+        # Check no vertex is inside the circumcircle of any triangle
+        for t in triangles:
+            for v in vertices:
+                self.assertFalse(t.vertex_in_circumcircle(v) and v not in (t.v1, t.v2, t.v3))
+
+        # Edges on the convex hull belong to only one triangle
+        edge_counts = {}
+        for t in triangles:
+            for e in t.edges:
+                edge_counts[e] = edge_counts.get(e, 0) + 1
+
+        h = sum(1 for count in edge_counts.values() if count == 1)
+
+        self.assertEqual(len(triangles), 2 * len(vertices) - h - 2)
+
+class TestNumpyBackend(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        self.vertices = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+
+    def test_fallback_when_numpy_not_installed(self):
+        numpy_module = bowyer_watson.np
+        bowyer_watson.np = None
+
+        try:
+            triangulator = BowyerWatson(use_numpy=True)
+            triangles = triangulator.triangulate(self.vertices)
+        finally:
+            bowyer_watson.np = numpy_module
+
+        self.assertFalse(triangulator.use_numpy)
+        self.assertIsNone(triangulator.circumcircles)
+        self.assertEqual(len(triangles), len(BowyerWatson().triangulate(self.vertices)))
+
+    @unittest.skipIf(bowyer_watson.np is None, "NumPy is not installed")
+    def test_same_edges_as_pure_python_backend(self):
+        python_edges = set()
+        for t in BowyerWatson().triangulate(self.vertices):
+            python_edges.update(t.edges)
+
+        numpy_edges = set()
+        for t in BowyerWatson(use_numpy=True).triangulate(self.vertices):
+            numpy_edges.update(t.edges)
+
+        self.assertEqual(python_edges, numpy_edges)
+
+    @unittest.skipIf(bowyer_watson.np is None, "NumPy is not installed")
+    def test_circumcircles_follow_triangle_order(self):
+        triangulator = BowyerWatson(use_numpy=True)
+        triangulator.triangulate(self.vertices)
+        circumcircles = triangulator.circumcircles
+
+        self.assertEqual(circumcircles.size, len(triangulator.triangles))
+
+        for slot, t in enumerate(triangulator.triangles):
+            self.assertEqual(circumcircles.centers_x[slot], t.circumcenter[0])
+            self.assertEqual(circumcircles.centers_y[slot], t.circumcenter[1])
+            self.assertEqual(circumcircles.sq_radii[slot], t.sq_circumradius)
+
+    @unittest.skipIf(bowyer_watson.np is None, "NumPy is not installed")
+    def test_invalid_triangles_same_as_pure_python_backend(self):
+        triangulator = BowyerWatson(use_numpy=True)
+        triangulator.triangulate(self.vertices)
+
+        vertex = (50, 50)
+        expected = {t for t in triangulator.triangles if t.vertex_in_circumcircle(vertex)}
+
+        self.assertEqual(triangulator.find_invalid_triangles(vertex), expected)
+
+    @unittest.skipIf(bowyer_watson.np is None, "NumPy is not installed")
+    def test_only_neighbors_of_invalid_triangles_tested(self):
+        triangulator = BowyerWatson(use_numpy=True)
+        triangulator.triangulate(self.vertices)
+
+        tested_slots = []
+        contains = triangulator.circumcircles.contains
+
+        def counting_contains(slots, vertex):
+            tested_slots.extend(slots)
+            return contains(slots, vertex)
+
+        triangulator.circumcircles.contains = counting_contains
+        invalid_triangles = triangulator.find_invalid_triangles((50, 50))
+
+        # Every neighbor of an invalid triangle is tested at most once
+        self.assertEqual(len(tested_slots), len(set(tested_slots)))
+        self.assertLessEqual(len(tested_slots), 3 * len(invalid_triangles))
+        self.assertLess(len(tested_slots), len(triangulator.triangles) // 10)
@@ -0,0 +1,61 @@
+import unittest
+from a_star import FastAStar
+from bowyer_watson import Edge
+from corridors import carve_corridors, find_corridor_paths
+from tile_grid import TileGrid
+
+class TestCorridors(unittest.TestCase):
+    def setUp(self):
+        self.tiles = TileGrid(12, 6)
+
+        # Two parallel corridors with a tile size of one pixel
+        self.edges = [Edge((0, 1), (10, 1)), Edge((0, 2), (10, 2))]
+
+    def test_paths_in_same_order_as_edges(self):
+        paths = find_corridor_paths(self.edges, self.tiles, FastAStar(), 1)
+
+        self.assertEqual((paths[0][0], paths[0][-1]), ((0, 1), (10, 1)))
+        self.assertEqual((paths[1][0], paths[1][-1]), ((0, 2), (10, 2)))
+
+    def test_tiles_not_changed_without_reuse(self):
+        carve_corridors(self.edges, self.tiles, FastAStar(), 1)
+
+        self.assertEqual(set(self.tiles.cells), {0})
+
+    def test_reuse_marks_carved_tiles(self):
+        paths, _ = carve_corridors(self.edges, self.tiles, FastAStar(), 1, reuse=True)
+
+        for path in paths:
+            for x, y in path:
+                self.assertEqual(self.tiles.get(x, y), 3)
+
+    def test_reuse_merges_corridors(self):
+        _, corridor_map = carve_corridors(self.edges, TileGrid(12, 6), FastAStar(), 1)
+        _, reuse_corridor_map = carve_corridors(
+            self.edges, self.tiles, FastAStar(), 1, reuse=True
+        )
+
+        def count_carved(tiles):
+            return sum(1 for column in tiles for tile in column if tile is not None)
+
+        self.assertEqual(count_carved(corridor_map), 22)
+
+        # The second corridor follows the first one and leaves it only at its ends
+        self.assertEqual(count_carved(reuse_corridor_map), 13)
+
+    def test_room_tiles_not_marked(self):
+        self.tiles.fill_rect(4, 0, 3, 6, 1)
+
+        carve_corridors(self.edges, self.tiles, FastAStar(), 1, reuse=True)
+
+        self.assertEqual(set(self.tiles.cells[4:7]), {1})
+        self.assertEqual(set(self.tiles.cells[4 + 12 * 1:7 + 12 * 1]), {1})
+
+    def test_unreachable_goal_skipped(self):
+        # A column of impassable tiles separates the ends of the corridors
+        self.tiles.fill_rect(5, 0, 1, 6, 4)
+
+        paths, corridor_map = carve_corridors(self.edges, self.tiles, FastAStar(), 1)
+
+        self.assertEqual(paths, [None, None])
+        self.assertTrue(all(tile is None for column in corridor_map for tile in column))
@@ -0,0 +1,134 @@
+import os
+import struct
+import tempfile
+import unittest
+import dungeon_file
+from dungeon import DungeonGenerator
+
+class TestDungeonFile(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "test.dungeon")
+
+        generator = DungeonGenerator(grid_width=45, grid_height=30, tile_size=16)
+        self.dungeon = generator.generate(3, 10, 12, seed=7)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_bytes(self, data):
+        with open(self.path, "wb") as file:
+            file.write(data)
+
+    def test_file_size_returned(self):
+        file_size = dungeon_file.save_dungeon(self.dungeon, self.path)
+
+        self.assertEqual(file_size, os.path.getsize(self.path))
+
+    def test_loaded_dungeon_same_as_saved_dungeon(self):
+        dungeon_file.save_dungeon(self.dungeon, self.path)
+        loaded = dungeon_file.load_dungeon(self.path)
+
+        self.assertEqual(
+            (loaded.grid_width, loaded.grid_height, loaded.tile_size, loaded.seed),
+            (45, 30, 16, 7)
+        )
+        self.assertEqual(
+            [(r.tile_x, r.tile_y, r.tile_width, r.tile_height) for r in loaded.rooms],
+            [(r.tile_x, r.tile_y, r.tile_width, r.tile_height) for r in self.dungeon.rooms]
+        )
+        self.assertEqual(loaded.room_centers, self.dungeon.room_centers)
+        self.assertEqual(
+            [(t.v1, t.v2, t.v3) for t in loaded.triangles],
+            [(t.v1, t.v2, t.v3) for t in self.dungeon.triangles]
+        )
+        self.assertEqual(loaded.mst_edges, self.dungeon.mst_edges)
+        self.assertEqual(loaded.extra_edges, self.dungeon.extra_edges)
+
+        self.assertEqual(bytes(loaded.tiles.cells), bytes(self.dungeon.tiles.cells))
+        self.assertEqual(bytes(loaded.wall_map.cells), bytes(self.dungeon.wall_map.cells))
+        self.assertEqual(loaded.floor_map, self.dungeon.floor_map)
+        self.assertEqual(loaded.corridor_map, self.dungeon.corridor_map)
+
+    def test_tiles_mapped_without_copying(self):
+        dungeon_file.save_dungeon(self.dungeon, self.path)
+        loaded = dungeon_file.load_dungeon(self.path)
+
+        self.assertIsInstance(loaded.tiles.cells, memoryview)
+        self.assertEqual(loaded.tiles.get(0, 0), self.dungeon.tiles.get(0, 0))
+
+    def test_changing_loaded_tiles_does_not_change_file(self):
+        dungeon_file.save_dungeon(self.dungeon, self.path)
+        loaded = dungeon_file.load_dungeon(self.path)
+
+        loaded.tiles.set(0, 0, 9)
+
+        self.assertEqual(loaded.tiles.get(0, 0), 9)
+        self.assertEqual(dungeon_file.load_dungeon(self.path).tiles.get(0, 0), 0)
+
+    def test_header_stores_version_and_counts(self):
+        data = b"".join(dungeon_file.pack_dungeon(self.dungeon))
+        header = dungeon_file.HEADER.unpack_from(data)
+
+        self.assertEqual(header[:2], (b"DUNG", dungeon_file.VERSION))
+        self.assertEqual(
+            header[6:],
+            (
+                len(self.dungeon.rooms),
+                len(self.dungeon.triangles),
+                len(self.dungeon.mst_edges) + len(self.dungeon.extra_edges)
+            )
+        )
+        self.assertEqual(
+            len(data),
+            dungeon_file.HEADER.size +
+            header[6] * dungeon_file.ROOM.size +
+            header[7] * dungeon_file.TRIANGLE.size +
+            header[8] * dungeon_file.EDGE.size +
+            4 * 45 * 30
+        )
+
+    def test_invalid_file_raises_error(self):
+        self.write_bytes(b"not a dungeon file at all, but long enough to have a header")
+
+        with self.assertRaises(ValueError):
+            dungeon_file.load_dungeon(self.path)
+
+    def test_unsupported_version_raises_error(self):
+        data = bytearray(b"".join(dungeon_file.pack_dungeon(self.dungeon)))
+        struct.pack_into("<H", data, 4, dungeon_file.VERSION + 1)
+        self.write_bytes(data)
+
+        with self.assertRaises(ValueError):
+            dungeon_file.load_dungeon(self.path)
+
+    def test_truncated_file_raises_error(self):
+        data = b"".join(dungeon_file.pack_dungeon(self.dungeon))
+        self.write_bytes(data[:-1])
+
+        with self.assertRaises(ValueError):
+            dungeon_file.load_dungeon(self.path)
+
+    def test_invalid_room_index_raises_error(self):
+        data = bytearray(b"".join(dungeon_file.pack_dungeon(self.dungeon)))
+        triangles_offset = (
+            dungeon_file.HEADER.size + len(self.dungeon.rooms) * dungeon_file.ROOM.size
+        )
+        struct.pack_into("<I", data, triangles_offset, 9999)
+        self.write_bytes(data)
+
+        with self.assertRaises(ValueError):
+            dungeon_file.load_dungeon(self.path)
+
+    def test_dungeon_without_seed_cannot_be_saved(self):
+        self.dungeon.seed = None
+
+        with self.assertRaises(ValueError):
+            dungeon_file.save_dungeon(self.dungeon, self.path)
+
+    def test_seeds_outside_header_range_cannot_be_saved(self):
+        for seed in (-1, 2**64, "abc"):
+            self.dungeon.seed = seed
+
+            with self.assertRaises(ValueError):
+                dungeon_file.save_dungeon(self.dungeon, self.path)
@@ -0,0 +1,280 @@
+import os
+import sys
+import subprocess
+import unittest
+from dungeon import Dungeon, DungeonGenerator
+
+class TestDungeonGenerator(unittest.TestCase):
+    def setUp(self):
+        self.generator = DungeonGenerator(grid_width=45, grid_height=30, tile_size=16)
+        self.dungeon = self.generator.generate(min_size=3, max_size=10, max_rooms=12)
+
+    def test_generate_returns_dungeon(self):
+        self.assertIsInstance(self.dungeon, Dungeon)
+        self.assertEqual(self.dungeon.grid_width, 45)
+        self.assertEqual(self.dungeon.grid_height, 30)
+        self.assertGreater(len(self.dungeon.rooms), 0)
+
+    def test_room_centers_match_rooms(self):
+        self.assertEqual(len(self.dungeon.room_centers), len(self.dungeon.rooms))
+
+        for room, center in zip(self.dungeon.rooms, self.dungeon.room_centers):
+            self.assertEqual(room.get_center(16), center)
+
+    def test_room_tiles_mapped(self):
+        for room in self.dungeon.rooms:
+            for i in range(room.tile_width):
+                for j in range(room.tile_height):
+                    self.assertEqual(self.dungeon.tiles[room.tile_x + i][room.tile_y + j], 1)
+                    self.assertIn(self.dungeon.floor_map[room.tile_x + i][room.tile_y + j], (0, 1))
+
+    def test_wall_tiles_marked(self):
+        for tile_x in range(45):
+            for tile_y in range(30):
+                if self.dungeon.wall_map[tile_x][tile_y]:
+                    self.assertEqual(self.dungeon.tiles[tile_x][tile_y], 2)
+
+    def test_path_found_for_every_edge(self):
+        edges = self.dungeon.mst_edges.union(self.dungeon.extra_edges)
+
+        self.assertEqual(len(self.dungeon.paths), len(edges))
+
+        for path in self.dungeon.paths:
+            self.assertIsNotNone(path)
+
+    def test_corridor_edges_connect_rooms(self):
+        graph = self.dungeon.room_graph
+
+        self.assertEqual(len(self.dungeon.corridor_edges), len(self.dungeon.paths))
+        self.assertEqual(
+            graph.get_edges(self.dungeon.corridor_edges),
+            self.dungeon.mst_edges.union(self.dungeon.extra_edges)
+        )
+
+        for edge_index in self.dungeon.corridor_edges:
+            room_a, room_b = graph.get_edge_rooms(edge_index)
+            edge = graph.edges[edge_index]
+
+            self.assertEqual(self.dungeon.room_centers[room_a], edge.v1)
+            self.assertEqual(self.dungeon.room_centers[room_b], edge.v2)
+
+    def test_corridor_tiles_on_paths(self):
+        path_tiles = set()
+        for path in self.dungeon.paths:
+            path_tiles.update(path)
+
+        for tile_x in range(45):
+            for tile_y in range(30):
+                if self.dungeon.tiles[tile_x][tile_y] != 1:
+                    if self.dungeon.corridor_map[tile_x][tile_y] is not None:
+                        self.assertIn((tile_x, tile_y), path_tiles)
+
+    def test_same_seed_generates_same_dungeon(self):
+        dungeon_a = self.generator.generate(3, 10, 12, seed=42)
+        dungeon_b = DungeonGenerator(grid_width=45, grid_height=30, tile_size=16).generate(
+            3, 10, 12, seed=42
+        )
+
+        self.assertEqual(dungeon_a.seed, 42)
+        self.assertEqual(dungeon_a.room_centers, dungeon_b.room_centers)
+        self.assertEqual(dungeon_a.mst_edges, dungeon_b.mst_edges)
+        self.assertEqual(dungeon_a.extra_edges, dungeon_b.extra_edges)
+        self.assertEqual(dungeon_a.floor_map, dungeon_b.floor_map)
+        self.assertEqual(dungeon_a.paths, dungeon_b.paths)
+        self.assertEqual(dungeon_a.corridor_map, dungeon_b.corridor_map)
+
+    def test_different_seeds_generate_different_dungeons(self):
+        dungeon_a = self.generator.generate(3, 10, 12, seed=1)
+        dungeon_b = self.generator.generate(3, 10, 12, seed=2)
+
+        self.assertNotEqual(dungeon_a.floor_map, dungeon_b.floor_map)
+
+    def test_random_seed_stored_when_no_seed_given(self):
+        self.assertIsNotNone(self.dungeon.seed)
+
+        dungeon = self.generator.generate(3, 10, 12, seed=self.dungeon.seed)
+
+        self.assertEqual(dungeon.room_centers, self.dungeon.room_centers)
+
+    def test_free_placement_mode(self):
+        generator = DungeonGenerator(grid_width=45, grid_height=30, tile_size=16, placement="free")
+        dungeon = generator.generate(3, 10, 12, seed=5)
+
+        self.assertGreater(len(dungeon.rooms), 0)
+        self.assertEqual(len(dungeon.paths), len(dungeon.mst_edges) + len(dungeon.extra_edges))
+
+    def test_unknown_placement_mode_raises_error(self):
+        with self.assertRaises(ValueError):
+            DungeonGenerator(placement="unknown")
+
+    def test_sweep_hull_triangulator(self):
+        generator = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, triangulator="sweep_hull"
+        )
+        dungeon = generator.generate(3, 10, 12, seed=5)
+
+        self.assertGreater(len(dungeon.triangles), 0)
+        self.assertEqual(len(dungeon.paths), len(dungeon.mst_edges) + len(dungeon.extra_edges))
+
+    def test_unknown_triangulator_raises_error(self):
+        with self.assertRaises(ValueError):
+            DungeonGenerator(triangulator="unknown")
+
+    def test_kruskal_mst_algorithm(self):
+        generator = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, mst_algorithm="kruskal"
+        )
+        dungeon = generator.generate(3, 10, 12, seed=5)
+
+        self.assertEqual(len(dungeon.mst_edges), len(dungeon.room_centers) - 1)
+        self.assertEqual(len(dungeon.paths), len(dungeon.mst_edges) + len(dungeon.extra_edges))
+
+    def test_unknown_mst_algorithm_raises_error(self):
+        with self.assertRaises(ValueError):
+            DungeonGenerator(mst_algorithm="unknown")
+
+    def test_fast_a_star_pathfinder(self):
+        generator = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, pathfinder="fast_a_star"
+        )
+        dungeon = generator.generate(3, 10, 12, seed=5)
+
+        self.assertEqual(len(dungeon.paths), len(dungeon.corridor_edges))
+
+        for path in dungeon.paths:
+            self.assertIsNotNone(path)
+
+    def test_multi_target_pathfinder_finds_equally_cheap_paths(self):
+        dungeons = [
+            DungeonGenerator(
+                grid_width=45, grid_height=30, tile_size=16, pathfinder=pathfinder
+            ).generate(3, 10, 12, seed=8)
+            for pathfinder in ("a_star", "multi_target")
+        ]
+
+        costs = []
+        for dungeon in dungeons:
+            cost = 0
+            for path in dungeon.paths:
+                cost += sum(1 + (1, 10, 50)[dungeon.tiles.get(x, y)] for x, y in path[1:])
+            costs.append(cost)
+
+        self.assertEqual(costs[0], costs[1])
+
+    def test_jump_point_pathfinder_finds_equally_cheap_paths(self):
+        dungeons = [
+            DungeonGenerator(
+                grid_width=45, grid_height=30, tile_size=16, pathfinder=pathfinder
+            ).generate(3, 10, 12, seed=9)
+            for pathfinder in ("a_star", "jump_point")
+        ]
+
+        costs = []
+        for dungeon in dungeons:
+            cost = 0
+            for path in dungeon.paths:
+                cost += sum(1 + (1, 10, 50)[dungeon.tiles.get(x, y)] for x, y in path[1:])
+            costs.append(cost)
+
+        self.assertEqual(costs[0], costs[1])
+
+    def test_hpa_star_pathfinder_finds_nearly_as_cheap_paths(self):
+        dungeons = [
+            DungeonGenerator(
+                grid_width=45, grid_height=30, tile_size=16, pathfinder=pathfinder
+            ).generate(3, 10, 12, seed=9)
+            for pathfinder in ("a_star", "hpa_star")
+        ]
+
+        costs = []
+        for dungeon in dungeons:
+            self.assertEqual(len(dungeon.paths), len(dungeon.corridor_edges))
+
+            cost = 0
+            for path in dungeon.paths:
+                cost += sum(1 + (1, 10, 50)[dungeon.tiles.get(x, y)] for x, y in path[1:])
+            costs.append(cost)
+
+        self.assertGreaterEqual(costs[1], costs[0])
+        self.assertLess(costs[1], costs[0] * 1.1)
+
+    def test_hpa_star_pathfinder_on_large_grid(self):
+        dungeon = DungeonGenerator(
+            grid_width=300, grid_height=300, tile_size=16, pathfinder="hpa_star"
+        ).generate(3, 10, 200, seed=7)
+
+        self.assertEqual(len(dungeon.paths), len(dungeon.corridor_edges))
+
+        for path in dungeon.paths:
+            for tile_x, tile_y in path:
+                self.assertTrue(0 < tile_x < 299 and 0 < tile_y < 299)
+
+    def test_parallel_paths_same_as_sequential_paths(self):
+        dungeon = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, pathfinder="fast_a_star", workers=2
+        ).generate(3, 10, 12, seed=8)
+        expected = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, pathfinder="fast_a_star"
+        ).generate(3, 10, 12, seed=8)
+
+        self.assertEqual(dungeon.paths, expected.paths)
+        self.assertEqual(dungeon.corridor_map, expected.corridor_map)
+
+    def test_corridor_reuse_marks_corridor_tiles(self):
+        dungeon = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, corridor_reuse=True
+        ).generate(3, 10, 12, seed=8)
+
+        for path in dungeon.paths:
+            for x, y in path:
+                self.assertIn(dungeon.tiles.get(x, y), (1, 3))
+                if dungeon.tiles.get(x, y) == 3:
+                    self.assertIsNotNone(dungeon.corridor_map[x][y])
+
+    def test_corridor_reuse_with_workers_raises_error(self):
+        with self.assertRaises(ValueError):
+            DungeonGenerator(workers=2, corridor_reuse=True)
+
+    def test_stats_not_collected_by_default(self):
+        self.assertIsNone(self.dungeon.stats)
+
+    def test_stats_collected_for_every_stage(self):
+        dungeon = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, collect_stats=True
+        ).generate(3, 10, 12, seed=8)
+
+        self.assertEqual(
+            list(dungeon.stats.stage_times),
+            ["rooms", "triangulation", "mst", "extra_edges", "tiles", "walls", "corridors"]
+        )
+        self.assertEqual(dungeon.stats.counters["room_tries"], 12 * 50)
+        self.assertGreater(dungeon.stats.counters["invalid_triangles"], 0)
+        self.assertEqual(dungeon.stats.counters["searches"], len(dungeon.corridor_edges))
+
+    def test_stats_do_not_change_dungeon(self):
+        dungeon = DungeonGenerator(
+            grid_width=45, grid_height=30, tile_size=16, collect_stats=True
+        ).generate(3, 10, 12, seed=8)
+        expected = DungeonGenerator(grid_width=45, grid_height=30, tile_size=16).generate(
+            3, 10, 12, seed=8
+        )
+
+        self.assertEqual(dungeon.paths, expected.paths)
+        self.assertEqual(dungeon.corridor_map, expected.corridor_map)
+
+    def test_unknown_pathfinder_raises_error(self):
+        with self.assertRaises(ValueError):
+            DungeonGenerator(pathfinder="unknown")
+
+    def test_generation_does_not_import_pygame(self):
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys\n"
+            "from dungeon import DungeonGenerator\n"
+            "DungeonGenerator().generate(3, 10, 12)\n"
+            "sys.exit('pygame' in sys.modules)\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=src_dir, check=False)
+
+        self.assertEqual(result.returncode, 0)
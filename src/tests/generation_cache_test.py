@@ -0,0 +1,148 @@
+import os
+import struct
+import tempfile
+import unittest
+import dungeon_file
+from dungeon import DungeonGenerator
+from generation_cache import GenerationCache
+
+class CountingGenerator(DungeonGenerator):
+    def __init__(self, **options):
+        super().__init__(grid_width=45, grid_height=30, tile_size=16, **options)
+        self.generated = 0
+
+    def generate(self, min_size, max_size, max_rooms, seed=None):
+        self.generated += 1
+        return super().generate(min_size, max_size, max_rooms, seed)
+
+class TestGenerationCache(unittest.TestCase):
+    def setUp(self):
+        self.generator = CountingGenerator()
+        self.cache = GenerationCache(self.generator, max_entries=2)
+
+        self.temp_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_same_parameters_generate_once(self):
+        dungeon = self.cache.get_dungeon(3, 10, 12, seed=1)
+
+        self.assertEqual(self.cache.last_source, "generated")
+        self.assertIs(self.cache.get_dungeon(3, 10, 12, seed=1), dungeon)
+        self.assertEqual(self.cache.last_source, "memory")
+        self.assertEqual(self.generator.generated, 1)
+
+    def test_cached_dungeon_same_as_generated_dungeon(self):
+        dungeon = self.cache.get_dungeon(3, 10, 12, seed=1)
+        expected = DungeonGenerator(grid_width=45, grid_height=30, tile_size=16).generate(
+            3, 10, 12, seed=1
+        )
+
+        self.assertEqual(dungeon.paths, expected.paths)
+        self.assertEqual(dungeon.corridor_map, expected.corridor_map)
+
+    def test_different_parameters_have_different_keys(self):
+        key = self.cache.get_key(3, 10, 12, 1)
+        other_cache = GenerationCache(CountingGenerator(pathfinder="fast_a_star"))
+
+        self.assertEqual(self.cache.get_key(3, 10, 12, 1), key)
+        self.assertNotEqual(self.cache.get_key(3, 10, 12, 2), key)
+        self.assertNotEqual(self.cache.get_key(4, 10, 12, 1), key)
+        self.assertNotEqual(self.cache.get_key(3, 10, 13, 1), key)
+        self.assertNotEqual(other_cache.get_key(3, 10, 12, 1), key)
+
+    def test_workers_do_not_change_key(self):
+        other_cache = GenerationCache(CountingGenerator(workers=2, collect_stats=True))
+
+        self.assertEqual(other_cache.get_key(3, 10, 12, 1), self.cache.get_key(3, 10, 12, 1))
+
+    def test_random_seed_cached_under_chosen_seed(self):
+        dungeon = self.cache.get_dungeon(3, 10, 12)
+
+        self.assertIsNotNone(dungeon.seed)
+        self.assertIs(self.cache.get_dungeon(3, 10, 12, seed=dungeon.seed), dungeon)
+
+    def test_least_recently_used_dungeon_evicted(self):
+        self.cache.get_dungeon(3, 10, 12, seed=1)
+        self.cache.get_dungeon(3, 10, 12, seed=2)
+        self.cache.get_dungeon(3, 10, 12, seed=1)
+        self.cache.get_dungeon(3, 10, 12, seed=3)
+
+        self.assertEqual(
+            list(self.cache.entries),
+            [self.cache.get_key(3, 10, 12, 1), self.cache.get_key(3, 10, 12, 3)]
+        )
+
+        self.cache.get_dungeon(3, 10, 12, seed=2)
+        self.assertEqual(self.generator.generated, 4)
+
+    def test_dungeons_evicted_when_over_tile_limit(self):
+        cache = GenerationCache(self.generator, max_tiles=2 * 45 * 30)
+
+        for seed in range(4):
+            cache.get_dungeon(3, 10, 12, seed=seed)
+
+        self.assertEqual(len(cache.entries), 2)
+        self.assertEqual(cache.total_tiles, 2 * 45 * 30)
+
+    def test_dungeon_loaded_from_disk_without_generating(self):
+        cache = GenerationCache(self.generator, cache_dir=self.temp_dir.name)
+        dungeon = cache.get_dungeon(3, 10, 12, seed=1)
+
+        self.assertTrue(os.path.exists(cache.get_path(cache.get_key(3, 10, 12, 1))))
+
+        # A new cache has nothing in memory, like after a restart
+        new_cache = GenerationCache(self.generator, cache_dir=self.temp_dir.name)
+        loaded = new_cache.get_dungeon(3, 10, 12, seed=1)
+
+        self.assertEqual(new_cache.last_source, "disk")
+        self.assertEqual(self.generator.generated, 1)
+        self.assertEqual(loaded.corridor_map, dungeon.corridor_map)
+        self.assertEqual(bytes(loaded.tiles.cells), bytes(dungeon.tiles.cells))
+
+    def test_invalid_disk_file_generated_again(self):
+        cache = GenerationCache(self.generator, cache_dir=self.temp_dir.name)
+
+        with open(cache.get_path(cache.get_key(3, 10, 12, 1)), "wb") as file:
+            file.write(b"broken")
+
+        cache.get_dungeon(3, 10, 12, seed=1)
+
+        self.assertEqual(cache.last_source, "generated")
+        self.assertEqual(self.generator.generated, 1)
+
+    def test_disk_file_with_invalid_room_index_generated_again(self):
+        cache = GenerationCache(self.generator, cache_dir=self.temp_dir.name)
+        dungeon = cache.get_dungeon(3, 10, 12, seed=1)
+        path = cache.get_path(cache.get_key(3, 10, 12, 1))
+
+        with open(path, "r+b") as file:
+            file.seek(dungeon_file.HEADER.size + len(dungeon.rooms) * dungeon_file.ROOM.size)
+            file.write(struct.pack("<I", 9999))
+
+        cache.clear()
+        cache.get_dungeon(3, 10, 12, seed=1)
+
+        self.assertEqual(cache.last_source, "generated")
+        self.assertEqual(self.generator.generated, 2)
+
+    def test_seeds_dungeon_files_cannot_store_kept_in_memory(self):
+        cache = GenerationCache(self.generator, cache_dir=self.temp_dir.name)
+
+        for seed in ("abc", -1):
+            dungeon = cache.get_dungeon(3, 10, 12, seed=seed)
+
+            self.assertEqual(dungeon.seed, seed)
+            self.assertIs(cache.get_dungeon(3, 10, 12, seed=seed), dungeon)
+
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_clear_keeps_disk_files(self):
+        cache = GenerationCache(self.generator, cache_dir=self.temp_dir.name)
+        cache.get_dungeon(3, 10, 12, seed=1)
+
+        cache.clear()
+        cache.get_dungeon(3, 10, 12, seed=1)
+
+        self.assertEqual(cache.last_source, "disk")
@@ -0,0 +1,60 @@
+import unittest
+from generation_stats import GenerationStats, time_stage
+
+class TestGenerationStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = GenerationStats()
+
+    def test_stage_time_recorded(self):
+        with self.stats.stage("rooms"):
+            pass
+
+        self.assertEqual(list(self.stats.stage_times), ["rooms"])
+        self.assertGreaterEqual(self.stats.stage_times["rooms"], 0)
+
+    def test_stage_times_with_same_name_added(self):
+        self.stats.stage_times["rooms"] = 1.0
+
+        with self.stats.stage("rooms"):
+            pass
+
+        self.assertGreater(self.stats.stage_times["rooms"], 1.0)
+
+    def test_stage_time_recorded_when_stage_raises_error(self):
+        with self.assertRaises(ValueError):
+            with self.stats.stage("rooms"):
+                raise ValueError
+
+        self.assertIn("rooms", self.stats.stage_times)
+
+    def test_counters_added(self):
+        self.stats.count("searches")
+        self.stats.count("searches")
+        self.stats.count("expanded_nodes", 10)
+
+        self.assertEqual(self.stats.counters, {"searches": 2, "expanded_nodes": 10})
+
+    def test_largest_value_recorded(self):
+        self.stats.record_max("max_cavity_size", 3)
+        self.stats.record_max("max_cavity_size", 5)
+        self.stats.record_max("max_cavity_size", 4)
+
+        self.assertEqual(self.stats.counters["max_cavity_size"], 5)
+
+    def test_lines_list_stages_total_and_counters(self):
+        self.stats.stage_times = {"rooms": 0.002, "walls": 0.001}
+        self.stats.count("searches", 3)
+
+        self.assertEqual(
+            self.stats.get_lines(),
+            ["rooms: 2.0 ms", "walls: 1.0 ms", "total: 3.0 ms", "searches: 3"]
+        )
+
+    def test_time_stage_without_stats_does_nothing(self):
+        with time_stage(None, "rooms"):
+            pass
+
+        with time_stage(self.stats, "rooms"):
+            pass
+
+        self.assertIn("rooms", self.stats.stage_times)
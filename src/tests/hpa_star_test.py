@@ -0,0 +1,146 @@
+import random
+import unittest
+from a_star import FastAStar
+from hpa_star import AbstractGraph, HierarchicalAStar
+from tile_grid import TileGrid
+
+class TestAbstractGraph(unittest.TestCase):
+    def test_uniform_clusters_found(self):
+        grid = TileGrid(32, 16)
+        grid.set(20, 5, 1)
+        graph = AbstractGraph(grid, FastAStar.STEP_COSTS, 16)
+
+        self.assertEqual(graph.uniform_clusters, {0})
+
+    def test_long_entrance_has_two_transitions(self):
+        graph = AbstractGraph(TileGrid(32, 16), FastAStar.STEP_COSTS, 16)
+
+        self.assertEqual(
+            sorted(graph.edges),
+            sorted([32 + 15, 32 + 16, 14 * 32 + 15, 14 * 32 + 16])
+        )
+        self.assertEqual(graph.edges[32 + 15], [(32 + 16, 2)])
+
+    def test_entrances_split_by_tile_types(self):
+        grid = TileGrid(32, 16)
+        grid.fill_rect(16, 0, 16, 4, 1)
+        graph = AbstractGraph(grid, FastAStar.STEP_COSTS, 16)
+
+        # One transition into the room tiles and two into the empty tiles
+        self.assertEqual(len(graph.cluster_nodes[0]), 3)
+        self.assertEqual(graph.edges[grid.index(15, 2)], [(grid.index(16, 2), 11)])
+
+    def test_blocked_tiles_split_entrances(self):
+        grid = TileGrid(8, 4)
+        grid.fill_rect(4, 0, 1, 4, 9)
+        graph = AbstractGraph(grid, FastAStar.STEP_COSTS, 4)
+
+        self.assertEqual(graph.edges, {})
+
+    def test_clusters_connected_when_needed(self):
+        graph = AbstractGraph(TileGrid(32, 16), FastAStar.STEP_COSTS, 16)
+
+        self.assertEqual(graph.connected_clusters, set())
+
+        self.assertEqual(
+            sorted(graph.get_edges(32 + 15)), [(32 + 16, 2), (14 * 32 + 15, 26)]
+        )
+        self.assertEqual(graph.connected_clusters, {0})
+
+    def test_uniform_cluster_path_moves_horizontally_first(self):
+        graph = AbstractGraph(TileGrid(16, 16), FastAStar.STEP_COSTS, 16)
+        path = graph.get_cluster_path(16 * 5 + 7, 16 * 2 + 4, 0)
+
+        self.assertEqual(path, [87, 86, 85, 84, 68, 52, 36])
+
+    def test_uniform_cluster_path_moves_vertically_first_at_edge(self):
+        graph = AbstractGraph(TileGrid(16, 16), FastAStar.STEP_COSTS, 16)
+        path = graph.get_cluster_path(7, 16 * 2 + 4, 0)
+
+        self.assertEqual(path, [7, 23, 39, 38, 37, 36])
+
+    def test_no_transitions_on_grid_edge(self):
+        graph = AbstractGraph(TileGrid(48, 48), FastAStar.STEP_COSTS, 16)
+
+        for index in graph.edges:
+            self.assertTrue(0 < index % 48 < 47 and 0 < index // 48 < 47)
+
+class TestHierarchicalAStar(unittest.TestCase):
+    def setUp(self):
+        self.hpa_star = HierarchicalAStar()
+
+        # Random rooms surrounded by walls and a few blocked tiles on an empty grid
+        rng = random.Random(14)
+        self.grid = TileGrid(80, 60)
+        for _ in range(20):
+            x, y = rng.randint(0, 72), rng.randint(0, 52)
+            self.grid.fill_rect(x, y, 8, 8, 2)
+            self.grid.fill_rect(x + 1, y + 1, 6, 6, 1)
+        for _ in range(40):
+            self.grid.set(rng.randrange(80), rng.randrange(60), 9)
+
+    def get_path_cost(self, path):
+        costs = {0: 2, 1: 11, 2: 51}
+        return sum(costs[self.grid.get(x, y)] for x, y in path[1:])
+
+    def test_path_from_start_to_goal_found(self):
+        path = self.hpa_star.find_path((1, 1), (40, 30), TileGrid(50, 50))
+
+        self.assertEqual(path[0], (1, 1))
+        self.assertEqual(path[-1], (40, 30))
+        self.assertEqual(len(path), 69)
+
+    def test_start_and_goal_with_same_position(self):
+        self.assertEqual(self.hpa_star.find_path((1, 1), (1, 1), self.grid), [(1, 1)])
+
+    def test_no_path_when_goal_out_of_reach(self):
+        self.assertIsNone(self.hpa_star.find_path((1, 1), (100, 100), self.grid))
+
+    def test_no_path_through_blocked_tiles(self):
+        grid = TileGrid(40, 40)
+        grid.fill_rect(20, 0, 1, 40, 9)
+
+        self.assertIsNone(self.hpa_star.find_path((0, 0), (39, 39), grid))
+
+    def test_path_along_grid_edge_found(self):
+        path = self.hpa_star.find_path((0, 0), (39, 1), TileGrid(40, 2))
+
+        self.assertEqual((path[0], path[-1]), ((0, 0), (39, 1)))
+
+    def test_paths_close_to_cheapest_paths(self):
+        fast_a_star = FastAStar()
+        rng = random.Random(15)
+        total_cost = expected_total_cost = 0
+
+        for _ in range(30):
+            start_pos = (rng.randrange(80), rng.randrange(60))
+            goal_pos = (rng.randrange(80), rng.randrange(60))
+
+            path = self.hpa_star.find_path(start_pos, goal_pos, self.grid)
+            expected_path = fast_a_star.find_path(start_pos, goal_pos, self.grid)
+
+            if expected_path is None:
+                continue
+
+            self.assertEqual((path[0], path[-1]), (start_pos, goal_pos))
+
+            for (x1, y1), (x2, y2) in zip(path, path[1:]):
+                self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+                self.assertNotEqual(self.grid.get(x2, y2), 9)
+
+            self.assertGreaterEqual(self.get_path_cost(path), self.get_path_cost(expected_path))
+            total_cost += self.get_path_cost(path)
+            expected_total_cost += self.get_path_cost(expected_path)
+
+        self.assertLess(total_cost, expected_total_cost * 1.1)
+
+    def test_abstract_graph_reused_until_tiles_change(self):
+        self.hpa_star.find_path((0, 0), (79, 59), self.grid)
+        graph = self.hpa_star.graph
+
+        self.hpa_star.find_path((79, 0), (0, 59), self.grid)
+        self.assertIs(self.hpa_star.graph, graph)
+
+        self.grid.set(0, 0, 3)
+        self.hpa_star.find_path((79, 0), (0, 59), self.grid)
+        self.assertIsNot(self.hpa_star.graph, graph)
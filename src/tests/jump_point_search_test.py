@@ -0,0 +1,117 @@
+import random
+import unittest
+from a_star import AStar
+from jump_point_search import JumpPointSearch, JumpTables, find_changes, get_line_distances
+from tile_grid import TileGrid
+
+class TestJumpTables(unittest.TestCase):
+    def test_find_changes(self):
+        self.assertEqual(find_changes(bytes([0, 0, 1, 1, 0]), 1), [1, 3])
+        self.assertEqual(find_changes(bytes([0, 1, 0, 1]), 2), [])
+        self.assertEqual(find_changes(bytes([0, 1]), 2), [])
+
+    def test_line_distances(self):
+        # Stop tiles are ones and blocked tiles are twos
+        distances, found = get_line_distances(bytes([0, 1, 1, 0, 2, 0, 0, 1, 0]))
+
+        self.assertEqual(list(distances), [-1, 0, 0, 1, 0, -1, -2, 0, 1])
+        self.assertEqual(list(found), [0, 1, 1, 1, 0, 0, 0, 1, 1])
+
+    def test_jumps_on_empty_grid_reach_edge(self):
+        tables = JumpTables(TileGrid(5, 4), JumpPointSearch.STEP_COSTS)
+
+        self.assertEqual(tables.right[0], -5)
+        self.assertEqual(tables.left[4], -5)
+        self.assertEqual(tables.down[1], -4)
+        self.assertEqual(tables.up[16], -4)
+
+    def test_jumps_stop_next_to_other_tile_type(self):
+        grid = TileGrid(7, 3)
+        grid.set(5, 1, 1)
+        tables = JumpTables(grid, JumpPointSearch.STEP_COSTS)
+
+        self.assertTrue(tables.boundary[grid.index(4, 1)])
+        self.assertFalse(tables.boundary[grid.index(3, 1)])
+        self.assertEqual(tables.right[grid.index(0, 1)], 4)
+
+    def test_blocked_tiles_end_jumps(self):
+        grid = TileGrid(7, 1)
+        grid.set(4, 0, 9)
+        tables = JumpTables(grid, JumpPointSearch.STEP_COSTS)
+
+        self.assertEqual(tables.right[0], -4)
+        self.assertEqual(tables.left[6], -2)
+
+class TestJumpPointSearch(unittest.TestCase):
+    def setUp(self):
+        self.jump_point_search = JumpPointSearch()
+
+        # Random rooms surrounded by walls and a few blocked tiles on an empty grid
+        rng = random.Random(12)
+        self.grid = TileGrid(40, 30)
+        for _ in range(10):
+            x, y = rng.randint(0, 32), rng.randint(0, 22)
+            self.grid.fill_rect(x, y, 7, 7, 2)
+            self.grid.fill_rect(x + 1, y + 1, 5, 5, 1)
+        for _ in range(40):
+            self.grid.set(rng.randrange(40), rng.randrange(30), 9)
+
+    def get_path_cost(self, path):
+        costs = {0: 2, 1: 11, 2: 51, 3: 1}
+        return sum(costs[self.grid.get(x, y)] for x, y in path[1:])
+
+    def test_path_from_start_to_goal_found(self):
+        path = self.jump_point_search.find_path((1, 1), (5, 5), TileGrid(10, 10))
+
+        self.assertEqual(path[0], (1, 1))
+        self.assertEqual(path[-1], (5, 5))
+        self.assertEqual(len(path), 9)
+
+    def test_start_and_goal_with_same_position(self):
+        self.assertEqual(
+            self.jump_point_search.find_path((1, 1), (1, 1), TileGrid(3, 3)), [(1, 1)]
+        )
+
+    def test_no_path_when_goal_out_of_reach(self):
+        self.assertIsNone(self.jump_point_search.find_path((1, 1), (100, 100), self.grid))
+
+    def test_no_path_through_blocked_tiles(self):
+        grid = TileGrid(5, 5)
+        grid.fill_rect(2, 0, 1, 5, 9)
+
+        self.assertIsNone(self.jump_point_search.find_path((0, 0), (4, 4), grid))
+
+    def test_same_path_cost_as_a_star(self):
+        a_star = AStar()
+        rng = random.Random(13)
+
+        # Corridor tiles make the costs of the tile types differ more
+        self.grid.fill_rect(0, 14, 40, 1, 3)
+
+        for _ in range(40):
+            start_pos = (rng.randrange(40), rng.randrange(30))
+            goal_pos = (rng.randrange(40), rng.randrange(30))
+
+            path = self.jump_point_search.find_path(start_pos, goal_pos, self.grid)
+            expected_path = a_star.find_path(start_pos, goal_pos, self.grid)
+
+            if expected_path is None:
+                self.assertIsNone(path)
+                continue
+
+            self.assertEqual((path[0], path[-1]), (start_pos, goal_pos))
+            self.assertEqual(self.get_path_cost(path), self.get_path_cost(expected_path))
+
+            for (x1, y1), (x2, y2) in zip(path, path[1:]):
+                self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+
+    def test_jump_tables_reused_until_tiles_change(self):
+        self.jump_point_search.find_path((0, 0), (39, 29), self.grid)
+        tables = self.jump_point_search.tables
+
+        self.jump_point_search.find_path((39, 0), (0, 29), self.grid)
+        self.assertIs(self.jump_point_search.tables, tables)
+
+        self.grid.set(0, 0, 3)
+        self.jump_point_search.find_path((39, 0), (0, 29), self.grid)
+        self.assertIsNot(self.jump_point_search.tables, tables)
@@ -0,0 +1,115 @@
+import math
+import random
+import unittest
+from bowyer_watson import BowyerWatson, Edge
+from sweep_hull import SweepHull
+from prim import Prim
+from room_graph import RoomGraph
+from mst import Kruskal, UnionFind, get_weighted_edges, MST_ALGORITHMS
+
+def get_total_weight(edges):
+    return sum(math.dist(e.v1, e.v2) for e in edges)
+
+class TestWeightedEdges(unittest.TestCase):
+    def test_edges_unique_and_sorted_by_weight(self):
+        triangles = BowyerWatson().triangulate([(0, 0), (4, 0), (0, 3), (5, 5)])
+        weighted_edges = get_weighted_edges(triangles)
+
+        edges = [edge for _, edge in weighted_edges]
+        weights = [weight for weight, _ in weighted_edges]
+
+        self.assertEqual(len(edges), len(set(edges)))
+        self.assertEqual(weights, sorted(weights))
+        self.assertIn((5.0, Edge((4, 0), (0, 3))), weighted_edges)
+
+class TestUnionFind(unittest.TestCase):
+    def test_elements_start_in_separate_sets(self):
+        union_find = UnionFind(3)
+
+        self.assertNotEqual(union_find.find(0), union_find.find(1))
+        self.assertNotEqual(union_find.find(1), union_find.find(2))
+
+    def test_union_merges_sets(self):
+        union_find = UnionFind(4)
+
+        self.assertTrue(union_find.union(0, 1))
+        self.assertTrue(union_find.union(2, 3))
+        self.assertTrue(union_find.union(1, 3))
+
+        self.assertEqual(len({union_find.find(i) for i in range(4)}), 1)
+
+    def test_union_of_same_set_returns_false(self):
+        union_find = UnionFind(3)
+        union_find.union(0, 1)
+        union_find.union(1, 2)
+
+        self.assertFalse(union_find.union(0, 2))
+
+class TestKruskal(unittest.TestCase):
+    def setUp(self):
+        self.vertices = [(1, 1), (5, 2), (7, 3), (2, 4), (8, 6), (5, 7), (2, 8), (8, 9)]
+        self.triangles = BowyerWatson().triangulate(self.vertices)
+
+        self.kruskal = Kruskal()
+        self.kruskal.get_vertices(self.triangles)
+        self.mst_edges = self.kruskal.create_mst()
+
+    def test_algorithms_registered(self):
+        self.assertIs(MST_ALGORITHMS["prim"], Prim)
+        self.assertIs(MST_ALGORITHMS["kruskal"], Kruskal)
+
+    def test_correct_number_of_mst_edges(self):
+        self.assertEqual(len(self.mst_edges), len(self.vertices) - 1)
+
+    def test_mst_edges_are_triangulation_edges(self):
+        bw_edges = set()
+        for t in self.triangles:
+            bw_edges.update(t.edges)
+
+        self.assertLessEqual(self.mst_edges, bw_edges)
+
+    def test_mst_with_no_vertices(self):
+        self.kruskal.get_vertices([])
+
+        self.assertEqual(self.kruskal.create_mst(), set())
+
+    def test_graph_mst_same_as_mst(self):
+        graph = RoomGraph(self.vertices, self.triangles)
+
+        self.assertEqual(graph.get_edges(self.kruskal.create_graph_mst(graph)), self.mst_edges)
+
+    def test_graph_mst_with_no_edges(self):
+        graph = RoomGraph([(0, 0), (1, 1)], [])
+
+        self.assertEqual(self.kruskal.create_graph_mst(graph), set())
+
+    def test_same_total_weight_as_prim(self):
+        for seed in range(10):
+            rng = random.Random(seed)
+            vertices = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(200)]
+            triangles = SweepHull().triangulate(vertices)
+
+            prim = Prim()
+            prim.get_vertices(triangles)
+            prim_edges = prim.create_mst(random.Random(seed))
+
+            self.kruskal.get_vertices(triangles)
+            kruskal_edges = self.kruskal.create_mst()
+
+            self.assertEqual(len(kruskal_edges), len(prim_edges))
+            self.assertAlmostEqual(get_total_weight(kruskal_edges), get_total_weight(prim_edges))
+
+    def test_same_total_weight_as_prim_with_equal_weights(self):
+        # Room centers on a grid have many equally long edges
+        vertices = [(x * 16, y * 16) for x in range(6) for y in range(5)]
+        triangles = BowyerWatson().triangulate(vertices)
+
+        prim = Prim()
+        prim.get_vertices(triangles)
+
+        self.kruskal.get_vertices(triangles)
+
+        self.assertAlmostEqual(
+            get_total_weight(self.kruskal.create_mst()),
+            get_total_weight(prim.create_mst(random.Random(1)))
+        )
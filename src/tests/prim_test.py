@@ -1,6 +1,8 @@
+import random
 import unittest
 from bowyer_watson import BowyerWatson
-from prim import Prim, add_random_edges
+from prim import Prim, add_random_edges, add_random_graph_edges
+from room_graph import RoomGraph
 
 class TestPrim(unittest.TestCase):
     def setUp(self):
@@ -46,6 +48,37 @@ class TestPrim(unittest.TestCase):
 
         self.assertEqual(len(mst_edges), 0)
 
+    def test_mst_with_no_vertices(self):
+        self.prim.get_vertices([])
+
+        self.assertEqual(self.prim.create_mst(), set())
+
+    def test_same_rng_seed_chooses_same_start_vertex(self):
+        # Make all edges equally long so the MST depends on the starting vertex
+        self.prim.calculate_weight = lambda v1, v2: 1
+
+        mst_a = self.prim.create_mst(random.Random(3))
+        mst_b = self.prim.create_mst(random.Random(3))
+
+        self.assertEqual(mst_a, mst_b)
+
+    def test_graph_mst_same_as_mst(self):
+        rng = random.Random(4)
+        vertices = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(100)]
+        triangles = self.bowyer_watson.triangulate(vertices)
+        graph = RoomGraph(vertices, triangles)
+
+        self.prim.get_vertices(triangles)
+        mst_edges = self.prim.create_mst(random.Random(5))
+        graph_mst_edges = self.prim.create_graph_mst(graph, random.Random(5))
+
+        self.assertEqual(graph.get_edges(graph_mst_edges), mst_edges)
+
+    def test_graph_mst_with_no_edges(self):
+        graph = RoomGraph([(0, 0), (1, 1)], [])
+
+        self.assertEqual(self.prim.create_graph_mst(graph), set())
+
     def test_all_vertices_connected(self):
         neighbors = {}
 
@@ -97,3 +130,21 @@ class TestAddRandomEdges(unittest.TestCase):
         extra_edges = add_random_edges(100, mst_edges, self.triangles)
         new_mst_edges = mst_edges.union(extra_edges)
         self.assertEqual(new_mst_edges, self.bw_edges)
+
+    def test_same_rng_seed_adds_same_extra_edges(self):
+        mst_edges = self.prim.create_mst()
+
+        extra_a = add_random_edges(50, mst_edges, self.triangles, random.Random(7))
+        extra_b = add_random_edges(50, mst_edges, self.triangles, random.Random(7))
+
+        self.assertEqual(extra_a, extra_b)
+
+    def test_graph_extra_edges_same_as_extra_edges(self):
+        graph = RoomGraph(self.vertices, self.triangles)
+        graph_mst_edges = self.prim.create_graph_mst(graph, random.Random(2))
+        mst_edges = graph.get_edges(graph_mst_edges)
+
+        extra_edges = add_random_edges(50, mst_edges, self.triangles, random.Random(7))
+        graph_extra_edges = add_random_graph_edges(50, graph_mst_edges, graph, random.Random(7))
+
+        self.assertEqual(graph.get_edges(graph_extra_edges), extra_edges)
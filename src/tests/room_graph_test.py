@@ -0,0 +1,60 @@
+import unittest
+from bowyer_watson import BowyerWatson
+from room_graph import RoomGraph
+
+class TestRoomGraph(unittest.TestCase):
+    def setUp(self):
+        self.room_centers = [(1, 1), (5, 2), (7, 3), (2, 4), (8, 6), (5, 7), (2, 8), (8, 9)]
+        self.triangles = BowyerWatson().triangulate(self.room_centers)
+        self.graph = RoomGraph(self.room_centers, self.triangles)
+
+        self.bw_edges = set()
+        for t in self.triangles:
+            self.bw_edges.update(t.edges)
+
+    def test_graph_has_triangulation_edges(self):
+        self.assertEqual(set(self.graph.edges), self.bw_edges)
+        self.assertEqual(self.graph.edge_count(), len(self.bw_edges))
+        self.assertEqual(self.graph.vertex_count(), len(self.room_centers))
+
+    def test_edges_sorted_from_smaller_vertex(self):
+        self.assertEqual(self.graph.edges, sorted(self.graph.edges))
+
+        for i, edge in enumerate(self.graph.edges):
+            self.assertLess(edge.v1, edge.v2)
+            self.assertEqual(self.graph.vertices[self.graph.edge_starts[i]], edge.v1)
+            self.assertEqual(self.graph.vertices[self.graph.edge_ends[i]], edge.v2)
+
+    def test_edge_weights_are_lengths(self):
+        self.assertEqual(self.graph.weights[self.graph.edges.index(min(self.graph.edges))],
+                         ((1 - 2)**2 + (1 - 4)**2)**0.5)
+
+    def test_neighbors_match_edges(self):
+        for vertex_index, vertex in enumerate(self.graph.vertices):
+            expected = {e.v2 if e.v1 == vertex else e.v1 for e in self.bw_edges if vertex in (e.v1, e.v2)}
+            neighbors = self.graph.get_neighbors(vertex_index)
+
+            self.assertEqual(self.graph.get_degree(vertex_index), len(expected))
+            self.assertEqual({self.graph.vertices[n] for n, _ in neighbors}, expected)
+
+            for neighbor, edge_index in neighbors:
+                edge = self.graph.edges[edge_index]
+                self.assertEqual({edge.v1, edge.v2}, {vertex, self.graph.vertices[neighbor]})
+
+    def test_edge_rooms_match_room_centers(self):
+        for i, edge in enumerate(self.graph.edges):
+            room_a, room_b = self.graph.get_edge_rooms(i)
+
+            self.assertEqual(self.room_centers[room_a], edge.v1)
+            self.assertEqual(self.room_centers[room_b], edge.v2)
+
+    def test_get_edges_returns_edge_objects(self):
+        self.assertEqual(self.graph.get_edges(range(self.graph.edge_count())), self.bw_edges)
+        self.assertEqual(self.graph.get_edges([]), set())
+
+    def test_graph_without_triangles(self):
+        graph = RoomGraph([(0, 0), (1, 1)], [])
+
+        self.assertEqual(graph.edge_count(), 0)
+        self.assertEqual(graph.get_degree(0), 0)
+        self.assertEqual(graph.get_neighbors(1), [])
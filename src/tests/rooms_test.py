@@ -1,6 +1,8 @@
+import random
 import unittest
-from rooms import Room, generate_rooms
+from rooms import Room, RoomIndex, FreePositions, generate_rooms, generate_rooms_free
 from config import TILE_SIZE
+from generation_stats import GenerationStats
 
 class TestRoom(unittest.TestCase):
     def test_room_stores_correct_values(self):
@@ -11,10 +13,56 @@ class TestRoom(unittest.TestCase):
         self.assertEqual(room.tile_width, 7)
         self.assertEqual(room.tile_height, 8)
 
-        self.assertEqual(room.room_rect.x, 5 * TILE_SIZE)
-        self.assertEqual(room.room_rect.y, 6 * TILE_SIZE)
-        self.assertEqual(room.room_rect.width, 7 * TILE_SIZE)
-        self.assertEqual(room.room_rect.height, 8 * TILE_SIZE)
+    def test_correct_center_calculated(self):
+        room = Room(tile_x=5, tile_y=6, tile_width=7, tile_height=8)
+
+        center_x = 5 * TILE_SIZE + 7 * TILE_SIZE // 2
+        center_y = 6 * TILE_SIZE + 8 * TILE_SIZE // 2
+
+        self.assertEqual(room.get_center(TILE_SIZE), (center_x, center_y))
+
+    def test_overlaps_with_margin(self):
+        room_a = Room(tile_x=2, tile_y=2, tile_width=4, tile_height=4)
+        room_b = Room(tile_x=8, tile_y=2, tile_width=4, tile_height=4)
+
+        # The rooms are two tiles apart
+        self.assertFalse(room_a.overlaps(room_b))
+        self.assertFalse(room_a.overlaps(room_b, margin=2))
+        self.assertTrue(room_a.overlaps(room_b, margin=3))
+        self.assertTrue(room_b.overlaps(room_a, margin=3))
+
+    def test_overlaps_when_rooms_intersect(self):
+        room_a = Room(tile_x=2, tile_y=2, tile_width=4, tile_height=4)
+        room_b = Room(tile_x=5, tile_y=5, tile_width=4, tile_height=4)
+
+        self.assertTrue(room_a.overlaps(room_b))
+        self.assertTrue(room_b.overlaps(room_a))
+
+class TestRoomIndex(unittest.TestCase):
+    def test_room_added_to_covered_buckets(self):
+        room_index = RoomIndex(cell_size=10)
+        room = Room(tile_x=8, tile_y=5, tile_width=4, tile_height=3)
+        room_index.add(room)
+
+        self.assertEqual(sorted(room_index.buckets.keys()), [(0, 0), (1, 0)])
+
+    def test_overlaps_same_as_checking_every_room(self):
+        rng = random.Random(1)
+        room_index = RoomIndex(cell_size=8)
+        rooms = []
+
+        for _ in range(200):
+            room = Room(
+                rng.randint(0, 60), rng.randint(0, 60), rng.randint(1, 4), rng.randint(1, 4)
+            )
+            margin = rng.randint(0, 2)
+
+            expected = any(room.overlaps(other, margin) for other in rooms)
+            self.assertEqual(room_index.overlaps(room, margin), expected)
+
+            if not expected:
+                rooms.append(room)
+                room_index.add(room)
 
 class TestGenerateRooms(unittest.TestCase):
     def test_correct_number_of_rooms(self):
@@ -43,7 +91,7 @@ class TestGenerateRooms(unittest.TestCase):
 
         for i, room_a in enumerate(rooms):
             for room_b in rooms[i + 1:]:
-                self.assertFalse(room_a.room_rect.colliderect(room_b.room_rect))
+                self.assertFalse(room_a.overlaps(room_b))
 
     def test_rooms_within_bounds(self):
         grid_width = 40
@@ -64,3 +112,67 @@ class TestGenerateRooms(unittest.TestCase):
             self.assertGreaterEqual(room.tile_y, margin)
             self.assertLessEqual(room.tile_x + room.tile_width, grid_width - margin)
             self.assertLessEqual(room.tile_y + room.tile_height, grid_height - margin)
+
+    def test_same_rng_seed_generates_same_rooms(self):
+        rooms_a = generate_rooms(40, 30, 2, 10, 10, 2, rng=random.Random(5))
+        rooms_b = generate_rooms(40, 30, 2, 10, 10, 2, rng=random.Random(5))
+
+        self.assertEqual(
+            [(r.tile_x, r.tile_y, r.tile_width, r.tile_height) for r in rooms_a],
+            [(r.tile_x, r.tile_y, r.tile_width, r.tile_height) for r in rooms_b]
+        )
+
+    def test_tries_and_rejected_rooms_counted(self):
+        stats = GenerationStats()
+        rooms = generate_rooms(40, 30, 2, 10, 100, 2, rng=random.Random(5), stats=stats)
+
+        # Every try is used when the grid fills up before all rooms are placed
+        self.assertEqual(stats.counters["room_tries"], 100 * 50)
+        self.assertEqual(stats.counters["rejected_rooms"], 100 * 50 - len(rooms))
+
+class TestGenerateRoomsFree(unittest.TestCase):
+    def setUp(self):
+        self.rooms = generate_rooms_free(
+            grid_width=40,
+            grid_height=30,
+            min_size=2,
+            max_size=10,
+            max_rooms=1000,
+            margin=2,
+            rng=random.Random(3)
+        )
+
+    def test_no_room_overlaps(self):
+        for i, room_a in enumerate(self.rooms):
+            for room_b in self.rooms[i + 1:]:
+                self.assertFalse(room_a.overlaps(room_b, margin=2))
+
+    def test_rooms_within_bounds(self):
+        for room in self.rooms:
+            self.assertGreaterEqual(room.tile_x, 2)
+            self.assertGreaterEqual(room.tile_y, 2)
+            self.assertLessEqual(room.tile_x + room.tile_width, 40 - 2)
+            self.assertLessEqual(room.tile_y + room.tile_height, 30 - 2)
+            self.assertGreaterEqual(room.tile_width, 2)
+            self.assertGreaterEqual(room.tile_height, 2)
+
+    def test_rooms_placed_until_grid_full(self):
+        # Check no room of the minimum size fits anywhere on the grid
+        for tile_x in range(2, 40 - 2 - 2 + 1):
+            for tile_y in range(2, 30 - 2 - 2 + 1):
+                new_room = Room(tile_x, tile_y, 2, 2)
+                self.assertTrue(any(new_room.overlaps(room, margin=2) for room in self.rooms))
+
+    def test_correct_number_of_rooms_when_grid_not_full(self):
+        rooms = generate_rooms_free(100, 100, 2, 5, 10, 2, rng=random.Random(3))
+
+        self.assertEqual(len(rooms), 10)
+
+    def test_free_positions_removed_around_room(self):
+        free_positions = FreePositions(grid_width=20, grid_height=20, min_size=2, margin=1)
+        free_positions.add_room(Room(tile_x=8, tile_y=8, tile_width=3, tile_height=3))
+
+        for _ in range(100):
+            tile_x, tile_y = free_positions.sample(random)
+            new_room = Room(tile_x, tile_y, 2, 2)
+            self.assertFalse(new_room.overlaps(Room(8, 8, 3, 3), margin=1))
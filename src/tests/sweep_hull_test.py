@@ -0,0 +1,120 @@
+import random
+import unittest
+from bowyer_watson import BowyerWatson, orientation
+from sweep_hull import SweepHull, in_circumcircle
+from triangulation import TRIANGULATORS
+
+def get_edges(triangles):
+    edges = set()
+    for t in triangles:
+        edges.update(t.edges)
+
+    return edges
+
+def get_hull_edges(triangles):
+    # Edges on the convex hull belong to only one triangle
+    edge_counts = {}
+    for t in triangles:
+        for e in t.edges:
+            edge_counts[e] = edge_counts.get(e, 0) + 1
+
+    return {e for e, count in edge_counts.items() if count == 1}
+
+class TestInCircumcircle(unittest.TestCase):
+    def test_vertex_inside_circumcircle(self):
+        self.assertTrue(in_circumcircle((0, 0), (4, 0), (0, 4), (1, 1)))
+
+    def test_vertex_outside_circumcircle(self):
+        self.assertFalse(in_circumcircle((0, 0), (4, 0), (0, 4), (5, 5)))
+
+    def test_vertex_on_circumcircle(self):
+        self.assertFalse(in_circumcircle((0, 0), (4, 0), (0, 4), (4, 4)))
+
+class TestSweepHull(unittest.TestCase):
+    def setUp(self):
+        self.vertices = [(1, 1), (5, 2), (7, 3), (2, 4), (8, 6), (5, 7), (2, 8), (8, 9)]
+        self.sweep_hull = SweepHull()
+
+    def test_correct_number_of_triangles(self):
+        triangles = self.sweep_hull.triangulate(self.vertices)
+
+        # Number of vertices on the convex hull (calculated on pen and paper)
+        h = 6
+
+        self.assertEqual(len(triangles), 2 * len(self.vertices) - h - 2)
+
+    def test_no_triangles_for_less_than_three_vertices(self):
+        self.assertEqual(self.sweep_hull.triangulate([]), [])
+        self.assertEqual(self.sweep_hull.triangulate([(1, 1)]), [])
+        self.assertEqual(self.sweep_hull.triangulate([(1, 1), (2, 2)]), [])
+
+    def test_no_triangles_for_collinear_vertices(self):
+        self.assertEqual(self.sweep_hull.triangulate([(0, 0), (1, 1), (2, 2), (3, 3)]), [])
+
+    def test_collinear_first_vertices_connected(self):
+        vertices = [(0, 0), (1, 0), (2, 0), (3, 0), (1, 2)]
+        triangles = self.sweep_hull.triangulate(vertices)
+
+        self.assertEqual(len(triangles), 3)
+
+        for t in triangles:
+            self.assertGreater(orientation(t.v1, t.v2, t.v3), 0)
+
+    def test_duplicate_vertices_ignored(self):
+        triangles = self.sweep_hull.triangulate(self.vertices + self.vertices[:3])
+
+        self.assertEqual(len(triangles), len(self.sweep_hull.triangulate(self.vertices)))
+
+    def test_triangles_counterclockwise(self):
+        for t in self.sweep_hull.triangulate(self.vertices):
+            self.assertGreater(orientation(t.v1, t.v2, t.v3), 0)
+
+    def test_triangulation_is_delaunay(self):
+        rng = random.Random(2)
+        vertices = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+        triangles = self.sweep_hull.triangulate(vertices)
+
+        # Check no vertex is inside the circumcircle of any triangle
+        for t in triangles:
+            for v in vertices:
+                self.assertFalse(t.vertex_in_circumcircle(v) and v not in (t.v1, t.v2, t.v3))
+
+        h = len(get_hull_edges(triangles))
+
+        self.assertEqual(len(triangles), 2 * len(vertices) - h - 2)
+
+class TestTriangulatorsCrossCheck(unittest.TestCase):
+    def test_triangulators_registered(self):
+        self.assertIs(TRIANGULATORS["bowyer_watson"], BowyerWatson)
+        self.assertIs(TRIANGULATORS["sweep_hull"], SweepHull)
+
+    def test_same_edges_on_random_vertices(self):
+        """Both triangulators find the same edges, including the thin triangles on the
+            convex hull. The check only holds for vertices in general position: with four or
+            more vertices on one circle, both triangulations are valid but may differ."""
+
+        for seed in range(20):
+            rng = random.Random(seed)
+            vertices = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(200)]
+
+            self.assertEqual(
+                get_edges(BowyerWatson().triangulate(vertices)),
+                get_edges(SweepHull().triangulate(vertices))
+            )
+
+    def test_same_hull_on_grid_vertices(self):
+        """Vertices on a grid have many vertices on one circle, so only the convex hull
+            and the number of triangles are compared."""
+
+        for seed in range(20):
+            rng = random.Random(seed)
+            vertices = list({(rng.randrange(40) * 16, rng.randrange(40) * 16) for _ in range(60)})
+
+            bowyer_watson_triangles = BowyerWatson().triangulate(vertices)
+            sweep_hull_triangles = SweepHull().triangulate(vertices)
+
+            self.assertEqual(len(bowyer_watson_triangles), len(sweep_hull_triangles))
+            self.assertEqual(
+                get_hull_edges(bowyer_watson_triangles),
+                get_hull_edges(sweep_hull_triangles)
+            )
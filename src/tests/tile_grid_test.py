@@ -0,0 +1,78 @@
+import unittest
+from tile_grid import TileGrid, as_tile_grid
+
+class TestTileGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = TileGrid(5, 4)
+
+    def test_grid_initialized_with_fill_value(self):
+        self.assertEqual(len(self.grid.cells), 20)
+        self.assertEqual(set(self.grid.cells), {0})
+        self.assertEqual(set(TileGrid(2, 2, fill=3).cells), {3})
+
+    def test_tiles_stored_in_row_major_order(self):
+        self.grid.set(3, 2, 7)
+
+        self.assertEqual(self.grid.index(3, 2), 13)
+        self.assertEqual(self.grid.cells[13], 7)
+        self.assertEqual(self.grid.get(3, 2), 7)
+
+    def test_fill_rect_sets_only_rectangle(self):
+        self.grid.fill_rect(1, 1, 3, 2, 1)
+
+        for tile_x in range(5):
+            for tile_y in range(4):
+                expected = 1 if 1 <= tile_x < 4 and 1 <= tile_y < 3 else 0
+                self.assertEqual(self.grid.get(tile_x, tile_y), expected)
+
+    def test_contains(self):
+        self.grid.set(2, 3, 3)
+
+        self.assertTrue(self.grid.contains(3))
+        self.assertFalse(self.grid.contains(1))
+
+    def test_contains_on_buffer(self):
+        buffer = bytearray(30)
+        buffer[25] = 3
+        grid = TileGrid.from_buffer(5, 4, buffer)
+
+        self.assertFalse(grid.contains(3))
+
+        grid.set(1, 1, 3)
+
+        self.assertTrue(grid.contains(3))
+
+    def test_in_bounds(self):
+        self.assertTrue(self.grid.in_bounds(0, 0))
+        self.assertTrue(self.grid.in_bounds(4, 3))
+        self.assertFalse(self.grid.in_bounds(5, 0))
+        self.assertFalse(self.grid.in_bounds(0, -1))
+
+    def test_grid_indexed_like_list_of_lists(self):
+        self.grid[2][3] = 2
+
+        self.assertEqual(len(self.grid), 5)
+        self.assertEqual(len(self.grid[0]), 4)
+        self.assertEqual(self.grid[2][3], 2)
+        self.assertEqual(self.grid.get(2, 3), 2)
+
+    def test_grid_from_buffer_shares_memory(self):
+        buffer = bytearray(24)
+        grid = TileGrid.from_buffer(5, 4, buffer)
+        grid.set(1, 2, 3)
+
+        self.assertEqual(len(grid.cells), 20)
+        self.assertEqual(buffer[11], 3)
+
+    def test_conversion_to_and_from_lists(self):
+        tiles = [[(x + y) % 3 for y in range(4)] for x in range(5)]
+        grid = TileGrid.from_lists(tiles)
+
+        self.assertEqual(grid.width, 5)
+        self.assertEqual(grid.height, 4)
+        self.assertEqual(grid.get(4, 1), 2)
+        self.assertEqual(grid.to_lists(), tiles)
+
+    def test_as_tile_grid(self):
+        self.assertIs(as_tile_grid(self.grid), self.grid)
+        self.assertEqual(as_tile_grid([[0, 1], [1, 0]]).cells, bytearray([0, 1, 1, 0]))
@@ -0,0 +1,50 @@
+import random
+import unittest
+from bowyer_watson import Edge, BowyerWatson
+from triangulation import CompactTriangulation
+
+class TestCompactTriangulation(unittest.TestCase):
+    def setUp(self):
+        self.vertices = [(1, 1), (5, 2), (7, 3), (2, 4), (8, 6), (5, 7), (2, 8), (8, 9)]
+        self.triangles = BowyerWatson().triangulate(self.vertices)
+        self.compact = CompactTriangulation.from_triangles(self.vertices, self.triangles)
+
+        self.bw_edges = set()
+        for t in self.triangles:
+            for e in t.edges:
+                self.bw_edges.add(e)
+
+    def test_correct_counts(self):
+        self.assertEqual(self.compact.triangle_count(), len(self.triangles))
+        self.assertEqual(self.compact.edge_count(), len(self.bw_edges))
+
+    def test_edges_stored_as_sorted_index_pairs(self):
+        for i in range(self.compact.edge_count()):
+            self.assertLess(self.compact.edges[2 * i], self.compact.edges[2 * i + 1])
+
+    def test_same_edges_as_triangles(self):
+        self.assertEqual(self.compact.to_edges(), self.bw_edges)
+
+    def test_same_triangles_as_triangles(self):
+        triangles = self.compact.to_triangles()
+
+        self.assertEqual(
+            sorted((t.v1, t.v2, t.v3) for t in triangles),
+            sorted((t.v1, t.v2, t.v3) for t in self.triangles)
+        )
+
+    def test_vertex_indices_follow_given_order(self):
+        for i, vertex in enumerate(self.vertices):
+            self.assertEqual(self.compact.vertices[i], vertex)
+
+    def test_large_triangulation_edges_unique(self):
+        rng = random.Random(1)
+        vertices = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(500)]
+        compact = CompactTriangulation.from_triangles(
+            vertices, BowyerWatson().triangulate(vertices)
+        )
+
+        edges = compact.to_edges()
+
+        self.assertEqual(len(edges), compact.edge_count())
+        self.assertIsInstance(next(iter(edges)), Edge)
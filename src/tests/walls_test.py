@@ -0,0 +1,107 @@
+import random
+import unittest
+import walls
+from walls import get_wall_type, map_wall_tiles, classify_wall_tiles
+from tile_grid import TileGrid
+
+class TestWalls(unittest.TestCase):
+    def setUp(self):
+        # A 3x3 room in the middle of a 7x7 grid
+        self.tiles = [[0 for col in range(7)] for row in range(7)]
+
+        for tile_x in range(2, 5):
+            for tile_y in range(2, 5):
+                self.tiles[tile_x][tile_y] = 1
+
+    def test_correct_wall_types_returned(self):
+        self.assertEqual(get_wall_type(self.tiles, 3, 1), walls.TOP_WALL)
+        self.assertEqual(get_wall_type(self.tiles, 3, 5), walls.BOTTOM_WALL)
+        self.assertEqual(get_wall_type(self.tiles, 1, 3), walls.LEFT_WALL)
+        self.assertEqual(get_wall_type(self.tiles, 5, 3), walls.RIGHT_WALL)
+
+        self.assertEqual(get_wall_type(self.tiles, 1, 1), walls.TOP_L_CORNER)
+        self.assertEqual(get_wall_type(self.tiles, 5, 1), walls.TOP_R_CORNER)
+        self.assertEqual(get_wall_type(self.tiles, 1, 5), walls.BOTTOM_L_CORNER)
+        self.assertEqual(get_wall_type(self.tiles, 5, 5), walls.BOTTOM_R_CORNER)
+
+    def test_no_wall_type_for_border_or_distant_tiles(self):
+        self.assertEqual(get_wall_type(self.tiles, 0, 0), 0)
+        self.assertEqual(get_wall_type(self.tiles, 6, 3), 0)
+        self.assertEqual(get_wall_type(self.tiles, 3, 0), 0)
+
+    def test_wall_tiles_marked_as_twos(self):
+        wall_map = map_wall_tiles(self.tiles)
+
+        wall_count = 0
+        for tile_x in range(7):
+            for tile_y in range(7):
+                if wall_map[tile_x][tile_y]:
+                    self.assertEqual(self.tiles[tile_x][tile_y], 2)
+                    wall_count += 1
+
+        # Walls surround the room on all sides
+        self.assertEqual(wall_count, 16)
+
+    def test_same_walls_on_tile_grid(self):
+        grid = TileGrid.from_lists(self.tiles)
+        grid_wall_map = map_wall_tiles(grid)
+        wall_map = map_wall_tiles(self.tiles)
+
+        self.assertEqual(grid_wall_map.cells, wall_map.cells)
+        self.assertEqual(grid.to_lists(), self.tiles)
+
+class TestBulkClassifier(unittest.TestCase):
+    def setUp(self):
+        # Random room and wall tiles with a border of empty tiles
+        rng = random.Random(4)
+        self.grid = TileGrid(40, 30)
+        for _ in range(25):
+            self.grid.fill_rect(
+                rng.randint(1, 33), rng.randint(1, 23), rng.randint(1, 6), rng.randint(1, 6),
+                rng.choice([1, 1, 2])
+            )
+
+    def test_lookup_table_matches_neighbors(self):
+        # Place every possible combination of room tiles around the center of a 3x3 grid
+        offsets = [(-1, -1), (0, -1), (1, -1), (-1, 1), (0, 1), (1, 1), (-1, 0), (1, 0)]
+
+        for mask in range(256):
+            grid = TileGrid(3, 3)
+            for bit, (move_x, move_y) in enumerate(offsets):
+                if mask & (1 << bit):
+                    grid.set(1 + move_x, 1 + move_y, 1)
+
+            self.assertEqual(walls.WALL_TYPES[mask], get_wall_type(grid, 1, 1))
+
+    def test_same_wall_types_as_single_tiles(self):
+        wall_map = classify_wall_tiles(self.grid)
+
+        for tile_x in range(self.grid.width):
+            for tile_y in range(self.grid.height):
+                expected = get_wall_type(self.grid, tile_x, tile_y)
+                if self.grid.get(tile_x, tile_y) != 0:
+                    expected = 0
+
+                self.assertEqual(wall_map.get(tile_x, tile_y), expected)
+
+    def test_small_grid_has_no_walls(self):
+        self.assertEqual(classify_wall_tiles(TileGrid(2, 5, fill=1)).cells, bytearray(10))
+
+    @unittest.skipIf(walls.np is None, "NumPy is not installed")
+    def test_numpy_classifier_same_as_pure_python(self):
+        wall_map = walls.classify_wall_tiles_numpy(self.grid)
+
+        self.assertEqual(wall_map.cells, classify_wall_tiles(self.grid).cells)
+
+    def test_numpy_fallback_when_numpy_not_installed(self):
+        numpy_module = walls.np
+        walls.np = None
+
+        try:
+            grid = TileGrid(self.grid.width, self.grid.height)
+            grid.cells[:] = self.grid.cells
+            wall_map = map_wall_tiles(grid, use_numpy=True)
+        finally:
+            walls.np = numpy_module
+
+        self.assertEqual(wall_map.cells, classify_wall_tiles(self.grid).cells)
@@ -0,0 +1,132 @@
+# Tile type of the corridor tiles that have already been carved, which the pathfinders
+# prefer over other tiles so that the later corridors reuse them
+CORRIDOR_TILE = 3
+
+class TileColumn:
+    """A class that gives access to one column of a tile grid, so that a grid can be indexed
+        as grid[tile_x][tile_y] like a list of lists."""
+
+    __slots__ = ("grid", "tile_x")
+
+    def __init__(self, grid, tile_x):
+        """A constructor that initializes the column.
+
+        Args:
+            grid: TileGrid object the column belongs to.
+            tile_x: X coordinate of the column.
+        """
+
+        self.grid = grid
+        self.tile_x = tile_x
+
+    def __len__(self):
+        return self.grid.height
+
+    def __getitem__(self, tile_y):
+        return self.grid.cells[tile_y * self.grid.width + self.tile_x]
+
+    def __setitem__(self, tile_y, value):
+        self.grid.cells[tile_y * self.grid.width + self.tile_x] = value
+
+class TileGrid:
+    """A class that stores the tile types of a grid in a single bytearray.
+
+    The tiles are stored row by row, so the tile (tile_x, tile_y) is at index
+        tile_y * width + tile_x. The grid can also be indexed as grid[tile_x][tile_y],
+        which is slower, but works with code written for lists of lists."""
+
+    def __init__(self, width, height, fill=0):
+        """A constructor that initializes a grid with every tile set to the same value.
+
+        Args:
+            width: Grid width in tile units.
+            height: Grid height in tile units.
+            fill: Initial value of every tile.
+        """
+
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+
+    @classmethod
+    def from_buffer(cls, width, height, buffer):
+        """A method that creates a grid that uses the given buffer as its tiles without copying,
+            for example a memoryview of shared memory."""
+
+        grid = cls(0, 0)
+        grid.width = width
+        grid.height = height
+        grid.cells = memoryview(buffer)[:width * height]
+
+        return grid
+
+    @classmethod
+    def from_lists(cls, tiles):
+        """A method that creates a grid from a list of lists indexed as tiles[tile_x][tile_y]."""
+
+        grid = cls(len(tiles), len(tiles[0]) if tiles else 0)
+
+        for tile_x, column in enumerate(tiles):
+            grid.cells[tile_x::grid.width] = bytes(column)
+
+        return grid
+
+    def to_lists(self):
+        """A method that returns the grid as a list of lists indexed as tiles[tile_x][tile_y]."""
+
+        return [list(self.cells[tile_x::self.width]) for tile_x in range(self.width)]
+
+    def index(self, tile_x, tile_y):
+        """A method that returns the index of a tile in the bytearray."""
+
+        return tile_y * self.width + tile_x
+
+    def in_bounds(self, tile_x, tile_y):
+        """A method that checks whether a tile is inside the grid."""
+
+        return 0 <= tile_x < self.width and 0 <= tile_y < self.height
+
+    def get(self, tile_x, tile_y):
+        """A method that returns the value of a tile."""
+
+        return self.cells[tile_y * self.width + tile_x]
+
+    def set(self, tile_x, tile_y, value):
+        """A method that sets the value of a tile."""
+
+        self.cells[tile_y * self.width + tile_x] = value
+
+    def contains(self, value):
+        """A method that checks whether any tile has the given value."""
+
+        # A memoryview is searched one item at a time, so it is copied into bytes first
+        if isinstance(self.cells, memoryview):
+            return value in self.cells.tobytes()
+
+        return value in self.cells
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def fill_rect(self, tile_x, tile_y, width, height, value):
+        """A method that sets the value of every tile in a rectangle.
+
+        Each row of the rectangle is set with a single slice assignment."""
+
+        row = bytes([value]) * width
+
+        for row_y in range(tile_y, tile_y + height):
+            start = row_y * self.width + tile_x
+            self.cells[start:start + width] = row
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, tile_x):
+        return TileColumn(self, tile_x)
+
+def as_tile_grid(tiles):
+    """A function that returns the tiles as a TileGrid, converting a list of lists if needed."""
+
+    if isinstance(tiles, TileGrid):
+        return tiles
+
+    return TileGrid.from_lists(tiles)
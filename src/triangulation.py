@@ -0,0 +1,96 @@
+from array import array
+from bowyer_watson import BowyerWatson, Edge, Triangle
+from sweep_hull import SweepHull
+
+class CompactTriangulation:
+    """A class that stores a triangulation as flat arrays of integer vertex indices.
+
+    Each triangle is stored as three consecutive vertex indices, and each unique edge
+        as two consecutive vertex indices with the smaller index first. Triangle and Edge
+        objects are only created when they are requested."""
+
+    def __init__(self, vertices, triangle_indices):
+        """A constructor that initializes the triangulation and finds its unique edges.
+
+        Args:
+            vertices: List of vertex coordinates.
+            triangle_indices: Flat sequence of vertex indices, three per triangle.
+        """
+
+        self.vertices = list(vertices)
+        self.triangles = array("l", triangle_indices)
+
+        # Encode each edge as a single integer so that duplicates are cheap to remove
+        vertex_count = len(self.vertices)
+        edge_codes = set()
+
+        for i in range(0, len(self.triangles), 3):
+            a, b, c = self.triangles[i], self.triangles[i + 1], self.triangles[i + 2]
+
+            for start, end in ((a, b), (b, c), (c, a)):
+                if start < end:
+                    edge_codes.add(start * vertex_count + end)
+                else:
+                    edge_codes.add(end * vertex_count + start)
+
+        self.edges = array("l")
+        for code in sorted(edge_codes):
+            self.edges.append(code // vertex_count)
+            self.edges.append(code % vertex_count)
+
+    @classmethod
+    def from_triangles(cls, vertices, triangles):
+        """A method that creates a compact triangulation from a list of Triangle objects."""
+
+        vertex_indices = {}
+        for vertex in vertices:
+            vertex_indices.setdefault((vertex[0], vertex[1]), len(vertex_indices))
+
+        triangle_indices = array("l")
+        for t in triangles:
+            triangle_indices.append(vertex_indices[t.v1])
+            triangle_indices.append(vertex_indices[t.v2])
+            triangle_indices.append(vertex_indices[t.v3])
+
+        return cls(vertex_indices.keys(), triangle_indices)
+
+    def triangle_count(self):
+        """A method that returns the number of triangles."""
+
+        return len(self.triangles) // 3
+
+    def edge_count(self):
+        """A method that returns the number of unique edges."""
+
+        return len(self.edges) // 2
+
+    def get_triangle(self, i):
+        """A method that returns the triangle at the given index as a Triangle object."""
+
+        return Triangle(
+            self.vertices[self.triangles[3 * i]],
+            self.vertices[self.triangles[3 * i + 1]],
+            self.vertices[self.triangles[3 * i + 2]]
+        )
+
+    def get_edge(self, i):
+        """A method that returns the edge at the given index as an Edge object."""
+
+        return Edge(self.vertices[self.edges[2 * i]], self.vertices[self.edges[2 * i + 1]])
+
+    def to_triangles(self):
+        """A method that returns all triangles as a list of Triangle objects."""
+
+        return [self.get_triangle(i) for i in range(self.triangle_count())]
+
+    def to_edges(self):
+        """A method that returns all unique edges as a set of Edge objects."""
+
+        return {self.get_edge(i) for i in range(self.edge_count())}
+
+# Triangulators that can be selected by name, each one has a triangulate method
+# that returns the Delaunay triangulation of the given vertices as Triangle objects
+TRIANGULATORS = {
+    "bowyer_watson": BowyerWatson,
+    "sweep_hull": SweepHull
+}
@@ -0,0 +1,226 @@
+from tile_grid import TileGrid, as_tile_grid
+
+try:
+    import numpy as np # pylint: disable=import-error
+except ImportError:
+    np = None # pylint: disable=invalid-name
+
+# Wall types stored in the wall map, zero means that the tile is not a wall
+TOP_WALL = 1
+BOTTOM_WALL = 2
+LEFT_WALL = 3
+RIGHT_WALL = 4
+TOP_L_CORNER = 5
+TOP_R_CORNER = 6
+BOTTOM_L_CORNER = 7
+BOTTOM_R_CORNER = 8
+
+# Bits of the neighbor mask of a tile, a bit is set if the neighbor is a room tile
+# The three tiles above and the three tiles below are stored from left to right
+UP_L = 1
+UP = 2
+UP_R = 4
+DOWN_L = 8
+DOWN = 16
+DOWN_R = 32
+LEFT = 64
+RIGHT = 128
+
+# pylint: disable=too-many-return-statements,too-many-boolean-expressions
+def get_wall_type_from_mask(mask):
+    """A function that returns the wall type of a tile based on its neighbor mask."""
+
+    up = mask & UP
+    down = mask & DOWN
+    left = mask & LEFT
+    right = mask & RIGHT
+
+    up_l = mask & UP_L
+    up_r = mask & UP_R
+    down_l = mask & DOWN_L
+    down_r = mask & DOWN_R
+
+    if not up and down and not left and not right:
+        return TOP_WALL
+    if up and not down and not left and not right:
+        return BOTTOM_WALL
+    if not up and not down and not left and right:
+        return LEFT_WALL
+    if not up and not down and left and not right:
+        return RIGHT_WALL
+
+    if not up and not down and not left and not right:
+        if not up_l and not up_r and not down_l and down_r:
+            return TOP_L_CORNER
+        if not up_l and not up_r and down_l and not down_r:
+            return TOP_R_CORNER
+        if not up_l and up_r and not down_l and not down_r:
+            return BOTTOM_L_CORNER
+        if up_l and not up_r and not down_l and not down_r:
+            return BOTTOM_R_CORNER
+
+    return 0
+
+# Wall type of every possible neighbor mask
+WALL_TYPES = bytes(get_wall_type_from_mask(mask) for mask in range(256))
+
+# Translation table that turns room tiles into ones and all other tiles into zeros
+ROOM_TILES = bytes(1 if tile_type == 1 else 0 for tile_type in range(256))
+
+# Translation table that turns wall types into ones
+WALL_FLAGS = bytes([0]) + bytes([1]) * 255
+
+def get_wall_type_at(cells, width, index):
+    """A function that finds the position of a tile that is not on the border of a grid
+        based on the surrounding tiles and returns the corresponding wall type.
+
+    Args:
+        cells: Tile types of the grid in row-major order.
+        width: Grid width in tile units.
+        index: Index of the tile in the cells.
+    """
+
+    mask = 0
+    for bit, offset in ((UP_L, -width - 1), (UP, -width), (UP_R, -width + 1),
+                        (DOWN_L, width - 1), (DOWN, width), (DOWN_R, width + 1),
+                        (LEFT, -1), (RIGHT, 1)):
+        if cells[index + offset] == 1:
+            mask |= bit
+
+    return WALL_TYPES[mask]
+
+def get_wall_type(tiles, tile_x, tile_y):
+    """A function that finds the position of a tile based on the surrounding tiles
+        and returns the corresponding wall type.
+
+    Args:
+        tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+        tile_x: X coordinate of the tile.
+        tile_y: Y coordinate of the tile.
+    """
+
+    grid = as_tile_grid(tiles)
+
+    if 0 < tile_x < grid.width - 1 and 0 < tile_y < grid.height - 1:
+        return get_wall_type_at(grid.cells, grid.width, grid.index(tile_x, tile_y))
+
+    return 0
+
+def get_row_masks(room_row):
+    """A function that packs the room flags of each tile and its left and right neighbors
+        into three bits, so that the bits of a row can be shared by the rows above and below.
+
+    Args:
+        room_row: Room flags of one row, one for room tiles and zero for other tiles.
+    """
+
+    return bytes(
+        left | center << 1 | right << 2
+        for left, center, right in zip(room_row, room_row[1:], room_row[2:])
+    )
+
+def classify_wall_tiles(tiles):
+    """A function that finds the wall type of every tile in one pass over the rows.
+
+    The room flags of each row are packed once and kept for the rows above and below,
+        and the wall type of each tile is looked up from its neighbor mask.
+
+    Returns:
+        A TileGrid wall map with the wall type of each tile.
+    """
+
+    grid = as_tile_grid(tiles)
+    width = grid.width
+    cells = grid.cells
+    wall_map = TileGrid(width, grid.height)
+
+    if width < 3 or grid.height < 3:
+        return wall_map
+
+    above_masks = get_row_masks(cells[:width].translate(ROOM_TILES))
+    room_row = cells[width:2 * width].translate(ROOM_TILES)
+    row_masks = get_row_masks(room_row)
+
+    # Tiles on the border of the grid are never walls
+    for tile_y in range(1, grid.height - 1):
+        row_start = tile_y * width
+        below_row = cells[row_start + width:row_start + 2 * width].translate(ROOM_TILES)
+        below_masks = get_row_masks(below_row)
+
+        wall_map.cells[row_start + 1:row_start + width - 1] = bytes(
+            0 if cell else WALL_TYPES[above | below << 3 | left << 6 | right << 7]
+            for cell, above, below, left, right in zip(
+                cells[row_start + 1:row_start + width - 1],
+                above_masks, below_masks, room_row, room_row[2:]
+            )
+        )
+
+        above_masks, row_masks, room_row = row_masks, below_masks, below_row
+
+    return wall_map
+
+def classify_wall_tiles_numpy(tiles):
+    """A function that finds the wall type of every tile with NumPy array operations.
+
+    The neighbor masks of all tiles are built by combining shifted views of the room flags.
+
+    Returns:
+        A TileGrid wall map with the wall type of each tile.
+    """
+
+    grid = as_tile_grid(tiles)
+    wall_map = TileGrid(grid.width, grid.height)
+
+    if grid.width < 3 or grid.height < 3:
+        return wall_map
+
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+    rooms = (cells == 1).astype(np.uint8)
+
+    masks = (
+        rooms[:-2, :-2] * UP_L | rooms[:-2, 1:-1] * UP | rooms[:-2, 2:] * UP_R |
+        rooms[2:, :-2] * DOWN_L | rooms[2:, 1:-1] * DOWN | rooms[2:, 2:] * DOWN_R |
+        rooms[1:-1, :-2] * LEFT | rooms[1:-1, 2:] * RIGHT
+    )
+
+    wall_types = np.frombuffer(WALL_TYPES, dtype=np.uint8)[masks]
+    wall_types[cells[1:-1, 1:-1] != 0] = 0
+
+    result = np.frombuffer(wall_map.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+    result[1:-1, 1:-1] = wall_types
+
+    return wall_map
+
+def map_wall_tiles(tiles, use_numpy=False):
+    """A function that finds the wall tiles around the rooms and marks them as twos.
+
+    Args:
+        tiles: TileGrid object, or a list of lists indexed as tiles[tile_x][tile_y].
+        use_numpy: Whether to classify the tiles with NumPy, which falls back to
+            the pure Python classifier if NumPy is not installed.
+
+    Returns:
+        A TileGrid wall map with the wall type of each tile.
+    """
+
+    grid = as_tile_grid(tiles)
+
+    if use_numpy and np is not None:
+        wall_map = classify_wall_tiles_numpy(grid)
+    else:
+        wall_map = classify_wall_tiles(grid)
+
+    # Mark wall tiles as twos, searching the next wall with bytearray.find
+    width = grid.width
+    wall_flags = wall_map.cells.translate(WALL_FLAGS)
+    index = wall_flags.find(1)
+
+    while index != -1:
+        grid.cells[index] = 2
+
+        if grid is not tiles:
+            tiles[index % width][index // width] = 2
+
+        index = wall_flags.find(1, index + 1)
+
+    return wall_map